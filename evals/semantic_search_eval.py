@@ -308,7 +308,7 @@ def eval_index_creation(project_dir: str) -> EvalResult:
         )
 
     # Check for index files
-    expected_files = ["vectors.faiss", "units.json", "meta.json"]
+    expected_files = ["vectors.faiss", "units.jsonl", "meta.json"]
     missing = [f for f in expected_files if not (tldr_dir / f).exists()]
     if missing:
         return EvalResult(
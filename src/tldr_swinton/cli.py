@@ -845,6 +845,18 @@ Semantic Search:
         action="store_true",
         help="Force full rebuild (ignore existing index)",
     )
+    index_p.add_argument(
+        "--index-type",
+        choices=["auto", "flat", "ivfpq"],
+        default="auto",
+        help="FAISS index structure: auto (IVF+PQ at 10k+ units), flat, or ivfpq",
+    )
+    index_p.add_argument(
+        "--quantization",
+        choices=["none", "fp16", "sq8"],
+        default="fp16",
+        help="Vector storage for flat FAISS indexes: fp16 (default), sq8, or none (fp32)",
+    )
     index_p.add_argument(
         "--info",
         action="store_true",
@@ -1975,6 +1987,8 @@ Semantic Search:
                     rebuild=args.rebuild,
                     respect_ignore=respect_ignore,
                     respect_gitignore=respect_gitignore,
+                    index_type=args.index_type,
+                    quantization=args.quantization,
                 )
                 print(f"\nIndex complete: {stats.total_units} units from {stats.total_files} files")
                 if stats.new_units > 0:
@@ -0,0 +1,65 @@
+"""JSON encode/decode helpers that use orjson when installed, stdlib json otherwise.
+
+The stdlib fallback reproduces orjson's output (compact or 2-space-indented
+UTF-8, datetimes as RFC 3339), so encoded bytes don't depend on whether
+orjson happens to be installed.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime, time
+from typing import Any, Callable
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None
+
+
+def _stdlib_default(default: Callable[[Any], Any] | None) -> Callable[[Any], Any]:
+    """json.dumps default= that encodes what orjson encodes natively first."""
+
+    def encode(obj):
+        if isinstance(obj, (datetime, date, time)):
+            return obj.isoformat()
+        if default is None:
+            raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+        return default(obj)
+
+    return encode
+
+
+def dumps(
+    obj,
+    *,
+    indent: bool = False,
+    newline: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes.
+
+    Compact unless ``indent`` (2 spaces); ``newline`` appends "\\n" for a
+    JSONL record. ``default`` encodes otherwise unsupported objects, as in
+    json.dumps.
+    """
+    if _orjson is not None:
+        option = (_orjson.OPT_INDENT_2 if indent else 0) | (
+            _orjson.OPT_APPEND_NEWLINE if newline else 0
+        )
+        return _orjson.dumps(obj, default=default, option=option)
+    text = json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":"),
+        ensure_ascii=False,
+        default=_stdlib_default(default),
+    )
+    return (text + "\n" if newline else text).encode()
+
+
+def loads(data: bytes | str):
+    """Deserialize JSON from bytes or str."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
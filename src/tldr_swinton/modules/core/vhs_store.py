@@ -162,12 +162,17 @@ class Store:
         tmp_dir = self.root / "tmp"
         tmp_dir.mkdir(parents=True, exist_ok=True)
 
+        # Forced compression happens in the same pass as hashing; only the
+        # size-threshold case needs the raw bytes on disk before deciding.
+        compressor = zlib.compressobj(level=6) if compress else None
         raw_path = tmp_dir / f"upload-raw-{os.getpid()}-{os.urandom(6).hex()}"
         with raw_path.open("wb") as tmp:
             for chunk in iter(lambda: stream.read(1024 * 1024), b""):
                 hasher.update(chunk)
-                tmp.write(chunk)
+                tmp.write(compressor.compress(chunk) if compressor else chunk)
                 size += len(chunk)
+            if compressor:
+                tmp.write(compressor.flush())
 
         do_compress = compress or (
             compress_min_bytes is not None and size >= compress_min_bytes
@@ -175,7 +180,7 @@ class Store:
         compression = "zlib" if do_compress else ""
         temp_path = raw_path
 
-        if do_compress:
+        if do_compress and not compress:
             comp_path = tmp_dir / f"upload-{os.getpid()}-{os.urandom(6).hex()}"
             compressor = zlib.compressobj(level=6)
             with raw_path.open("rb") as src, comp_path.open("wb") as dst:
@@ -0,0 +1,103 @@
+"""Keep-alive JSON-over-HTTP client for talking to a local Ollama server."""
+
+from __future__ import annotations
+
+import http.client
+import threading
+from typing import Optional
+from urllib.parse import urlsplit
+
+from .. import _json
+
+# Errors meaning the server dropped an idle keep-alive connection; the
+# request never reached it, so it is safe to resend on a fresh socket.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+class HTTPStatusError(OSError):
+    """An HTTP error status from the server (status code in .status)."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class KeepAliveClient:
+    """Reuses one HTTP connection per thread instead of one per request.
+
+    Thread-safe: each worker thread lazily opens its own connection, so the
+    client can be shared by a ThreadPoolExecutor.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 30):
+        parts = urlsplit(base_url)
+        self._conn_cls = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self._host = parts.hostname or "localhost"
+        self._port = parts.port
+        self._prefix = parts.path.rstrip("/")
+        self._timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Connections with (possibly) open sockets, for close()
+        self._conns: set[http.client.HTTPConnection] = set()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._conn_cls(self._host, self._port, timeout=self._timeout)
+            self._local.conn = conn
+        if conn.sock is None:
+            # About to (re)open a socket: track it until the next close()
+            with self._lock:
+                self._conns.add(conn)
+        return conn
+
+    def request_json(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Send a request and return the decoded JSON response body.
+
+        Raises:
+            OSError: On connection failure, timeout, or an HTTP error status.
+        """
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        for attempt in range(2):
+            conn = self._connection()
+            reused = conn.sock is not None
+            conn.timeout = timeout or self._timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(conn.timeout)
+            try:
+                conn.request(method, self._prefix + path, body=body, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                raise
+            if response.status >= 400:
+                raise HTTPStatusError(
+                    response.status, f"HTTP {response.status} from {path}: {data[:200]!r}"
+                )
+            return _json.loads(data)
+
+    def close(self) -> None:
+        """Close all open sockets; the client reconnects on next use."""
+        with self._lock:
+            for conn in self._conns:
+                conn.close()
+            self._conns.clear()
@@ -23,7 +23,7 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeUnit:
     """A code unit (function/method/class) stored in the vector index.
 
@@ -40,6 +40,7 @@ class CodeUnit:
 
     # For incremental updates
     file_hash: str = ""  # Hash of file content when indexed
+    text_hash: str = ""  # Hash of the embedded text (see text_hash())
 
     def to_dict(self) -> dict:
         return asdict(self)
@@ -63,11 +64,44 @@ def make_unit_id(file: str, name: str, line: int) -> str:
     return hashlib.sha256(content.encode()).hexdigest()[:16]
 
 
+def text_hash(text: str) -> str:
+    """Hash of a unit's embedding text; equal hashes can share a vector."""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+_HASH_BLOCK_SIZE = 1 << 20
+
+# Recorded in index metadata (absent = the original SHA-256 scheme). Stored
+# file hashes from another scheme never match, so backends must not take a
+# scheme change for every file having changed.
+FILE_HASH_SCHEME = "blake2b"
+
+
 def get_file_hash(file_path: Path) -> str:
-    """Compute hash of file content for change detection."""
-    if not file_path.exists():
+    """Compute hash of file content for change detection.
+
+    Streams BLAKE2b over the file (hashlib.file_digest on 3.11+, else 1 MiB
+    blocks); only a change fingerprint, so truncated to 16 hex chars.
+    """
+    try:
+        with open(file_path, "rb") as f:
+            if hasattr(hashlib, "file_digest"):
+                digest = hashlib.file_digest(f, "blake2b")
+            else:
+                digest = hashlib.blake2b()
+                for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+                    digest.update(block)
+    except OSError:
+        return ""
+    return digest.hexdigest()[:16]
+
+
+def legacy_file_hash(file_path: Path) -> str:
+    """get_file_hash() under the original SHA-256 scheme, for index migration."""
+    try:
+        content = file_path.read_bytes()
+    except OSError:
         return ""
-    content = file_path.read_bytes()
     return hashlib.sha256(content).hexdigest()[:16]
 
 
@@ -166,7 +200,14 @@ def _read_index_backend(project_path: str) -> Optional[str]:
         return None
 
 
-def get_backend(project_path: str, backend: str = "auto") -> SearchBackend:
+def get_backend(
+    project_path: str,
+    backend: str = "auto",
+    *,
+    index_type: str = "auto",
+    nprobe: Optional[int] = None,
+    quantization: str = "fp16",
+) -> SearchBackend:
     """Get a search backend instance.
 
     Args:
@@ -176,6 +217,11 @@ def get_backend(project_path: str, backend: str = "auto") -> SearchBackend:
               colbert (if pylate installed), then faiss.
             - "colbert": ColBERTBackend or error.
             - "faiss": FAISSBackend or error.
+        index_type: FAISS index structure: "auto" | "flat" | "ivfpq"
+            (FAISS backend only).
+        nprobe: IVF lists probed per query (FAISS backend only).
+        quantization: Flat index storage: "none" (fp32) | "fp16" | "sq8"
+            (FAISS backend only).
 
     Returns:
         A SearchBackend instance.
@@ -217,7 +263,12 @@ def get_backend(project_path: str, backend: str = "auto") -> SearchBackend:
                 "Install with: pip install 'tldr-swinton[semantic-ollama]' "
                 "or 'tldr-swinton[semantic]'"
             )
-        from .faiss_backend import FAISSBackend
-        return FAISSBackend(project_path)
+        from .faiss_backend import DEFAULT_NPROBE, FAISSBackend
+        return FAISSBackend(
+            project_path,
+            index_type=index_type,
+            nprobe=nprobe or DEFAULT_NPROBE,
+            quantization=quantization,
+        )
 
     raise ValueError(f"Unknown backend: {backend!r}. Use 'auto', 'faiss', or 'colbert'.")
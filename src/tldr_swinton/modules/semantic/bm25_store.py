@@ -13,6 +13,9 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+_CAMEL_RE = re.compile(r"([a-z])([A-Z])")
+_TOKEN_RE = re.compile(r"[a-zA-Z0-9]+")
+
 
 def _tokenize(text: str) -> list[str]:
     """Simple code-aware tokenizer.
@@ -21,9 +24,9 @@ def _tokenize(text: str) -> list[str]:
     and lowercases everything.
     """
     # Split camelCase: insertBefore -> insert Before
-    text = re.sub(r"([a-z])([A-Z])", r"\1 \2", text)
+    text = _CAMEL_RE.sub(r"\1 \2", text)
     # Split on non-alphanumeric
-    tokens = re.findall(r"[a-zA-Z0-9]+", text.lower())
+    tokens = _TOKEN_RE.findall(text.lower())
     return tokens
 
 
@@ -25,6 +25,7 @@ from .backend import (
     CodeUnit,
     SearchResult,
     META_FILENAME,
+    FILE_HASH_SCHEME,
 )
 
 logger = logging.getLogger(__name__)
@@ -126,6 +127,12 @@ class ColBERTBackend:
                     self._unit_hashes = meta.get("hashes", {})
                     self._incremental_updates = meta.get("incremental_updates", 0)
                     existing_ids = set(self._units.keys())
+                    if meta.get("file_hash_scheme") != FILE_HASH_SCHEME:
+                        # Every stored hash would differ and PLAID can't
+                        # delete, so re-adding them all would duplicate
+                        # the corpus: rebuild once instead.
+                        logger.info("ColBERT file hash scheme changed, triggering full rebuild")
+                        needs_full_rebuild = True
                 except (json.JSONDecodeError, KeyError, TypeError) as e:
                     logger.warning("Failed to load ColBERT metadata: %s", e)
                     needs_full_rebuild = True
@@ -315,6 +322,7 @@ class ColBERTBackend:
             "incremental_updates": self._incremental_updates,
             "units": [u.to_dict() for u in self._units.values()],
             "hashes": self._unit_hashes,
+            "file_hash_scheme": FILE_HASH_SCHEME,
         }
 
         # Write top-level meta.json FIRST — it's the source of truth for
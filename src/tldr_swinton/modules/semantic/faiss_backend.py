@@ -13,22 +13,30 @@ Supports:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import math
 import os
+import sqlite3
 import threading
 import uuid
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Optional, Literal
+from typing import Iterable, Optional, Literal
 
+from .. import _json
+from ._http import HTTPStatusError, KeepAliveClient
 from .backend import (
     BackendInfo,
     BackendStats,
     CodeUnit,
     SearchResult,
     META_FILENAME,
+    FILE_HASH_SCHEME,
+    legacy_file_hash,
+    text_hash,
 )
 
 logger = logging.getLogger(__name__)
@@ -41,8 +49,40 @@ logger = logging.getLogger(__name__)
 OLLAMA_HOST = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
 OLLAMA_EMBED_MODEL = os.environ.get("OLLAMA_EMBED_MODEL", "nomic-embed-text-v2-moe")
 
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+# Concurrent embedding requests (match Ollama's OLLAMA_NUM_PARALLEL)
+OLLAMA_EMBED_CONCURRENCY = _env_int("OLLAMA_EMBED_CONCURRENCY", 8)
+# Texts per /api/embed request
+OLLAMA_EMBED_BATCH_SIZE = _env_int("OLLAMA_EMBED_BATCH_SIZE", 32)
+
 EmbedBackendType = Literal["ollama", "sentence-transformers", "auto"]
 
+IndexType = Literal["flat", "ivfpq", "auto"]
+
+# Storage precision for flat indexes (IVF+PQ indexes are already compressed)
+Quantization = Literal["none", "fp16", "sq8"]
+_SQ_SPECS = {"none": "Flat", "fp16": "SQfp16", "sq8": "SQ8"}
+
+# Corpus-size thresholds for index_type="auto"
+_IVF_MIN_UNITS = 10_000
+_OPQ_MIN_UNITS = 1_000_000
+# k-means wants ~39 training points per centroid; each PQ codebook has 256
+# centroids, so smaller corpora can't train (or train badly) an IVF+PQ index
+_TRAIN_POINTS_PER_CENTROID = 39
+_PQ_MIN_TRAIN = _TRAIN_POINTS_PER_CENTROID * 256
+DEFAULT_NPROBE = 16
+
+# On-disk format version. "2.0" indexes are IndexIDMap2-wrapped and keyed by
+# _unit_labels(); "1.0" indexes are positional (row i == units[i]).
+_INDEX_VERSION = "2.0"
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -73,6 +113,73 @@ def _require_faiss():
         ) from exc
 
 
+def _unit_labels(unit_ids: list[str]):
+    """Map unit IDs to stable non-negative int64 FAISS labels."""
+    np = _require_numpy()
+    return np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(uid.encode(), digest_size=8).digest(), "little") >> 1
+            for uid in unit_ids
+        ),
+        dtype=np.int64,
+        count=len(unit_ids),
+    )
+
+
+def _resolve_index_type(index_type: str, n_units: int) -> str:
+    """Resolve "auto" to a concrete index type for a corpus of n_units."""
+    if index_type == "auto":
+        return "ivfpq" if n_units >= _IVF_MIN_UNITS else "flat"
+    if index_type not in ("flat", "ivfpq"):
+        raise ValueError(f"Unknown FAISS index type: {index_type!r}")
+    if index_type == "ivfpq" and n_units < _PQ_MIN_TRAIN:
+        logger.warning(
+            "FAISS ivfpq needs at least %d units to train, have %d; using flat",
+            _PQ_MIN_TRAIN, n_units,
+        )
+        return "flat"
+    return index_type
+
+
+def _new_index(
+    dimension: int, n_units: int, index_type: str, quantization: str = "none",
+):
+    """Create an empty inner-product index that accepts add_with_ids().
+
+    "flat" is exhaustive search over IDMap2-wrapped codes stored as fp32
+    ("none"), fp16 (2x smaller) or 8-bit scalar-quantized ("sq8", 4x
+    smaller, must be trained). "ivfpq" is an inverted-file index with
+    product-quantized codes (~16x smaller), with an OPQ rotation added for
+    million-unit corpora; it must be trained.
+    """
+    faiss = _require_faiss()
+    if index_type == "flat":
+        if quantization not in _SQ_SPECS:
+            raise ValueError(f"Unknown FAISS quantization: {quantization!r}")
+        return faiss.index_factory(
+            dimension, f"IDMap2,{_SQ_SPECS[quantization]}", faiss.METRIC_INNER_PRODUCT
+        )
+
+    # Capped so the coarse quantizer also gets enough training points
+    nlist = max(1, min(int(4 * math.sqrt(n_units)), n_units // _TRAIN_POINTS_PER_CENTROID))
+    # PQ sub-quantizers must divide the dimension
+    m = next(m for m in (32, 16, 8, 4, 2, 1) if dimension % m == 0)
+    if n_units >= _OPQ_MIN_UNITS and dimension >= 128:
+        spec = f"OPQ32_128,IVF{nlist},PQ32"
+    else:
+        spec = f"IVF{nlist},PQ{m}x8"
+    return faiss.index_factory(dimension, spec, faiss.METRIC_INNER_PRODUCT)
+
+
+def _set_nprobe(index, nprobe: int) -> None:
+    """Set the number of probed IVF lists; no-op for non-IVF indexes."""
+    faiss = _require_faiss()
+    try:
+        faiss.extract_index_ivf(index).nprobe = nprobe
+    except RuntimeError:
+        pass
+
+
 def _l2_normalize(v):
     """L2 normalize a vector for cosine similarity via inner product."""
     np = _require_numpy()
@@ -95,19 +202,23 @@ class _OllamaEmbedder:
         self.model = model
         self.host = host.rstrip("/")
         self._available: Optional[bool] = None
+        # False once the server has 404'd /api/embed (Ollama < 0.3)
+        self._batch_api = True
+        # Keep-alive connections (one per thread) instead of a TCP handshake
+        # per request
+        self._client = KeepAliveClient(self.host)
+
+    def _post_json(self, path: str, payload: dict, timeout: float = 30):
+        return self._client.request_json("POST", path, _json.dumps(payload), timeout=timeout)
 
     def is_available(self) -> bool:
         if self._available is not None:
             return self._available
         try:
-            import urllib.request
-            url = f"{self.host}/api/tags"
-            req = urllib.request.Request(url, method="GET")
-            with urllib.request.urlopen(req, timeout=2) as response:
-                data = json.loads(response.read().decode())
-                models = [m["name"].split(":")[0] for m in data.get("models", [])]
-                self._available = self.model.split(":")[0] in models
-                return self._available
+            data = self._client.request_json("GET", "/api/tags", timeout=2)
+            models = [m["name"].split(":")[0] for m in data.get("models", [])]
+            self._available = self.model.split(":")[0] in models
+            return self._available
         except Exception as e:
             logger.debug("Ollama availability check failed: %s", e)
             self._available = False
@@ -115,27 +226,46 @@ class _OllamaEmbedder:
 
     def embed(self, text: str):
         np = _require_numpy()
-        import urllib.request
-        url = f"{self.host}/api/embeddings"
-        payload = json.dumps({"model": self.model, "prompt": text}).encode()
-        req = urllib.request.Request(
-            url, data=payload,
-            headers={"Content-Type": "application/json"}, method="POST",
-        )
-        with urllib.request.urlopen(req, timeout=30) as response:
-            data = json.loads(response.read().decode())
-            return np.array(data["embedding"], dtype=np.float32)
-
-    def embed_batch(self, texts: list[str], max_workers: int = 8):
-        if len(texts) <= 1:
-            return [self.embed(t) for t in texts]
-        workers = min(max_workers, len(texts))
-        results = [None] * len(texts)
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            futs = {executor.submit(self.embed, t): i for i, t in enumerate(texts)}
-            for future in as_completed(futs):
-                results[futs[future]] = future.result()
-        return results
+        data = self._post_json("/api/embeddings", {"model": self.model, "prompt": text})
+        return np.array(data["embedding"], dtype=np.float32)
+
+    def _embed_chunk(self, texts: list[str]):
+        """Embed one chunk with a single /api/embed call (retried once)."""
+        np = _require_numpy()
+        if self._batch_api:
+            for attempt in range(2):
+                try:
+                    data = self._post_json(
+                        "/api/embed", {"model": self.model, "input": texts}, timeout=120,
+                    )
+                    return [np.asarray(v, dtype=np.float32) for v in data["embeddings"]]
+                except HTTPStatusError as e:
+                    if e.status != 404:
+                        if attempt:
+                            raise
+                        continue
+                    logger.debug("Ollama /api/embed unavailable, using /api/embeddings")
+                    self._batch_api = False
+                    break
+                except OSError:
+                    if attempt:
+                        raise
+        return [self.embed(t) for t in texts]
+
+    def embed_batch(self, texts: list[str], max_workers: Optional[int] = None):
+        # Send OLLAMA_EMBED_BATCH_SIZE texts per request and keep up to
+        # OLLAMA_EMBED_CONCURRENCY requests in flight; map() preserves order.
+        size = OLLAMA_EMBED_BATCH_SIZE
+        chunks = [texts[i:i + size] for i in range(0, len(texts), size)]
+        workers = min(max_workers or OLLAMA_EMBED_CONCURRENCY, len(chunks))
+        if workers <= 1:
+            results = [self._embed_chunk(c) for c in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self._embed_chunk, chunks))
+            # The pool's threads are gone; release their sockets
+            self._client.close()
+        return [vec for chunk in results for vec in chunk]
 
 
 class _SentenceTransformerEmbedder:
@@ -171,17 +301,35 @@ class _SentenceTransformerEmbedder:
         return [np.array(e, dtype=np.float32) for e in embeddings]
 
 
+# Positively selected embedders, keyed by (backend, model). Reusing them lets
+# repeated searches skip the availability probe and keep models loaded.
+_EMBEDDER_CACHE: dict[tuple[str, Optional[str]], object] = {}
+
+
 def _get_embedder(
     backend: EmbedBackendType = "auto",
     model: Optional[str] = None,
 ):
-    """Get an embedder instance."""
+    """Get an embedder instance.
+
+    An "auto" fallback to sentence-transformers is only cached under its own
+    backend key: Ollama is probed again on the next "auto" call, so a
+    long-running process goes back to the Ollama model (the one an Ollama
+    index was built with) once Ollama is reachable again.
+    """
+    cached = _EMBEDDER_CACHE.get((backend, model))
+    if cached is not None:
+        return cached
     if backend == "auto":
         ollama = _OllamaEmbedder(model=model or OLLAMA_EMBED_MODEL)
         if ollama.is_available():
+            _EMBEDDER_CACHE[("auto", model)] = ollama
             return ollama
-        st = _SentenceTransformerEmbedder(model=model or "BAAI/bge-large-en-v1.5")
+        st = _EMBEDDER_CACHE.get(("sentence-transformers", model))
+        if st is None:
+            st = _SentenceTransformerEmbedder(model=model or "BAAI/bge-large-en-v1.5")
         if st.is_available():
+            _EMBEDDER_CACHE[("sentence-transformers", model)] = st
             return st
         raise RuntimeError(
             "No embedding backend available. Install sentence-transformers "
@@ -195,6 +343,7 @@ def _get_embedder(
                 f"Ollama not available at {OLLAMA_HOST} or model "
                 f"'{model or OLLAMA_EMBED_MODEL}' not found."
             )
+        _EMBEDDER_CACHE[(backend, model)] = embedder
         return embedder
     elif backend == "sentence-transformers":
         embedder = _SentenceTransformerEmbedder(model=model or "BAAI/bge-large-en-v1.5")
@@ -203,11 +352,71 @@ def _get_embedder(
                 "sentence-transformers not installed. "
                 "Run: pip install 'tldr-swinton[semantic]'"
             )
+        _EMBEDDER_CACHE[(backend, model)] = embedder
         return embedder
     else:
         raise ValueError(f"Unknown embedding backend: {backend}")
 
 
+def _embedder_identity(embedder) -> tuple[str, str]:
+    """Return (embed_backend, model) for an embedder instance."""
+    if isinstance(embedder, _OllamaEmbedder):
+        return "ollama", embedder.model
+    return "sentence-transformers", embedder.model_name
+
+
+# ---------------------------------------------------------------------------
+# Persistent embedding cache
+# ---------------------------------------------------------------------------
+
+
+class _EmbedCache:
+    """SQLite cache of normalized embedding vectors keyed by (model, text).
+
+    Lets re-indexing skip the embedder for any text it has already seen,
+    e.g. units in an edited file whose own embed text did not change.
+    """
+
+    _BATCH = 500  # stay well below SQLite's bound-parameter limit
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS vectors (key BLOB PRIMARY KEY, vec BLOB NOT NULL)"
+        )
+
+    @staticmethod
+    def key(model: str, text: str) -> bytes:
+        return hashlib.blake2b(f"{model}\0{text}".encode(), digest_size=16).digest()
+
+    def get_many(self, keys: list[bytes]) -> dict:
+        np = _require_numpy()
+        found = {}
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), self._BATCH):
+            chunk = unique[start:start + self._BATCH]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT key, vec FROM vectors WHERE key IN ({placeholders})", chunk
+            )
+            for key, blob in rows:
+                found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def put_many(self, items) -> None:
+        np = _require_numpy()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO vectors (key, vec) VALUES (?, ?)",
+                ((k, np.asarray(v, dtype=np.float32).tobytes()) for k, v in items),
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+
 # ---------------------------------------------------------------------------
 # Internal vector-store metadata
 # ---------------------------------------------------------------------------
@@ -223,6 +432,9 @@ class _VectorStoreMetadata:
     dimension: int = 0
     count: int = 0
     project_root: str = ""
+    index_type: str = "flat"
+    quantization: str = "none"
+    file_hash_scheme: str = ""
 
     def to_dict(self) -> dict:
         return asdict(self)
@@ -243,8 +455,9 @@ class FAISSBackend:
     """FAISS single-vector search backend.
 
     Self-contained: embeds text via Ollama or sentence-transformers,
-    stores in a FAISS IndexFlatIP index, supports incremental updates
-    and hybrid BM25 fusion.
+    stores in an id-keyed FAISS index (exact IndexFlatIP, or IVF+PQ for
+    large corpora) so incremental updates only remove/add the changed
+    vectors, and supports hybrid BM25 fusion.
     """
 
     INDEX_DIR = ".tldrs/index"
@@ -254,17 +467,24 @@ class FAISSBackend:
         project_path: str,
         embed_backend: EmbedBackendType = "auto",
         embed_model: Optional[str] = None,
+        index_type: IndexType = "auto",
+        nprobe: int = DEFAULT_NPROBE,
+        quantization: Quantization = "fp16",
     ):
         self.project = Path(project_path).resolve()
         self.index_dir = self.project / self.INDEX_DIR
         self._embed_backend = embed_backend
         self._embed_model = embed_model
+        self._index_type = index_type
+        self._quantization = quantization
+        self.nprobe = nprobe
 
         # In-memory state (protected by _instance_lock for concurrent access)
         self._instance_lock = threading.RLock()
         self._faiss_index = None
         self._units: list[CodeUnit] = []
         self._id_to_idx: dict[str, int] = {}
+        self._label_to_idx: dict[int, int] = {}
         self._metadata = _VectorStoreMetadata(project_root=str(self.project))
 
     # -- File paths --
@@ -275,12 +495,20 @@ class FAISSBackend:
 
     @property
     def _units_path(self) -> Path:
+        return self.index_dir / "units.jsonl"
+
+    @property
+    def _legacy_units_path(self) -> Path:
         return self.index_dir / "units.json"
 
     @property
     def _meta_path(self) -> Path:
         return self.index_dir / META_FILENAME
 
+    @property
+    def _embed_cache_path(self) -> Path:
+        return self.project / ".tldrs" / "embed_cache.db"
+
     @property
     def _lock_path(self) -> Path:
         return self.index_dir / ".build.lock"
@@ -314,39 +542,70 @@ class FAISSBackend:
 
             # Load existing index for incremental update
             existing_units: dict[str, CodeUnit] = {}
-            existing_vectors: dict[str, any] = {}
-
-            if not rebuild and self._index_path.exists():
-                if self.load():
-                    old_vectors = self._reconstruct_all_vectors()
-                    for i, unit in enumerate(self._units):
-                        existing_units[unit.id] = unit
-                        if i < len(old_vectors):
-                            existing_vectors[unit.id] = old_vectors[i]
+            base_index = None
+
+            index_type = _resolve_index_type(self._index_type, len(units))
+            quantization = self._quantization if index_type == "flat" else "none"
+
+            if not rebuild and self._index_path.exists() and self.load():
+                old_type = self._metadata.index_type
+                old_quant = self._metadata.quantization
+                lossy_source = old_quant == "sq8" and quantization != "sq8"
+                if old_type != index_type or lossy_source:
+                    # Switching index structure (or leaving lossy sq8 codes):
+                    # re-embed everything (the embedding cache keeps this
+                    # cheap) into a fresh index.
+                    logger.info(
+                        "FAISS index changing %s/%s -> %s/%s, rebuilding",
+                        old_type, old_quant, index_type, quantization,
+                    )
+                else:
+                    existing_units = {u.id: u for u in self._units}
+                    if self._metadata.version == _INDEX_VERSION and old_quant == quantization:
+                        # Mutate a private copy so a concurrent search()
+                        # keeps using a consistent snapshot.
+                        base_index = faiss.clone_index(self._faiss_index)
+                    # Otherwise (legacy positional index, or a flat storage
+                    # change) unchanged vectors are reconstructed into a
+                    # fresh index below.
+
+            # Stored file hashes from another scheme never match. Units
+            # indexed under the original SHA-256 scheme are checked against
+            # it instead (each file read once); others rely on text hashes.
+            scheme = self._metadata.file_hash_scheme
+            same_file_hashes = scheme == FILE_HASH_SCHEME
+            legacy_hashes: dict[str, str] = {}
+
+            def file_unchanged(existing: CodeUnit, unit: CodeUnit) -> bool:
+                if same_file_hashes:
+                    return existing.file_hash == unit.file_hash
+                if scheme:
+                    return False
+                legacy = legacy_hashes.get(unit.file)
+                if legacy is None:
+                    legacy = legacy_hashes[unit.file] = legacy_file_hash(self.project / unit.file)
+                return existing.file_hash == legacy
 
             # Partition units
             units_to_embed = []
             texts_to_embed = []
             all_units = []
-            all_vectors = []
-            embed_indices = []
+            reuse_ids = []
 
             for unit, text in zip(units, texts):
                 existing = existing_units.get(unit.id)
-                existing_vec = existing_vectors.get(unit.id)
-
-                if (
-                    existing
-                    and existing.file_hash == unit.file_hash
-                    and existing_vec is not None
+                unit.text_hash = text_hash(text)
+                all_units.append(unit)
+
+                # An edit elsewhere in the file changes file_hash but not this
+                # unit's embedding text, so its vector is still valid.
+                if existing and (
+                    existing.text_hash == unit.text_hash
+                    or file_unchanged(existing, unit)
                 ):
-                    all_units.append(unit)
-                    all_vectors.append(existing_vec)
+                    reuse_ids.append(unit.id)
                     stats.unchanged_units += 1
                 else:
-                    all_units.append(unit)
-                    all_vectors.append(None)  # placeholder
-                    embed_indices.append(len(all_vectors) - 1)
                     units_to_embed.append(unit)
                     texts_to_embed.append(text)
                     if existing:
@@ -356,44 +615,75 @@ class FAISSBackend:
 
             stats.total_units = len(all_units)
 
-            if not units_to_embed:
-                # Nothing changed
-                return stats
-
-            # Embed new/changed texts
-            embedder = _get_embedder(self._embed_backend, self._embed_model)
-            if isinstance(embedder, _OllamaEmbedder):
-                raw_vecs = embedder.embed_batch(texts_to_embed)
-                stats.embed_model = embedder.model
-                stats.backend_name = "faiss"
-            else:
-                raw_vecs = embedder.embed_batch(texts_to_embed)
-                stats.embed_model = embedder.model_name
-                stats.backend_name = "faiss"
+            # Vectors of changed or deleted units must leave the index
+            reused = set(reuse_ids)
+            stale_ids = [uid for uid in existing_units if uid not in reused]
 
-            # L2 normalize and fill in placeholders
-            for i, vec in zip(embed_indices, raw_vecs):
-                all_vectors[i] = _l2_normalize(vec)
+            if same_file_hashes and not units_to_embed and not stale_ids and (
+                base_index is not None or not existing_units
+            ):
+                # Nothing changed (a scheme change still rewrites the metadata)
+                return stats
 
-            # Build FAISS index
-            matrix = np.vstack(all_vectors).astype(np.float32)
-            dimension = matrix.shape[1]
-            new_index = faiss.IndexFlatIP(dimension)
-            new_index.add(matrix)
+            if base_index is not None and stale_ids:
+                base_index.remove_ids(_unit_labels(stale_ids))
+
+            actual_backend = self._metadata.embed_backend
+            actual_model = self._metadata.embed_model
+            new_matrix = None
+
+            if units_to_embed:
+                # Embed new/changed texts
+                embedder = _get_embedder(self._embed_backend, self._embed_model)
+                actual_backend, actual_model = _embedder_identity(embedder)
+                new_matrix = self._embed_texts(embedder, actual_model, texts_to_embed)
+
+            if base_index is None:
+                # Fresh index. When migrating a legacy or differently
+                # stored flat index, unchanged vectors are carried over by
+                # reconstruction.
+                ids = []
+                matrix = new_matrix
+                if reuse_ids:
+                    reused = self._reconstruct_vectors(reuse_ids)
+                    matrix = (
+                        reused if new_matrix is None
+                        else np.concatenate((reused, new_matrix))
+                    )
+                    ids.extend(reuse_ids)
+                if new_matrix is not None:
+                    ids.extend(u.id for u in units_to_embed)
+                base_index = _new_index(
+                    matrix.shape[1], len(ids), index_type, quantization
+                )
+                if not base_index.is_trained:
+                    base_index.train(matrix)
+                base_index.add_with_ids(matrix, _unit_labels(ids))
+            elif new_matrix is not None:
+                if base_index.d != new_matrix.shape[1]:
+                    raise RuntimeError(
+                        f"Embedding dimension changed ({base_index.d} -> {new_matrix.shape[1]}). "
+                        "Rebuild the index with --rebuild."
+                    )
+                base_index.add_with_ids(
+                    new_matrix, _unit_labels([u.id for u in units_to_embed])
+                )
+            _set_nprobe(base_index, self.nprobe)
 
             # Atomically swap in-memory state so concurrent search() sees
             # a consistent snapshot (index + units + id_to_idx together).
-            actual_backend = "ollama" if isinstance(embedder, _OllamaEmbedder) else "sentence-transformers"
-            actual_model = embedder.model if isinstance(embedder, _OllamaEmbedder) else embedder.model_name
             with self._instance_lock:
-                self._faiss_index = new_index
-                self._units = all_units
-                self._id_to_idx = {u.id: i for i, u in enumerate(self._units)}
+                self._faiss_index = base_index
+                self._set_units(all_units, labelled=True)
                 self._metadata = _VectorStoreMetadata(
+                    version=_INDEX_VERSION,
                     backend="faiss",
+                    index_type=index_type,
+                    quantization=quantization,
+                    file_hash_scheme=FILE_HASH_SCHEME,
                     embed_model=actual_model,
                     embed_backend=actual_backend,
-                    dimension=dimension,
+                    dimension=base_index.d,
                     count=len(all_units),
                     project_root=str(self.project),
                 )
@@ -413,11 +703,19 @@ class FAISSBackend:
         with self._instance_lock:
             faiss_index = self._faiss_index
             units = self._units
+            label_to_idx = self._label_to_idx
             metadata = self._metadata
 
-        if faiss_index is None or not units:
+        if not units:
             return []
+        if faiss_index is None:
+            # Units were loaded via load_meta(); map the vectors in now
+            if not self.load_vectors(mmap=True):
+                return []
+            with self._instance_lock:
+                faiss_index = self._faiss_index
 
+        faiss = _require_faiss()
         np = _require_numpy()
 
         # Embed query
@@ -425,16 +723,19 @@ class FAISSBackend:
             self._embed_backend if self._embed_backend != "auto" else metadata.embed_backend or "auto",
             self._embed_model or metadata.embed_model or None,
         )
-        query_vec = _l2_normalize(embedder.embed(query))
-        query_arr = query_vec.reshape(1, -1).astype(np.float32)
+        query_arr = np.ascontiguousarray(
+            embedder.embed(query), dtype=np.float32
+        ).reshape(1, -1)
+        faiss.normalize_L2(query_arr)
 
         # FAISS search (uses snapshotted index)
         actual_k = min(k, len(units))
         scores, indices = faiss_index.search(query_arr, actual_k)
 
         semantic_results = []
-        for rank, (score, idx) in enumerate(zip(scores[0], indices[0])):
-            if idx < 0 or idx >= len(units):
+        for rank, (score, label) in enumerate(zip(scores[0], indices[0])):
+            idx = label_to_idx.get(int(label))
+            if idx is None:
                 continue
             semantic_results.append(SearchResult(
                 unit=units[idx], score=float(score), rank=rank,
@@ -457,7 +758,18 @@ class FAISSBackend:
 
     def load(self) -> bool:
         """Load existing FAISS index from disk."""
-        if not self._index_path.exists() or not self._units_path.exists():
+        return self.load_meta() and self.load_vectors()
+
+    def load_meta(self) -> bool:
+        """Load units and metadata only, leaving vectors.faiss unread.
+
+        Enough for exact-name lookups; search() loads the vectors on first
+        use.
+        """
+        units_path = self._units_path
+        if not units_path.exists():
+            units_path = self._legacy_units_path
+        if not self._index_path.exists() or not units_path.exists():
             # Check for partial build
             if self._sentinel_path.exists():
                 logger.warning("Partial FAISS build detected, needs rebuild")
@@ -465,33 +777,64 @@ class FAISSBackend:
             return False
 
         try:
-            faiss = _require_faiss()
-            self._faiss_index = faiss.read_index(str(self._index_path))
-            units_data = json.loads(self._units_path.read_text())
-            self._units = [CodeUnit.from_dict(u) for u in units_data]
-            self._id_to_idx = {u.id: i for i, u in enumerate(self._units)}
+            if units_path == self._units_path:
+                # NDJSON: one unit per line, parsed as the file streams in
+                with open(units_path, "rb") as f:
+                    units_data = [_json.loads(line) for line in f if line.strip()]
+            else:
+                units_data = json.loads(units_path.read_text())
 
+            metadata = self._metadata
             if self._meta_path.exists():
-                self._metadata = _VectorStoreMetadata.from_dict(
+                metadata = _VectorStoreMetadata.from_dict(
                     json.loads(self._meta_path.read_text())
                 )
+            units = [CodeUnit.from_dict(u) for u in units_data]
+            with self._instance_lock:
+                # Any previously loaded vectors belong to the old units
+                self._faiss_index = None
+                self._metadata = metadata
+                self._set_units(units, labelled=metadata.version == _INDEX_VERSION)
             return True
-        except (json.JSONDecodeError, KeyError, TypeError, OSError) as e:
+        except (ValueError, KeyError, TypeError, OSError) as e:
             logger.warning("Failed to load FAISS index from %s: %s", self.index_dir, e)
             return False
 
+    def load_vectors(self, mmap: bool = False) -> bool:
+        """Load vectors.faiss; with mmap=True the OS pages it in on demand."""
+        faiss = _require_faiss()
+        try:
+            flags = faiss.IO_FLAG_MMAP if mmap else 0
+            index = faiss.read_index(str(self._index_path), flags)
+        except RuntimeError as e:
+            logger.warning("Failed to load FAISS index from %s: %s", self.index_dir, e)
+            return False
+        _set_nprobe(index, self.nprobe)
+        with self._instance_lock:
+            self._faiss_index = index
+        return True
+
     def save(self) -> None:
         """Persist FAISS index, units, and metadata to disk."""
         faiss = _require_faiss()
         self.index_dir.mkdir(parents=True, exist_ok=True)
 
-        # Save FAISS index
+        # Save FAISS index (temp file + rename so a crash never leaves a
+        # truncated vectors.faiss behind)
         if self._faiss_index is not None:
-            faiss.write_index(self._faiss_index, str(self._index_path))
-
-        # Save units
-        units_data = [u.to_dict() for u in self._units]
-        self._units_path.write_text(json.dumps(units_data, indent=2))
+            tmp = self._index_path.with_suffix(f".faiss.tmp.{uuid.uuid4().hex[:8]}")
+            try:
+                faiss.write_index(self._faiss_index, str(tmp))
+                tmp.replace(self._index_path)
+            finally:
+                tmp.unlink(missing_ok=True)
+
+        # Save units (NDJSON, one unit per line)
+        self._write_atomic(
+            self._units_path,
+            (_json.dumps(u.to_dict()) + b"\n" for u in self._units),
+        )
+        self._legacy_units_path.unlink(missing_ok=True)
 
         # Atomic meta.json write
         self._metadata.count = len(self._units)
@@ -506,6 +849,8 @@ class FAISSBackend:
             index_path=str(self.index_dir),
             extra={
                 "embed_backend": self._metadata.embed_backend,
+                "index_type": self._metadata.index_type,
+                "quantization": self._metadata.quantization,
             },
         )
 
@@ -525,17 +870,77 @@ class FAISSBackend:
 
     # -- Internal methods --
 
-    def _reconstruct_all_vectors(self):
+    def _set_units(self, units: list[CodeUnit], *, labelled: bool) -> None:
+        """Install units and rebuild the id/label lookup tables.
+
+        Labelled (current-format) indexes key vectors by ``_unit_labels``;
+        legacy indexes are positional, so labels equal row numbers.
+        """
+        self._units = units
+        self._id_to_idx = {u.id: i for i, u in enumerate(units)}
+        if labelled:
+            labels = _unit_labels([u.id for u in units]).tolist()
+            self._label_to_idx = {label: i for i, label in enumerate(labels)}
+        else:
+            self._label_to_idx = {i: i for i in range(len(units))}
+
+    def _embed_texts(self, embedder, model: str, texts: list[str]):
+        """Embed texts into an L2-normalized (N, D) matrix.
+
+        Vectors are looked up in the persistent embedding cache first, and
+        duplicate texts (boilerplate __init__/__repr__, trivial stubs) are
+        sent once, so only distinct texts never seen with this model reach
+        the embedder.
+        """
         np = _require_numpy()
-        if self._faiss_index is None or not self._units:
+        keys = [_EmbedCache.key(model, t) for t in texts]
+        cache = _EmbedCache(self._embed_cache_path)
+        try:
+            cached = cache.get_many(keys)
+            pending: dict[bytes, str] = {}
+            for key, text in zip(keys, texts):
+                if key not in cached and key not in pending:
+                    pending[key] = text
+            fresh: dict[bytes, object] = {}
+            if pending:
+                raw_vecs = embedder.embed_batch(list(pending.values()))
+                # Normalize all new rows in one vectorized pass
+                fresh_matrix = np.ascontiguousarray(raw_vecs, dtype=np.float32)
+                _require_faiss().normalize_L2(fresh_matrix)
+                fresh = dict(zip(pending, fresh_matrix))
+                cache.put_many(fresh.items())
+        finally:
+            cache.close()
+
+        if pending:
+            logger.debug(
+                "Embedding %d distinct texts for %d units (%d cached)",
+                len(pending), len(texts), len(cached),
+            )
+        # Write rows straight into one contiguous matrix (no list + vstack copy)
+        first = cached.get(keys[0])
+        if first is None:
+            first = fresh[keys[0]]
+        matrix = np.empty((len(keys), first.shape[0]), dtype=np.float32)
+        for i, key in enumerate(keys):
+            vec = cached.get(key)
+            matrix[i] = fresh[key] if vec is None else vec
+        return matrix
+
+    def _reconstruct_vectors(self, unit_ids: list[str]):
+        """Reconstruct the stored vectors of the given units only."""
+        np = _require_numpy()
+        if self._faiss_index is None or not unit_ids:
             return np.zeros((0, 0), dtype=np.float32)
+        if self._metadata.version == _INDEX_VERSION:
+            ids = _unit_labels(unit_ids)
+        else:
+            ids = np.asarray([self._id_to_idx[uid] for uid in unit_ids], dtype=np.int64)
         try:
-            return self._faiss_index.reconstruct_n(0, len(self._units))
-        except RuntimeError as e:
+            return self._faiss_index.reconstruct_batch(ids)
+        except (AttributeError, RuntimeError) as e:
             logger.warning("Batch vector reconstruction failed, falling back to per-vector: %s", e)
-            vectors = []
-            for i in range(len(self._units)):
-                vectors.append(self._faiss_index.reconstruct(i))
+            vectors = [self._faiss_index.reconstruct(int(i)) for i in ids]
             return np.vstack(vectors).astype(np.float32)
 
     def _rrf_fuse(
@@ -570,9 +975,18 @@ class FAISSBackend:
 
     def _write_meta_atomic(self, data: dict) -> None:
         """Write meta.json atomically via temp file + rename."""
-        tmp = self._meta_path.with_suffix(f".tmp.{uuid.uuid4().hex[:8]}")
-        tmp.write_text(json.dumps(data, indent=2))
-        tmp.replace(self._meta_path)
+        self._write_atomic(self._meta_path, [json.dumps(data, indent=2).encode()])
+
+    @staticmethod
+    def _write_atomic(path: Path, chunks: Iterable[bytes]) -> None:
+        """Write byte chunks to path atomically via temp file + rename."""
+        tmp = path.with_suffix(f".tmp.{uuid.uuid4().hex[:8]}")
+        try:
+            with open(tmp, "wb") as f:
+                f.writelines(chunks)
+            tmp.replace(path)
+        finally:
+            tmp.unlink(missing_ok=True)
 
     def _acquire_build_lock(self):
         """Acquire non-blocking exclusive lock for build serialization."""
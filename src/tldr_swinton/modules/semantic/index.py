@@ -14,14 +14,22 @@ import logging
 import os
 import re
 import sys
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 from dataclasses import dataclass
 
+from .. import _json
 from .backend import (
     CodeUnit,
     SearchResult,
     BackendInfo,
+    META_FILENAME,
     get_backend,
     get_file_hash,
     make_unit_id,
@@ -35,9 +43,23 @@ logger = logging.getLogger(__name__)
 # Ollama configuration for summaries
 OLLAMA_HOST = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
 OLLAMA_SUMMARY_MODEL = os.environ.get("OLLAMA_SUMMARY_MODEL", "llama3.2:3b")
-
-
-@dataclass
+# Default concurrent /api/generate requests (match Ollama's OLLAMA_NUM_PARALLEL)
+_SUMMARY_CONCURRENCY = 8
+# Keep the summary model resident between requests, and size its context
+# for our prompts (signature + <=20 lines + ~50 output tokens) instead of
+# the model default, which shrinks the KV cache allocated per slot.
+_SUMMARY_KEEP_ALIVE = "10m"
+_SUMMARY_OPTIONS = {"num_predict": 50, "temperature": 0.3, "num_ctx": 1024}
+# Source files whose lines are kept in memory during a summary pass
+_SUMMARY_FILE_CACHE_SIZE = 64
+# Recent search_index results kept per loaded index
+_SEARCH_RESULT_CACHE_SIZE = 256
+# One-line docstrings within this length already serve as summaries
+_DOC_SUMMARY_MIN_LEN = 20
+_DOC_SUMMARY_MAX_LEN = 120
+
+
+@dataclass(slots=True)
 class IndexStats:
     """Statistics from an indexing operation."""
     total_files: int = 0
@@ -54,101 +76,309 @@ class IndexStats:
 # ---------------------------------------------------------------------------
 
 
-def _extract_code_units(
-    project_path: str,
+LANG_EXTENSIONS = {
+    "python": frozenset({".py"}),
+    "typescript": frozenset({".ts", ".tsx"}),
+    "javascript": frozenset({".js", ".jsx"}),
+    "rust": frozenset({".rs"}),
+    "go": frozenset({".go"}),
+}
+_ALL_EXTS = frozenset().union(*LANG_EXTENSIONS.values())
+
+# Below this many files the process-pool startup cost outweighs the win
+_PARALLEL_MIN_FILES = 32
+_MAX_EXTRACT_CHUNK = 16
+
+# A file can only yield code units if it contains one of these keywords;
+# files without any (empty __init__.py, data/constant modules) skip parsing.
+_JS_DEFINITION_RE = re.compile(rb"\b(?:function|class)\b|=>")
+_DEFINITION_RE = {
+    ".py": re.compile(rb"\b(?:def|class)\b"),
+    ".ts": _JS_DEFINITION_RE,
+    ".tsx": _JS_DEFINITION_RE,
+    ".js": _JS_DEFINITION_RE,
+    ".jsx": _JS_DEFINITION_RE,
+    ".rs": re.compile(rb"\b(?:fn|struct|enum|trait|impl)\b"),
+    ".go": re.compile(rb"\b(?:func|type)\b"),
+}
+
+
+def _may_define_units(full_path: Path) -> bool:
+    """Cheap pre-parse check: False if the file cannot contain any unit."""
+    try:
+        if full_path.stat().st_size == 0:
+            return False
+        pattern = _DEFINITION_RE.get(full_path.suffix)
+        if pattern is None:
+            return True
+        return pattern.search(full_path.read_bytes()) is not None
+    except OSError:
+        return False
+
+
+class _HashCache:
+    """Sidecar cache of file content hashes keyed by (mtime_ns, size).
+
+    Persisted at .tldrs/hash_cache.json so re-indexing a mostly unchanged
+    project only re-reads the files that actually changed. Files the
+    keyword prefilter rejected are recorded as NO_UNITS and skipped
+    outright while unchanged.
+    """
+
+    VERSION = 2  # 2: BLAKE2b file hashes
+    NO_UNITS = ""
+    # Files modified this recently may change again within the same mtime
+    # tick, so their hashes are not cached.
+    _RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries: dict[str, dict] = {}
+        self._seen: dict[str, dict] = {}
+        try:
+            data = json.loads(path.read_text())
+            if data.get("version") == self.VERSION:
+                self._entries = data.get("files", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def lookup(self, rel_path: str, st: os.stat_result) -> Optional[str]:
+        """Return the cached hash if the file's mtime and size are unchanged."""
+        entry = self._entries.get(rel_path)
+        if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            self._seen[rel_path] = entry
+            return entry["sha"]
+        return None
+
+    def record(self, rel_path: str, st: os.stat_result, sha: str) -> None:
+        if time.time_ns() - st.st_mtime_ns < self._RACY_WINDOW_NS:
+            return
+        self._seen[rel_path] = {
+            "mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha": sha,
+        }
+
+    def save(self) -> None:
+        """Write back the entries seen this scan (dropping deleted files)."""
+        if self._seen == self._entries:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"version": self.VERSION, "files": self._seen}))
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.debug("Failed to write hash cache %s: %s", self.path, e)
+
+
+def _extract_file_units(
+    file_path: str, project_path: str, file_hash: Optional[str] = None,
+) -> Optional[list[CodeUnit]]:
+    """Extract code units from a single file.
+
+    Module-level (not a closure) so it can be shipped to worker processes.
+    file_hash, when known (e.g. from _HashCache), skips re-hashing the file.
+    Returns None if the file cannot define any unit (see _may_define_units).
+    """
+    from tldr_swinton.modules.core.api import extract_file
+
+    full_path = Path(file_path)
+    if not _may_define_units(full_path):
+        return None
+    try:
+        info = extract_file(file_path)
+    except Exception as e:
+        logger.debug("Failed to extract file %s: %s", full_path, e)
+        return []
+
+    units = []
+    rel_path = str(full_path.relative_to(project_path))
+    if file_hash is None:
+        file_hash = get_file_hash(full_path)
+    lang = info.get("language", "unknown")
+
+    # Default signatures are only formatted when the extractor omitted one,
+    # and the class signature lookup is skipped when bases override it.
+    append = units.append
+    for func in info.get("functions", ()):
+        name = func.get("name", "")
+        line = func.get("line_number", 1)
+        signature = func.get("signature")
+        if signature is None:
+            signature = f"def {name}(...)"
+        append(CodeUnit(
+            id=make_unit_id(rel_path, name, line), name=name, file=rel_path, line=line,
+            unit_type="function", signature=signature,
+            language=lang, summary=func.get("docstring") or "", file_hash=file_hash,
+        ))
+
+    for class_info in info.get("classes", ()):
+        class_name = class_info.get("name", "")
+        class_line = class_info.get("line_number", 1)
+        bases = class_info.get("bases")
+        if bases:
+            class_sig = f"class {class_name}({', '.join(bases)})"
+        else:
+            class_sig = class_info.get("signature")
+            if class_sig is None:
+                class_sig = f"class {class_name}"
+        append(CodeUnit(
+            id=make_unit_id(rel_path, class_name, class_line), name=class_name,
+            file=rel_path, line=class_line, unit_type="class", signature=class_sig,
+            language=lang, summary=class_info.get("docstring") or "", file_hash=file_hash,
+        ))
+
+        for method in class_info.get("methods", ()):
+            full_name = f"{class_name}.{method.get('name', '')}"
+            method_line = method.get("line_number", class_line)
+            method_sig = method.get("signature")
+            if method_sig is None:
+                method_sig = f"def {method.get('name', '')}(self)"
+            append(CodeUnit(
+                id=make_unit_id(rel_path, full_name, method_line), name=full_name,
+                file=rel_path, line=method_line, unit_type="method", signature=method_sig,
+                language=lang, summary=method.get("docstring") or "", file_hash=file_hash,
+            ))
+
+    return units
+
+
+def _summary_concurrency() -> int:
+    """In-flight summary requests (OLLAMA_SUMMARY_CONCURRENCY overrides)."""
+    env = os.environ.get("OLLAMA_SUMMARY_CONCURRENCY")
+    if env:
+        try:
+            return max(1, int(env))
+        except ValueError:
+            logger.debug("Ignoring invalid OLLAMA_SUMMARY_CONCURRENCY=%r", env)
+    return _SUMMARY_CONCURRENCY
+
+
+def _extract_workers(file_count: int) -> int:
+    """Number of extraction processes to use (1 = serial)."""
+    env = os.environ.get("TLDRS_INDEX_WORKERS")
+    if env:
+        try:
+            return max(1, int(env))
+        except ValueError:
+            logger.debug("Ignoring invalid TLDRS_INDEX_WORKERS=%r", env)
+    if file_count < _PARALLEL_MIN_FILES:
+        return 1
+    return min(os.cpu_count() or 1, file_count)
+
+
+def _extract_chunksize(file_count: int, workers: int) -> int:
+    """Files per pool task: amortize IPC but give every worker several tasks."""
+    return max(1, min(_MAX_EXTRACT_CHUNK, file_count // (workers * 4)))
+
+
+def _iter_code_units(
+    project_path: str | Path,
     language: Optional[str] = None,
     respect_ignore: bool = True,
     respect_gitignore: bool = False,
-) -> list[CodeUnit]:
-    """Extract code units from project using rich extraction API.
+) -> Iterator[CodeUnit]:
+    """Yield code units from project using rich extraction API.
 
     Uses extract_file() to get full signatures, docstrings, and line numbers
-    for high-quality semantic embeddings.
+    for high-quality semantic embeddings. Parsing is CPU-bound, so large
+    projects are fanned out over a process pool (TLDRS_INDEX_WORKERS
+    overrides the worker count). Units are yielded file by file as results
+    arrive, in workspace order. File hashes of unchanged files come from
+    the .tldrs/hash_cache.json sidecar instead of re-reading them, and
+    unchanged files known to define nothing are not opened at all.
     """
-    from tldr_swinton.modules.core.api import extract_file
     from tldr_swinton.modules.core.workspace import iter_workspace_files
 
-    project = Path(project_path).resolve()
-    units = []
-
-    LANG_EXTENSIONS = {
-        "python": {".py"},
-        "typescript": {".ts", ".tsx"},
-        "javascript": {".js", ".jsx"},
-        "rust": {".rs"},
-        "go": {".go"},
-    }
+    # Callers that already hold the resolved project Path pass it directly
+    project = project_path if isinstance(project_path, Path) else Path(project_path).resolve()
 
     if language:
-        extensions = LANG_EXTENSIONS.get(language, set())
+        extensions = LANG_EXTENSIONS.get(language, frozenset())
     else:
-        extensions = set()
-        for ext_set in LANG_EXTENSIONS.values():
-            extensions.update(ext_set)
-
-    source_files = iter_workspace_files(
-        project,
-        extensions=extensions,
-        respect_ignore=respect_ignore,
-        respect_gitignore=respect_gitignore,
-    )
-
-    for full_path in source_files:
+        extensions = _ALL_EXTS
+
+    paths = [
+        str(p) for p in iter_workspace_files(
+            project,
+            extensions=extensions,
+            respect_ignore=respect_ignore,
+            respect_gitignore=respect_gitignore,
+        )
+    ]
+    project_str = str(project)
+
+    hash_cache = _HashCache(project / ".tldrs" / "hash_cache.json")
+    todo_paths: list[str] = []
+    todo_rel: list[str] = []
+    todo_stats: list[Optional[os.stat_result]] = []
+    known_hashes: list[Optional[str]] = []
+    for path in paths:
+        rel = os.path.relpath(path, project_str)
         try:
-            info = extract_file(str(full_path))
-        except Exception as e:
-            logger.debug("Failed to extract file %s: %s", full_path, e)
+            st = os.stat(path)
+        except OSError:
+            st = None
+        known = hash_cache.lookup(rel, st) if st else None
+        if known == _HashCache.NO_UNITS:
+            # Unchanged since a scan that found nothing: skip read and parse
             continue
+        todo_paths.append(path)
+        todo_rel.append(rel)
+        todo_stats.append(st)
+        known_hashes.append(known)
+
+    def _record(i: int, file_units: Optional[list[CodeUnit]]) -> list[CodeUnit]:
+        st = todo_stats[i]
+        if known_hashes[i] is None and st is not None:
+            # Only the keyword prefilter's verdict is cached as NO_UNITS; a
+            # parse that found nothing may succeed once a parser is installed.
+            if file_units is None:
+                hash_cache.record(todo_rel[i], st, _HashCache.NO_UNITS)
+            elif file_units:
+                hash_cache.record(todo_rel[i], st, file_units[0].file_hash)
+        return file_units or []
+
+    done = 0
+    workers = _extract_workers(len(todo_paths))
+    if workers > 1:
+        # Deferred: concurrent.futures.process drags in multiprocessing, which
+        # every CLI command importing this module would otherwise pay for.
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
 
-        rel_path = str(full_path.relative_to(project))
-        file_hash = get_file_hash(full_path)
-        lang = info.get("language", "unknown")
-
-        for func in info.get("functions", []):
-            name = func.get("name", "")
-            signature = func.get("signature", f"def {name}(...)")
-            line = func.get("line_number", 1)
-            docstring = func.get("docstring") or ""
-
-            unit_id = make_unit_id(rel_path, name, line)
-            units.append(CodeUnit(
-                id=unit_id, name=name, file=rel_path, line=line,
-                unit_type="function", signature=signature,
-                language=lang, summary=docstring, file_hash=file_hash,
-            ))
-
-        for class_info in info.get("classes", []):
-            class_name = class_info.get("name", "")
-            class_sig = class_info.get("signature", f"class {class_name}")
-            class_line = class_info.get("line_number", 1)
-            class_doc = class_info.get("docstring") or ""
-            bases = class_info.get("bases", [])
-
-            if bases:
-                class_sig = f"class {class_name}({', '.join(bases)})"
-
-            unit_id = make_unit_id(rel_path, class_name, class_line)
-            units.append(CodeUnit(
-                id=unit_id, name=class_name, file=rel_path, line=class_line,
-                unit_type="class", signature=class_sig,
-                language=lang, summary=class_doc, file_hash=file_hash,
-            ))
-
-            for method in class_info.get("methods", []):
-                method_name = method.get("name", "")
-                method_sig = method.get("signature", f"def {method_name}(self)")
-                method_line = method.get("line_number", class_line)
-                method_doc = method.get("docstring") or ""
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for file_units in executor.map(
+                    _extract_file_units, todo_paths, repeat(project_str), known_hashes,
+                    chunksize=_extract_chunksize(len(todo_paths), workers),
+                ):
+                    done += 1
+                    yield from _record(done - 1, file_units)
+            hash_cache.save()
+            return
+        except (OSError, BrokenProcessPool) as e:
+            logger.debug("Parallel extraction unavailable, continuing serially: %s", e)
+
+    # Serial path (also resumes after a pool failure without re-yielding)
+    for i in range(done, len(todo_paths)):
+        yield from _record(
+            i, _extract_file_units(todo_paths[i], project_str, known_hashes[i])
+        )
+    hash_cache.save()
 
-                full_name = f"{class_name}.{method_name}"
-                unit_id = make_unit_id(rel_path, full_name, method_line)
-                units.append(CodeUnit(
-                    id=unit_id, name=full_name, file=rel_path, line=method_line,
-                    unit_type="method", signature=method_sig,
-                    language=lang, summary=method_doc, file_hash=file_hash,
-                ))
 
-    return units
+def _extract_code_units(
+    project_path: str | Path,
+    language: Optional[str] = None,
+    respect_ignore: bool = True,
+    respect_gitignore: bool = False,
+) -> list[CodeUnit]:
+    """Extract all code units from project (see _iter_code_units)."""
+    return list(_iter_code_units(
+        project_path, language,
+        respect_ignore=respect_ignore,
+        respect_gitignore=respect_gitignore,
+    ))
 
 
 # ---------------------------------------------------------------------------
@@ -157,12 +387,15 @@ def _extract_code_units(
 
 _MAX_DOC_CHARS = 800
 _MAX_PATH_PARTS = 3
+_WS_RE = re.compile(r"\s+")
 
 
 def _clean_doc(doc: str) -> str:
     """Truncate and clean docstring for embedding."""
-    doc = (doc or "").strip()
-    doc = re.sub(r"\s+", " ", doc)
+    if not doc:
+        # Undocumented units are the common case: skip the regex entirely
+        return ""
+    doc = _WS_RE.sub(" ", doc.strip())
     if len(doc) > _MAX_DOC_CHARS:
         doc = doc[:_MAX_DOC_CHARS] + "…"
     return doc
@@ -170,8 +403,10 @@ def _clean_doc(doc: str) -> str:
 
 def _short_path(p: str) -> str:
     """Shorten path to last N segments to reduce noise."""
-    parts = Path(p).as_posix().split("/")
-    return "/".join(parts[-_MAX_PATH_PARTS:]) if parts else p
+    if "\\" not in p and p.count("/") < _MAX_PATH_PARTS:
+        return p
+    parts = p.replace("\\", "/").rsplit("/", _MAX_PATH_PARTS)
+    return "/".join(parts[-_MAX_PATH_PARTS:])
 
 
 def _build_embed_text(unit: CodeUnit) -> str:
@@ -183,19 +418,13 @@ def _build_embed_text(unit: CodeUnit) -> str:
     - Short paths reduce pollution from generic folder names
     """
     doc = _clean_doc(unit.summary)
-    path = _short_path(unit.file)
-
-    parts = [
-        f"Language: {unit.language}",
-        f"Kind: {unit.unit_type}",
-        f"Name: {unit.name}",
-        f"Signature: {unit.signature}",
-    ]
-    if doc:
-        parts.append(f"Doc: {doc}")
-    parts.append(f"File: {path}")
-
-    return "\n".join(parts)
+    doc_line = f"\nDoc: {doc}" if doc else ""
+    # One f-string: a single allocation instead of a parts list + join
+    return (
+        f"Language: {unit.language}\nKind: {unit.unit_type}\n"
+        f"Name: {unit.name}\nSignature: {unit.signature}{doc_line}\n"
+        f"File: {_short_path(unit.file)}"
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -205,94 +434,128 @@ def _build_embed_text(unit: CodeUnit) -> str:
 
 def _generate_summaries_ollama(
     units: list[CodeUnit],
-    project_path: str,
+    project_path: str | Path,
     show_progress: bool = True,
 ) -> dict[str, str]:
     """Generate one-line summaries for units using Ollama."""
-    import urllib.request
-    import urllib.error
+    from ._http import KeepAliveClient
 
-    project = Path(project_path).resolve()
+    project = project_path if isinstance(project_path, Path) else Path(project_path).resolve()
     summaries = {}
 
-    try:
-        url = f"{OLLAMA_HOST}/api/tags"
-        req = urllib.request.Request(url, method="GET")
-        with urllib.request.urlopen(req, timeout=2) as response:
-            data = json.loads(response.read().decode())
+    # A short single-line docstring is already the summary we would ask for;
+    # only the remaining units are worth an LLM round trip.
+    pending = []
+    for unit in units:
+        doc = unit.summary.strip()
+        if "\n" not in doc and _DOC_SUMMARY_MIN_LEN <= len(doc) <= _DOC_SUMMARY_MAX_LEN:
+            summaries[unit.id] = doc
+        else:
+            pending.append(unit)
+    if not pending:
+        return summaries
+
+    # One keep-alive connection per worker instead of a TCP handshake per unit
+    with closing(KeepAliveClient(OLLAMA_HOST)) as client:
+        try:
+            data = client.request_json("GET", "/api/tags", timeout=2)
             models = [m["name"].split(":")[0] for m in data.get("models", [])]
             model_base = OLLAMA_SUMMARY_MODEL.split(":")[0]
             if model_base not in models:
                 logger.warning("Summary model %s not available, skipping summaries", OLLAMA_SUMMARY_MODEL)
-                return {}
-    except Exception as e:
-        logger.debug("Ollama unavailable for summaries: %s", e)
-        return {}
-
-    console = None
-    if show_progress and sys.stdout.isatty():
-        try:
-            from rich.progress import Progress, SpinnerColumn, TextColumn
-            from rich.console import Console
-            console = Console()
-        except ImportError:
-            pass
+                return summaries
+        except Exception as e:
+            logger.debug("Ollama unavailable for summaries: %s", e)
+            return summaries
 
-    def summarize_one(unit: CodeUnit) -> Optional[str]:
-        full_path = project / unit.file
-        if not full_path.exists():
-            return None
+        # Load the model once up front so the concurrent requests below don't
+        # all queue behind the first one's cold start.
         try:
-            content = full_path.read_text()
-            lines = content.split("\n")
-            start = max(0, unit.line - 1)
-            end = min(len(lines), start + 20)
-            snippet = "\n".join(lines[start:end])
-
-            prompt = (
-                f"Summarize this {unit.unit_type} in ONE sentence (max 15 words).\n"
-                f"Focus on what it does, not how.\n\n"
-                f"{unit.signature}\n\nCode:\n{snippet}\n\nSummary:"
-            )
-
-            url = f"{OLLAMA_HOST}/api/generate"
-            payload = json.dumps({
-                "model": OLLAMA_SUMMARY_MODEL, "prompt": prompt,
-                "stream": False, "options": {"num_predict": 50, "temperature": 0.3},
-            }).encode()
-            req = urllib.request.Request(
-                url, data=payload,
-                headers={"Content-Type": "application/json"}, method="POST",
+            client.request_json(
+                "POST", "/api/generate",
+                _json.dumps({"model": OLLAMA_SUMMARY_MODEL, "keep_alive": _SUMMARY_KEEP_ALIVE}),
+                timeout=60,
             )
-            with urllib.request.urlopen(req, timeout=30) as response:
-                data = json.loads(response.read().decode())
+        except Exception as e:
+            logger.debug("Summary model warm-up failed: %s", e)
+
+        console = None
+        if show_progress and sys.stdout.isatty():
+            try:
+                from rich.progress import Progress, SpinnerColumn, TextColumn
+                from rich.console import Console
+                console = Console()
+            except ImportError:
+                pass
+
+        # Units arrive grouped by file, so a small cache turns one read per
+        # unit into one read per file. Locked so concurrent workers on the
+        # same file wait for a single read.
+        lines_cache: OrderedDict[Path, list[str]] = OrderedDict()
+        lines_lock = threading.Lock()
+
+        def file_lines(path: Path) -> list[str]:
+            with lines_lock:
+                lines = lines_cache.get(path)
+                if lines is None:
+                    lines = lines_cache[path] = path.read_text().split("\n")
+                    if len(lines_cache) > _SUMMARY_FILE_CACHE_SIZE:
+                        lines_cache.popitem(last=False)
+                return lines
+
+        def summarize_one(unit: CodeUnit) -> Optional[str]:
+            # Units come from a scan that just read their files; a file that
+            # has since vanished fails the read below instead of costing
+            # every unit an extra stat().
+            try:
+                lines = file_lines(project / unit.file)
+                start = max(0, unit.line - 1)
+                end = min(len(lines), start + 20)
+                snippet = "\n".join(lines[start:end])
+
+                prompt = (
+                    f"Summarize this {unit.unit_type} in ONE sentence (max 15 words).\n"
+                    f"Focus on what it does, not how.\n\n"
+                    f"{unit.signature}\n\nCode:\n{snippet}\n\nSummary:"
+                )
+
+                payload = _json.dumps({
+                    "model": OLLAMA_SUMMARY_MODEL, "prompt": prompt, "stream": False,
+                    "keep_alive": _SUMMARY_KEEP_ALIVE, "options": _SUMMARY_OPTIONS,
+                })
+                data = client.request_json("POST", "/api/generate", payload, timeout=30)
                 summary = data.get("response", "").strip()
                 summary = summary.split(".")[0].strip()
                 if summary and not summary.endswith("."):
                     summary += "."
                 return summary
-        except Exception as e:
-            logger.debug("Failed to generate summary for %s: %s", unit.name, e)
-            return None
-
-    if console:
-        from rich.progress import Progress, SpinnerColumn, TextColumn
-        with Progress(
-            SpinnerColumn(), TextColumn("[bold]{task.description}"), console=console,
-        ) as progress:
-            task = progress.add_task(f"Generating summaries ({OLLAMA_SUMMARY_MODEL})...", total=len(units))
-            for unit in units:
-                summary = summarize_one(unit)
-                if summary:
-                    summaries[unit.id] = summary
-                progress.update(task, advance=1)
-    else:
-        for unit in units:
-            summary = summarize_one(unit)
-            if summary:
-                summaries[unit.id] = summary
+            except Exception as e:
+                logger.debug("Failed to generate summary for %s: %s", unit.name, e)
+                return None
+
+        def run_all(on_done) -> None:
+            # Each request is LLM/network bound: fan out over a bounded pool so
+            # Ollama's parallel slots stay busy.
+            workers = min(_summary_concurrency(), len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(summarize_one, unit): unit for unit in pending}
+                for future in as_completed(futures):
+                    summary = future.result()
+                    if summary:
+                        summaries[futures[future].id] = summary
+                    on_done()
+
+        if console:
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+            with Progress(
+                SpinnerColumn(), TextColumn("[bold]{task.description}"), console=console,
+            ) as progress:
+                task = progress.add_task(f"Generating summaries ({OLLAMA_SUMMARY_MODEL})...", total=len(pending))
+                run_all(lambda: progress.update(task, advance=1))
+        else:
+            run_all(lambda: None)
 
-    return summaries
+        return summaries
 
 
 # ---------------------------------------------------------------------------
@@ -310,6 +573,8 @@ def build_index(
     show_progress: bool = True,
     respect_ignore: bool = True,
     respect_gitignore: bool = False,
+    index_type: str = "auto",
+    quantization: str = "fp16",
 ) -> IndexStats:
     """Build or update the semantic index for a project.
 
@@ -323,6 +588,10 @@ def build_index(
         show_progress: Show progress indicators
         respect_ignore: Respect .tldrsignore patterns
         respect_gitignore: If True, also respect .gitignore patterns
+        index_type: FAISS index structure: "auto" (by corpus size) |
+            "flat" | "ivfpq" (FAISS backend only)
+        quantization: Flat index vector storage: "none" (fp32) | "fp16" |
+            "sq8" (FAISS backend only)
 
     Returns:
         IndexStats with indexing statistics
@@ -333,12 +602,24 @@ def build_index(
     # Extract code units
     if show_progress:
         print("Scanning codebase...")
-    units = _extract_code_units(
-        str(project), language,
+    # Single pass over the extraction stream: collect units and build their
+    # embedding texts as they arrive. With summaries on, texts depend on the
+    # generated summaries, so they are built once afterwards instead.
+    units: list[CodeUnit] = []
+    texts: list[str] = []
+    last_file = None
+    for unit in _iter_code_units(
+        project, language,
         respect_ignore=respect_ignore,
         respect_gitignore=respect_gitignore,
-    )
-    stats.total_files = len(set(u.file for u in units))
+    ):
+        units.append(unit)
+        if not generate_summaries:
+            texts.append(_build_embed_text(unit))
+        # Units arrive grouped by file, so a change of file is a new file
+        if unit.file != last_file:
+            last_file = unit.file
+            stats.total_files += 1
     stats.total_units = len(units)
 
     if not units:
@@ -346,22 +627,21 @@ def build_index(
             print("No code units found to index.")
         return stats
 
-    # Build embedding texts
-    texts = [_build_embed_text(u) for u in units]
-
     # Generate summaries if requested (before embedding)
     if generate_summaries:
         if show_progress:
             print(f"Generating summaries for {len(units)} units...")
-        summaries = _generate_summaries_ollama(units, str(project), show_progress)
+        summaries = _generate_summaries_ollama(units, project, show_progress)
         for unit in units:
             if unit.id in summaries:
                 unit.summary = summaries[unit.id]
-        # Rebuild texts with updated summaries
         texts = [_build_embed_text(u) for u in units]
 
     # Get backend and build
-    search_backend = get_backend(str(project), backend=backend)
+    search_backend = get_backend(
+        str(project), backend=backend,
+        index_type=index_type, quantization=quantization,
+    )
 
     if show_progress:
         backend_info = search_backend.info()
@@ -418,10 +698,43 @@ def _build_bm25(search_backend, units, texts, show_progress=False):
 _IDENT_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_\.]*$")
 
 
+# Loaded backends keyed by (project, nprobe), reused while meta.json (rewritten
+# by every index save) is unchanged.
+_search_backends: dict[tuple[str, Optional[int]], tuple[tuple[int, int], object]] = {}
+_search_backends_lock = threading.Lock()
+
+
+def _load_search_backend(project: Path, nprobe: Optional[int]):
+    """Return a loaded search backend for project, or None if no index."""
+    try:
+        st = (project / ".tldrs" / "index" / META_FILENAME).stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+    key = (str(project), nprobe)
+    with _search_backends_lock:
+        cached = _search_backends.get(key)
+    if cached is not None and stamp is not None and cached[0] == stamp:
+        return cached[1]
+
+    # Get the backend (auto-detects from meta.json)
+    search_backend = get_backend(str(project), backend="auto", nprobe=nprobe)
+    # FAISS can defer reading vectors.faiss until a semantic search needs it,
+    # so identifier queries answered by exact match never touch it.
+    load = getattr(search_backend, "load_meta", search_backend.load)
+    if not load():
+        return None
+    if stamp is not None:
+        with _search_backends_lock:
+            _search_backends[key] = (stamp, search_backend)
+    return search_backend
+
+
 def search_index(
     project_path: str,
     query: str,
     k: int = 10,
+    nprobe: Optional[int] = None,
     **kwargs,
 ) -> list[dict]:
     """Search the semantic index.
@@ -434,21 +747,43 @@ def search_index(
         project_path: Path to project root
         query: Natural language query or identifier name
         k: Number of results
+        nprobe: IVF lists probed per query (FAISS IVF indexes only)
 
     Returns:
         List of result dicts with unit info and score
     """
     project = Path(project_path).resolve()
 
-    # Get the backend (auto-detects from meta.json)
-    search_backend = get_backend(str(project), backend="auto")
-
-    if not search_backend.load():
+    search_backend = _load_search_backend(project, nprobe)
+    if search_backend is None:
         index_dir = project / ".tldrs" / "index"
         raise FileNotFoundError(
             f"No index found at {index_dir}. Run `tldrs index` first."
         )
 
+    # Agents repeat queries constantly. Results live on the loaded backend,
+    # so a rebuild (which swaps in a fresh backend) drops them wholesale.
+    cache = getattr(search_backend, "_result_cache", None)
+    if cache is None:
+        cache = search_backend._result_cache = OrderedDict()
+    key = (query, k)
+    with _search_backends_lock:
+        hit = cache.get(key)
+        if hit is not None:
+            cache.move_to_end(key)
+    if hit is not None:
+        return [dict(r) for r in hit]
+
+    results = _run_search(search_backend, query, k)
+    with _search_backends_lock:
+        cache[key] = results
+        if len(cache) > _SEARCH_RESULT_CACHE_SIZE:
+            cache.popitem(last=False)
+    return [dict(r) for r in results]
+
+
+def _run_search(search_backend, query: str, k: int) -> list[dict]:
+    """Run the identifier fast-path plus semantic search on a loaded backend."""
     # Migration nudge: if FAISS index but pylate available
     bi = search_backend.info()
     if bi.backend_name == "faiss" and _colbert_available():
@@ -499,33 +834,39 @@ def search_index(
     return exact_results + semantic_formatted
 
 
+def _name_index(search_backend) -> tuple[dict, dict]:
+    """Return (name -> units, method name -> units) lookups for a backend.
+
+    Built on first use and cached on the backend; rebuilt when the backend
+    installs a new units container (load/build replace it wholesale).
+    """
+    units = getattr(search_backend, "_units", None)
+    cached = getattr(search_backend, "_name_idx", None)
+    if cached is not None and cached[0] is units:
+        return cached[1], cached[2]
+
+    # FAISSBackend keeps a list, ColBERTBackend a dict keyed by unit id
+    all_units = units.values() if isinstance(units, dict) else (units or ())
+    by_name: dict[str, list[CodeUnit]] = defaultdict(list)
+    by_method: dict[str, list[CodeUnit]] = defaultdict(list)
+    for u in all_units:
+        by_name[u.name].append(u)
+        if "." in u.name:
+            by_method[u.name.rsplit(".", 1)[1]].append(u)
+    search_backend._name_idx = (units, by_name, by_method)
+    return by_name, by_method
+
+
 def _identifier_search(search_backend, query: str) -> list[CodeUnit]:
     """Fast-path: exact name match for identifier-like queries."""
-    # FAISSBackend has get_units_by_name; ColBERTBackend uses dict lookup
-    if hasattr(search_backend, "get_units_by_name"):
-        matches = search_backend.get_units_by_name(query)
-    elif hasattr(search_backend, "_units"):
-        # ColBERTBackend stores units as dict
-        matches = [u for u in search_backend._units.values() if u.name == query]
-    else:
-        matches = []
+    by_name, by_method = _name_index(search_backend)
+    matches = by_name.get(query, [])
 
     # Also try Class.method partial match
     if not matches and "." in query:
-        parts = query.split(".")
-        method_name = parts[-1]
-        if hasattr(search_backend, "get_all_units"):
-            all_units = search_backend.get_all_units()
-        elif hasattr(search_backend, "_units"):
-            all_units = list(search_backend._units.values())
-        else:
-            all_units = []
-        matches = [
-            u for u in all_units
-            if u.name == query or u.name.endswith(f".{method_name}")
-        ]
+        matches = by_method.get(query.rsplit(".", 1)[1], [])
 
-    return matches
+    return list(matches)
 
 
 def get_index_info(project_path: str) -> Optional[dict]:
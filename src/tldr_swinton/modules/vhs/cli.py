@@ -9,6 +9,7 @@ from pathlib import Path
 
 from .store import Store
 from . import __version__
+from .. import _json
 
 
 def add_subparser(subparsers: argparse._SubParsersAction) -> None:
@@ -133,8 +134,11 @@ def handle(args: argparse.Namespace) -> int:
     if cmd == "ls":
         items = store.list(limit=args.limit)
         if args.jsonl:
-            for item in items:
-                print(json.dumps(item.__dict__))
+            # Pre-encoded lines straight to the byte stream
+            sys.stdout.flush()
+            out = sys.stdout.buffer
+            out.writelines(_json.dumps(item.__dict__, newline=True) for item in items)
+            out.flush()
         else:
             print(json.dumps([i.__dict__ for i in items], indent=2))
         return 0
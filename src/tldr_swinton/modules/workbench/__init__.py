@@ -7,11 +7,30 @@ relationships to support transparent agent reasoning.
 
 __version__ = "0.1.0"
 
-from .capsule import Capsule, capture, replay_command
-from .decision import Decision, parse_refs
-from .hypothesis import Hypothesis
-from .link import Link, ArtifactType, LinkRelation, parse_artifact_id, format_artifact_ref
-from .store import WorkbenchStore
+# Public names resolve on first access, so `tldrs` building its `wb`
+# subparser does not import the store, sqlite3, and every artifact model.
+_EXPORTS = {
+    "Capsule": "capsule",
+    "capture": "capsule",
+    "replay_command": "capsule",
+    "Decision": "decision",
+    "parse_refs": "decision",
+    "Hypothesis": "hypothesis",
+    "Link": "link",
+    "ArtifactType": "link",
+    "LinkRelation": "link",
+    "parse_artifact_id": "link",
+    "format_artifact_ref": "link",
+    "WorkbenchStore": "store",
+}
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    return getattr(import_module(f".{module}", __name__), name)
 
 __all__ = [
     # Capsules
@@ -0,0 +1,18 @@
+"""Short random suffixes for workbench artifact IDs."""
+
+from __future__ import annotations
+
+import os
+import random
+import secrets
+
+# IDs are labels, not secrets: a seeded PRNG avoids a getrandom() syscall
+# per ID. Reseed in forked children so they don't replay the parent's IDs.
+_id_rng = random.Random(secrets.token_bytes(16))
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=lambda: _id_rng.seed(secrets.token_bytes(16)))
+
+
+def short_random_hex() -> str:
+    """Return 6 random hex chars (24 bits) for an artifact ID suffix."""
+    return f"{_id_rng.getrandbits(24):06x}"
@@ -16,11 +16,12 @@ import os
 import subprocess
 import time
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
 
 # Environment variables to capture (allowlist approach for security/noise reduction)
-ENV_ALLOWLIST = [
+ENV_ALLOWLIST = frozenset({
     "PATH",
     "PYTHONPATH",
     "VIRTUAL_ENV",
@@ -35,10 +36,17 @@ ENV_ALLOWLIST = [
     "LANG",
     "LC_ALL",
     "TERM",
-]
+})
+_ENV_ALLOWLIST_SORTED = tuple(sorted(ENV_ALLOWLIST))
+_ENV_ALLOWLIST_SORTED_BYTES = tuple(k.encode() for k in _ENV_ALLOWLIST_SORTED)
 
 
-@dataclass
+def _short_hash(data: bytes) -> str:
+    """12-hex-char identifier hash (not a security boundary)."""
+    return hashlib.blake2b(data, digest_size=6).hexdigest()
+
+
+@dataclass(slots=True)
 class Capsule:
     """A replayable record of a command execution."""
 
@@ -83,22 +91,37 @@ def compute_env_fingerprint(env: dict[str, str] | None = None) -> str:
     Returns:
         Short hash of relevant env vars.
     """
+    if env is None and os.supports_bytes_environ:
+        # Raw bytes: no per-variable decode, and the joined content is
+        # hashed as-is instead of being encoded again.
+        getb = os.environb.get
+        content = b"\n".join(
+            [k + b"=" + v for k in _ENV_ALLOWLIST_SORTED_BYTES if (v := getb(k)) is not None]
+        )
+        return _env_digest(content)
     if env is None:
-        env = dict(os.environ)
+        env = os.environ
+
+    # Look up only the allowlisted vars (in sorted order, for determinism),
+    # one get() each. surrogateescape round-trips undecodable values to the
+    # same bytes os.environb holds.
+    get = env.get
+    content = "\n".join([f"{k}={v}" for k in _ENV_ALLOWLIST_SORTED if (v := get(k)) is not None])
+    return _env_digest(content.encode("utf-8", "surrogateescape"))
 
-    # Extract relevant vars
-    relevant = {k: env.get(k, "") for k in ENV_ALLOWLIST if k in env}
 
-    # Sort for determinism and hash
-    content = "\n".join(f"{k}={v}" for k, v in sorted(relevant.items()))
-    return hashlib.sha256(content.encode()).hexdigest()[:12]
+@lru_cache(maxsize=16)
+def _env_digest(content: bytes) -> str:
+    # Keyed on the allowlisted values, so a changed environment still gets a
+    # fresh fingerprint while batch captures in one process hash only once.
+    return _short_hash(content)
 
 
 def compute_capsule_id(
     command: str,
     cwd: str,
     env_fingerprint: str,
-    started_at: datetime,
+    started_at: datetime | str,
 ) -> str:
     """Compute content-addressed capsule ID.
 
@@ -106,13 +129,15 @@ def compute_capsule_id(
         command: The command string.
         cwd: Working directory.
         env_fingerprint: Environment fingerprint.
-        started_at: When the command started.
+        started_at: When the command started (datetime or its ISO string).
 
     Returns:
         Short content-addressed ID.
     """
-    content = f"{command}\n{cwd}\n{env_fingerprint}\n{started_at.isoformat()}"
-    return hashlib.sha256(content.encode()).hexdigest()[:12]
+    if not isinstance(started_at, str):
+        started_at = started_at.isoformat()
+    content = f"{command}\n{cwd}\n{env_fingerprint}\n{started_at}"
+    return _short_hash(content.encode())
 
 
 def capture(
@@ -132,12 +157,11 @@ def capture(
     Returns:
         Capsule containing the execution record.
     """
-    # Resolve working directory
+    # Resolve working directory (getcwd() is already absolute and canonical)
     if cwd is None:
         cwd = Path.cwd()
-    elif isinstance(cwd, str):
-        cwd = Path(cwd)
-    cwd = cwd.resolve()
+    else:
+        cwd = Path(cwd).resolve()
 
     # Compute env fingerprint before running
     env_fingerprint = compute_env_fingerprint()
@@ -152,12 +176,13 @@ def capture(
             shell=shell,
             cwd=cwd,
             capture_output=True,
-            text=True,
             timeout=timeout,
         )
+        # Decode each stream once at the end; "replace" keeps the record
+        # instead of losing it to a UnicodeDecodeError on binary output.
         exit_code = result.returncode
-        stdout = result.stdout
-        stderr = result.stderr
+        stdout = result.stdout.decode("utf-8", errors="replace")
+        stderr = result.stderr.decode("utf-8", errors="replace")
     except subprocess.TimeoutExpired as e:
         # Capture partial output on timeout
         exit_code = -1
@@ -173,12 +198,13 @@ def capture(
     duration_ms = int((time.perf_counter() - start_time) * 1000)
 
     # Compute capsule ID
-    capsule_id = compute_capsule_id(command, str(cwd), env_fingerprint, started_at)
+    cwd_str = str(cwd)
+    capsule_id = compute_capsule_id(command, cwd_str, env_fingerprint, started_at)
 
     return Capsule(
         id=capsule_id,
         command=command,
-        cwd=str(cwd),
+        cwd=cwd_str,
         env_fingerprint=env_fingerprint,
         exit_code=exit_code,
         stdout=stdout,
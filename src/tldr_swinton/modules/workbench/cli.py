@@ -3,237 +3,212 @@
 from __future__ import annotations
 
 import argparse
+import re
 import sys
-from pathlib import Path
-
-from .capsule import Capsule, capture, replay_command
-from .decision import Decision, parse_refs
-from .display import (
-    BOLD,
-    DIM,
-    YELLOW,
-    color,
-    format_capsule_detail,
-    format_capsule_row,
-    format_capture_result,
-    format_decision_created,
-    format_decision_detail,
-    format_decision_row,
-    format_decision_superseded,
-    format_evidence_added,
-    format_graph,
-    format_hypothesis_confirmed,
-    format_hypothesis_created,
-    format_hypothesis_detail,
-    format_hypothesis_falsified,
-    format_hypothesis_row,
-    format_link_created,
-    format_link_deleted,
-    format_link_row,
-    format_replay_preview,
-    format_timeline_row,
-)
-from .export import (
-    export_artifact_json,
-    export_artifact_markdown,
-    export_json,
-    export_markdown,
-    export_vhs,
-)
-from .hypothesis import Hypothesis
-from .link import parse_artifact_id
-from .store import WorkbenchStore
+from typing import Callable
+
+
+# Substrings that make replay ask for --force (one case-insensitive scan)
+_DANGEROUS_RE = re.compile(r"rm[ \t]|drop |delete |truncate ", re.IGNORECASE)
+
+# Fixed vocabularies. Parsed values go through sys.intern so the argv strings
+# compare and hash like these constants in link and graph lookups.
+_EVIDENCE_RELATIONS = ("supports", "falsifies")
+_LINK_RELATIONS = ("evidence", "falsifies", "implements", "refs", "supersedes", "related")
+_ARTIFACT_TYPES = ("capsule", "decision", "hypothesis")
 
 
 def add_subparser(subparsers: argparse._SubParsersAction) -> None:
-    """Add the 'wb' subcommand to the main CLI parser."""
+    """Add the 'wb' subcommand to the main CLI parser.
+
+    Only the command name is parsed here; handle() builds the one parser the
+    chosen command needs instead of every tldrs run building all of them.
+    """
+    listing = "\n".join(f"  {name:<16}{help_text}" for name, (help_text, _) in _COMMANDS.items())
     wb_parser = subparsers.add_parser(
         "wb",
         help="Agent reasoning artifact persistence",
         description="Track capsules, decisions, hypotheses, and their relationships.",
+        epilog=f"commands:\n{listing}",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    # Optional so a bare 'tldrs wb' reaches handle(), which prints this help
+    # (argparse would report the hidden ARGS remainder as missing too)
+    wb_parser.add_argument(
+        "wb_command", metavar="COMMAND", nargs="?", choices=_COMMANDS,
+        help="One of the commands below",
+    )
+    wb_parser.add_argument("wb_args", metavar="ARGS", nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    wb_parser.set_defaults(wb_print_help=wb_parser.print_help)
+
+
+def _command_parser(cmd: str) -> argparse.ArgumentParser:
+    """Build the argument parser for a single wb command."""
+    help_text, add_args = _COMMANDS[cmd]
+    parser = argparse.ArgumentParser(prog=f"tldrs wb {cmd}", description=help_text)
+    add_args(parser)
+    return parser
+
+
+# Command arguments
+
+def _capture_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("command", nargs="*", help="Command to run")
+    parser.add_argument("--cwd", "-C", metavar="DIR", help="Run command in this directory")
+    parser.add_argument("--timeout", "-t", type=float, metavar="SECS", help="Timeout in seconds")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Show command output")
+
+
+def _show_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("id", help="Capsule ID")
+    parser.add_argument("--stdout", action="store_true", help="Print only stdout (raw)")
+    parser.add_argument("--stderr", action="store_true", help="Print only stderr (raw)")
+    parser.add_argument("--full", "-f", action="store_true", help="Show full stdout and stderr")
+
+
+def _capsules_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--limit", "-n", type=int, default=20, help="Max capsules to show")
+    parser.add_argument("--failed", "-F", action="store_true", help="Only show failed commands")
+    parser.add_argument("--command", "-c", metavar="PATTERN", help="Filter by command substring")
+
+
+def _replay_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("id", help="Capsule ID to replay")
+    parser.add_argument("--dry-run", "-n", action="store_true", help="Show what would run")
+    parser.add_argument("--force", "-f", action="store_true", help="Run even if destructive")
+    parser.add_argument(
+        "--cached",
+        action="store_true",
+        help="Reuse the latest capsule with the same command, cwd and env instead of re-running",
     )
-    wb_sub = wb_parser.add_subparsers(dest="wb_command", required=True)
-
-    # capture command
-    capture_p = wb_sub.add_parser("capture", help="Capture a command execution")
-    capture_p.add_argument("command", nargs="*", help="Command to run")
-    capture_p.add_argument("--cwd", "-C", metavar="DIR", help="Run command in this directory")
-    capture_p.add_argument("--timeout", "-t", type=float, metavar="SECS", help="Timeout in seconds")
-    capture_p.add_argument("--verbose", "-v", action="store_true", help="Show command output")
-
-    # show command
-    show_p = wb_sub.add_parser("show", help="Show capsule details")
-    show_p.add_argument("id", help="Capsule ID")
-    show_p.add_argument("--stdout", action="store_true", help="Print only stdout (raw)")
-    show_p.add_argument("--stderr", action="store_true", help="Print only stderr (raw)")
-    show_p.add_argument("--full", "-f", action="store_true", help="Show full stdout and stderr")
-
-    # capsules command
-    capsules_p = wb_sub.add_parser("capsules", help="List capsules")
-    capsules_p.add_argument("--limit", "-n", type=int, default=20, help="Max capsules to show")
-    capsules_p.add_argument("--failed", "-F", action="store_true", help="Only show failed commands")
-    capsules_p.add_argument("--command", "-c", metavar="PATTERN", help="Filter by command substring")
-
-    # replay command
-    replay_p = wb_sub.add_parser("replay", help="Re-run a captured command")
-    replay_p.add_argument("id", help="Capsule ID to replay")
-    replay_p.add_argument("--dry-run", "-n", action="store_true", help="Show what would run")
-    replay_p.add_argument("--force", "-f", action="store_true", help="Run even if destructive")
-
-    # decide command
-    decide_p = wb_sub.add_parser("decide", help="Record a decision")
-    decide_p.add_argument("statement", nargs="*", help="Decision statement")
-    decide_p.add_argument("--reason", "-r", metavar="TEXT", help="Rationale for the decision")
-    decide_p.add_argument("--refs", metavar="SYMBOLS", help="Comma-separated symbol refs")
-
-    # decisions command
-    decisions_p = wb_sub.add_parser("decisions", help="List decisions")
-    decisions_p.add_argument("--limit", "-n", type=int, default=20, help="Max decisions to show")
-    decisions_p.add_argument("--all", "-a", action="store_true", help="Include superseded")
-    decisions_p.add_argument("--refs", metavar="PATTERN", help="Filter by symbol ref pattern")
-
-    # show-decision command
-    show_dec_p = wb_sub.add_parser("show-decision", help="Show decision details")
-    show_dec_p.add_argument("id", help="Decision ID")
-
-    # supersede command
-    supersede_p = wb_sub.add_parser("supersede", help="Supersede a decision")
-    supersede_p.add_argument("id", help="Decision ID to supersede")
-    supersede_p.add_argument("statement", nargs="*", help="New decision statement")
-    supersede_p.add_argument("--reason", "-r", metavar="TEXT", help="Rationale")
-
-    # hypothesis command
-    hyp_p = wb_sub.add_parser("hypothesis", help="Create a hypothesis")
-    hyp_p.add_argument("statement", nargs="*", help="Hypothesis statement")
-    hyp_p.add_argument("--test", "-t", metavar="TEXT", help="How to test")
-    hyp_p.add_argument("--disconfirmer", "-d", metavar="TEXT", help="What would prove it wrong")
-
-    # hypotheses command
-    hyps_p = wb_sub.add_parser("hypotheses", help="List hypotheses")
-    hyps_p.add_argument("--limit", "-n", type=int, default=20, help="Max to show")
-    hyps_p.add_argument("--all", "-a", action="store_true", help="Include resolved")
-    hyps_p.add_argument("--status", "-s", choices=["active", "confirmed", "falsified"])
-
-    # show-hypothesis command
-    show_hyp_p = wb_sub.add_parser("show-hypothesis", help="Show hypothesis details")
-    show_hyp_p.add_argument("id", help="Hypothesis ID")
-
-    # confirm command
-    confirm_p = wb_sub.add_parser("confirm", help="Confirm a hypothesis")
-    confirm_p.add_argument("id", help="Hypothesis ID")
-    confirm_p.add_argument("--note", "-n", metavar="TEXT", help="Resolution note")
-    confirm_p.add_argument("--evidence", "-e", metavar="ID", help="Link confirming evidence")
-
-    # falsify command
-    falsify_p = wb_sub.add_parser("falsify", help="Falsify a hypothesis")
-    falsify_p.add_argument("id", help="Hypothesis ID")
-    falsify_p.add_argument("--note", "-n", metavar="TEXT", help="Resolution note")
-    falsify_p.add_argument("--evidence", "-e", metavar="ID", help="Link falsifying evidence")
-
-    # link command
-    link_p = wb_sub.add_parser("link", help="Link evidence to a hypothesis")
-    link_p.add_argument("hypothesis_id", help="Hypothesis ID")
-    link_p.add_argument("artifact_id", help="Artifact ID")
-    link_p.add_argument("--relation", "-r", choices=["supports", "falsifies"], default="supports")
-
-    # connect command
-    connect_p = wb_sub.add_parser("connect", help="Create a link between artifacts")
-    connect_p.add_argument("source", help="Source artifact")
-    connect_p.add_argument("dest", help="Destination artifact")
-    connect_p.add_argument(
+
+
+def _decide_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("statement", nargs="*", help="Decision statement")
+    parser.add_argument("--reason", "-r", metavar="TEXT", help="Rationale for the decision")
+    parser.add_argument("--refs", metavar="SYMBOLS", help="Comma-separated symbol refs")
+
+
+def _decisions_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--limit", "-n", type=int, default=20, help="Max decisions to show")
+    parser.add_argument("--all", "-a", action="store_true", help="Include superseded")
+    parser.add_argument("--refs", metavar="PATTERN", help="Filter by symbol ref pattern")
+
+
+def _show_decision_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("id", help="Decision ID")
+
+
+def _supersede_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("id", help="Decision ID to supersede")
+    parser.add_argument("statement", nargs="*", help="New decision statement")
+    parser.add_argument("--reason", "-r", metavar="TEXT", help="Rationale")
+
+
+def _hypothesis_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("statement", nargs="*", help="Hypothesis statement")
+    parser.add_argument("--test", "-t", metavar="TEXT", help="How to test")
+    parser.add_argument("--disconfirmer", "-d", metavar="TEXT", help="What would prove it wrong")
+
+
+def _hypotheses_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--limit", "-n", type=int, default=20, help="Max to show")
+    parser.add_argument("--all", "-a", action="store_true", help="Include resolved")
+    parser.add_argument("--status", "-s", choices=["active", "confirmed", "falsified"])
+
+
+def _show_hypothesis_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("id", help="Hypothesis ID")
+
+
+def _confirm_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("id", help="Hypothesis ID")
+    parser.add_argument("--note", "-n", metavar="TEXT", help="Resolution note")
+    parser.add_argument("--evidence", "-e", metavar="ID", help="Link confirming evidence")
+
+
+def _falsify_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("id", help="Hypothesis ID")
+    parser.add_argument("--note", "-n", metavar="TEXT", help="Resolution note")
+    parser.add_argument("--evidence", "-e", metavar="ID", help="Link falsifying evidence")
+
+
+def _link_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("hypothesis_id", help="Hypothesis ID")
+    parser.add_argument("artifact_id", help="Artifact ID")
+    parser.add_argument(
+        "--relation", "-r", type=sys.intern, choices=_EVIDENCE_RELATIONS, default="supports"
+    )
+
+
+def _connect_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("source", help="Source artifact")
+    parser.add_argument("dest", help="Destination artifact")
+    parser.add_argument(
         "--relation", "-r",
-        choices=["evidence", "falsifies", "implements", "refs", "supersedes", "related"],
+        type=sys.intern,
+        choices=_LINK_RELATIONS,
         default="related"
     )
 
-    # disconnect command
-    disconnect_p = wb_sub.add_parser("disconnect", help="Remove a link")
-    disconnect_p.add_argument("source", help="Source artifact")
-    disconnect_p.add_argument("dest", help="Destination artifact")
-    disconnect_p.add_argument("--relation", "-r", required=True, help="Relation type")
 
-    # links command
-    links_p = wb_sub.add_parser("links", help="List links")
-    links_p.add_argument("--relation", "-r", help="Filter by relation type")
-    links_p.add_argument("--limit", "-n", type=int, default=50, help="Max links to show")
+def _disconnect_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("source", help="Source artifact")
+    parser.add_argument("dest", help="Destination artifact")
+    parser.add_argument("--relation", "-r", type=sys.intern, required=True, help="Relation type")
+
+
+def _links_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--relation", "-r", type=sys.intern, help="Filter by relation type")
+    parser.add_argument("--limit", "-n", type=int, default=50, help="Max links to show")
+
 
-    # graph command
-    graph_p = wb_sub.add_parser("graph", help="Show graph around an artifact")
-    graph_p.add_argument("artifact", help="Central artifact")
-    graph_p.add_argument("--depth", "-d", type=int, default=1, help="Traversal depth")
+def _graph_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("artifact", help="Central artifact")
+    parser.add_argument("--depth", "-d", type=int, default=1, help="Traversal depth")
 
-    # timeline command
-    timeline_p = wb_sub.add_parser("timeline", help="Show artifact timeline")
-    timeline_p.add_argument("--type", "-t", choices=["capsule", "decision", "hypothesis"])
-    timeline_p.add_argument("--limit", "-n", type=int, default=20, help="Max artifacts")
 
-    # export command
-    export_p = wb_sub.add_parser("export", help="Export artifacts")
-    export_p.add_argument("artifact", nargs="?", help="Specific artifact to export")
-    export_p.add_argument("--format", "-f", choices=["markdown", "json", "vhs"], default="markdown")
-    export_p.add_argument("--type", "-t", choices=["capsule", "decision", "hypothesis"])
-    export_p.add_argument("--no-links", action="store_true", help="Exclude links from export")
+def _timeline_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--type", "-t", type=sys.intern, choices=_ARTIFACT_TYPES)
+    parser.add_argument("--limit", "-n", type=int, default=20, help="Max artifacts")
+
+
+def _export_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("artifact", nargs="?", help="Specific artifact to export")
+    parser.add_argument("--format", "-f", choices=["markdown", "json", "vhs"], default="markdown")
+    parser.add_argument("--type", "-t", type=sys.intern, choices=_ARTIFACT_TYPES)
+    parser.add_argument("--no-links", action="store_true", help="Exclude links from export")
 
 
 def handle(args: argparse.Namespace) -> int:
     """Handle wb subcommand."""
     cmd = args.wb_command
-
-    if cmd == "capture":
-        return _cmd_capture(args)
-    elif cmd == "show":
-        return _cmd_show(args)
-    elif cmd == "capsules":
-        return _cmd_capsules(args)
-    elif cmd == "replay":
-        return _cmd_replay(args)
-    elif cmd == "decide":
-        return _cmd_decide(args)
-    elif cmd == "decisions":
-        return _cmd_decisions(args)
-    elif cmd == "show-decision":
-        return _cmd_show_decision(args)
-    elif cmd == "supersede":
-        return _cmd_supersede(args)
-    elif cmd == "hypothesis":
-        return _cmd_hypothesis(args)
-    elif cmd == "hypotheses":
-        return _cmd_hypotheses(args)
-    elif cmd == "show-hypothesis":
-        return _cmd_show_hypothesis(args)
-    elif cmd == "confirm":
-        return _cmd_confirm(args)
-    elif cmd == "falsify":
-        return _cmd_falsify(args)
-    elif cmd == "link":
-        return _cmd_link(args)
-    elif cmd == "connect":
-        return _cmd_connect(args)
-    elif cmd == "disconnect":
-        return _cmd_disconnect(args)
-    elif cmd == "links":
-        return _cmd_links(args)
-    elif cmd == "graph":
-        return _cmd_graph(args)
-    elif cmd == "timeline":
-        return _cmd_timeline(args)
-    elif cmd == "export":
-        return _cmd_export(args)
-    else:
+    if cmd is None:
+        args.wb_print_help()
+        return 1
+    handler = _DISPATCH.get(cmd)
+    if handler is None:
         print(f"Unknown wb command: {cmd}", file=sys.stderr)
         return 1
+    wb_args = getattr(args, "wb_args", None)
+    if wb_args is not None:
+        args = _command_parser(cmd).parse_args(wb_args, argparse.Namespace(wb_command=cmd))
+    return handler(args)
 
 
 # Command implementations
 
 def _cmd_capture(args: argparse.Namespace) -> int:
+    from .capsule import capture
+    from .display import DIM, color, format_capture_result
+    from .store import WorkbenchStore
+
     if not args.command:
         print("Error: command is required", file=sys.stderr)
         return 1
 
     command = " ".join(args.command)
-    cwd = Path(args.cwd).resolve() if args.cwd else None
-    capsule = capture(command, cwd=cwd, timeout=args.timeout)
+    capsule = capture(command, cwd=args.cwd, timeout=args.timeout)
 
     store = WorkbenchStore()
     store.store_capsule(capsule)
@@ -254,6 +229,9 @@ def _cmd_capture(args: argparse.Namespace) -> int:
 
 
 def _cmd_show(args: argparse.Namespace) -> int:
+    from .display import format_capsule_detail
+    from .store import WorkbenchStore
+
     store = WorkbenchStore()
     capsule = store.get_capsule(args.id)
 
@@ -278,6 +256,11 @@ def _cmd_show(args: argparse.Namespace) -> int:
 
 
 def _cmd_capsules(args: argparse.Namespace) -> int:
+    from datetime import datetime, timezone
+
+    from .display import BOLD, DIM, color, format_capsule_row
+    from .store import WorkbenchStore
+
     store = WorkbenchStore()
     capsules = store.list_capsules(
         limit=args.limit,
@@ -292,8 +275,8 @@ def _cmd_capsules(args: argparse.Namespace) -> int:
     print(color(f"{'ID':<20}  {'Exit':>4}  {'Duration':>8}  {'When':>12}  Command", BOLD))
     print(color("─" * 80, DIM))
 
-    for cap in capsules:
-        print(format_capsule_row(cap))
+    now = datetime.now(timezone.utc)
+    print("\n".join([format_capsule_row(cap, now) for cap in capsules]))
 
     print()
     print(color(f"{len(capsules)} capsule(s)", DIM))
@@ -301,6 +284,10 @@ def _cmd_capsules(args: argparse.Namespace) -> int:
 
 
 def _cmd_replay(args: argparse.Namespace) -> int:
+    from .capsule import Capsule, compute_env_fingerprint, replay_command
+    from .display import BOLD, DIM, YELLOW, color, format_capture_result, format_replay_preview
+    from .store import WorkbenchStore
+
     store = WorkbenchStore()
     capsule_data = store.get_capsule(args.id)
 
@@ -314,26 +301,34 @@ def _cmd_replay(args: argparse.Namespace) -> int:
         print(format_replay_preview(capsule_data))
         return 0
 
-    dangerous_patterns = ["rm ", "rm\t", "drop ", "delete ", "truncate "]
-    is_dangerous = any(p in capsule.command.lower() for p in dangerous_patterns)
+    # Deterministic commands (builds, linters) need not run again when the
+    # same command already ran here under the same environment.
+    cached = None
+    if args.cached:
+        cached = store.find_capsule(capsule.command, capsule.cwd, compute_env_fingerprint())
+    if cached is not None:
+        new_capsule = Capsule.from_dict(cached)
+        print(color(f"Reusing capsule:{new_capsule.id} (same command, cwd and env)", DIM))
+    else:
+        is_dangerous = _DANGEROUS_RE.search(capsule.command) is not None
+
+        if is_dangerous and not args.force:
+            print(color("Warning: This command may be destructive:", YELLOW))
+            print(f"  {capsule.command}")
+            print()
+            print("Use --force to run anyway, or --dry-run to preview.")
+            return 1
 
-    if is_dangerous and not args.force:
-        print(color("Warning: This command may be destructive:", YELLOW))
-        print(f"  {capsule.command}")
+        print(color(f"Replaying: {capsule.command}", BOLD))
+        print(color(f"In: {capsule.cwd}", DIM))
         print()
-        print("Use --force to run anyway, or --dry-run to preview.")
-        return 1
-
-    print(color(f"Replaying: {capsule.command}", BOLD))
-    print(color(f"In: {capsule.cwd}", DIM))
-    print()
 
-    new_capsule = replay_command(capsule)
-    if new_capsule is None:
-        return 1
+        new_capsule = replay_command(capsule)
+        if new_capsule is None:
+            return 1
 
-    store.store_capsule(new_capsule)
-    print(format_capture_result(new_capsule.id, new_capsule.exit_code, new_capsule.duration_ms))
+        store.store_capsule(new_capsule)
+        print(format_capture_result(new_capsule.id, new_capsule.exit_code, new_capsule.duration_ms))
 
     if new_capsule.stdout:
         print()
@@ -358,6 +353,10 @@ def _cmd_replay(args: argparse.Namespace) -> int:
 
 
 def _cmd_decide(args: argparse.Namespace) -> int:
+    from .decision import Decision, parse_refs
+    from .display import format_decision_created
+    from .store import WorkbenchStore
+
     if not args.statement:
         print("Error: statement is required", file=sys.stderr)
         return 1
@@ -376,6 +375,11 @@ def _cmd_decide(args: argparse.Namespace) -> int:
 
 
 def _cmd_decisions(args: argparse.Namespace) -> int:
+    from datetime import datetime, timezone
+
+    from .display import BOLD, DIM, color, format_decision_row
+    from .store import WorkbenchStore
+
     store = WorkbenchStore()
     decisions = store.list_decisions(
         limit=args.limit,
@@ -390,8 +394,8 @@ def _cmd_decisions(args: argparse.Namespace) -> int:
     print(color(f"{'ID':<12}  {'When':>12}  Statement", BOLD))
     print(color("─" * 80, DIM))
 
-    for dec in decisions:
-        print(format_decision_row(dec))
+    now = datetime.now(timezone.utc)
+    print("\n".join([format_decision_row(dec, now) for dec in decisions]))
 
     print()
     print(color(f"{len(decisions)} decision(s)", DIM))
@@ -399,6 +403,9 @@ def _cmd_decisions(args: argparse.Namespace) -> int:
 
 
 def _cmd_show_decision(args: argparse.Namespace) -> int:
+    from .display import format_decision_detail
+    from .store import WorkbenchStore
+
     store = WorkbenchStore()
     decision = store.get_decision(args.id)
 
@@ -411,6 +418,9 @@ def _cmd_show_decision(args: argparse.Namespace) -> int:
 
 
 def _cmd_supersede(args: argparse.Namespace) -> int:
+    from .display import format_decision_superseded
+    from .store import WorkbenchStore
+
     if not args.statement:
         print("Error: new statement is required", file=sys.stderr)
         return 1
@@ -435,6 +445,10 @@ def _cmd_supersede(args: argparse.Namespace) -> int:
 
 
 def _cmd_hypothesis(args: argparse.Namespace) -> int:
+    from .display import format_hypothesis_created
+    from .hypothesis import Hypothesis
+    from .store import WorkbenchStore
+
     if not args.statement:
         print("Error: statement is required", file=sys.stderr)
         return 1
@@ -452,6 +466,11 @@ def _cmd_hypothesis(args: argparse.Namespace) -> int:
 
 
 def _cmd_hypotheses(args: argparse.Namespace) -> int:
+    from datetime import datetime, timezone
+
+    from .display import BOLD, DIM, color, format_hypothesis_row
+    from .store import WorkbenchStore
+
     store = WorkbenchStore()
     hypotheses = store.list_hypotheses(
         limit=args.limit,
@@ -466,8 +485,8 @@ def _cmd_hypotheses(args: argparse.Namespace) -> int:
     print(color(f"{'ID':<12}  {'Status':>10}  {'When':>12}  Statement", BOLD))
     print(color("─" * 80, DIM))
 
-    for hyp in hypotheses:
-        print(format_hypothesis_row(hyp))
+    now = datetime.now(timezone.utc)
+    print("\n".join([format_hypothesis_row(hyp, now) for hyp in hypotheses]))
 
     print()
     print(color(f"{len(hypotheses)} hypothesis/hypotheses", DIM))
@@ -475,6 +494,9 @@ def _cmd_hypotheses(args: argparse.Namespace) -> int:
 
 
 def _cmd_show_hypothesis(args: argparse.Namespace) -> int:
+    from .display import format_hypothesis_detail
+    from .store import WorkbenchStore
+
     store = WorkbenchStore()
     hypothesis = store.get_hypothesis(args.id)
 
@@ -487,6 +509,9 @@ def _cmd_show_hypothesis(args: argparse.Namespace) -> int:
 
 
 def _cmd_confirm(args: argparse.Namespace) -> int:
+    from .display import format_hypothesis_confirmed
+    from .store import WorkbenchStore
+
     store = WorkbenchStore()
 
     try:
@@ -507,6 +532,9 @@ def _cmd_confirm(args: argparse.Namespace) -> int:
 
 
 def _cmd_falsify(args: argparse.Namespace) -> int:
+    from .display import format_hypothesis_falsified
+    from .store import WorkbenchStore
+
     store = WorkbenchStore()
 
     try:
@@ -527,6 +555,9 @@ def _cmd_falsify(args: argparse.Namespace) -> int:
 
 
 def _cmd_link(args: argparse.Namespace) -> int:
+    from .display import format_evidence_added
+    from .store import WorkbenchStore
+
     store = WorkbenchStore()
 
     try:
@@ -547,6 +578,10 @@ def _cmd_link(args: argparse.Namespace) -> int:
 
 
 def _cmd_connect(args: argparse.Namespace) -> int:
+    from .display import format_link_created
+    from .link import parse_artifact_id
+    from .store import WorkbenchStore
+
     store = WorkbenchStore()
 
     src_id, src_type = parse_artifact_id(args.source)
@@ -569,6 +604,10 @@ def _cmd_connect(args: argparse.Namespace) -> int:
 
 
 def _cmd_disconnect(args: argparse.Namespace) -> int:
+    from .display import format_link_deleted
+    from .link import parse_artifact_id
+    from .store import WorkbenchStore
+
     store = WorkbenchStore()
 
     src_id, _ = parse_artifact_id(args.source)
@@ -585,6 +624,11 @@ def _cmd_disconnect(args: argparse.Namespace) -> int:
 
 
 def _cmd_links(args: argparse.Namespace) -> int:
+    from datetime import datetime, timezone
+
+    from .display import BOLD, DIM, color, format_link_row
+    from .store import WorkbenchStore
+
     store = WorkbenchStore()
 
     links = store.get_all_links(
@@ -599,8 +643,8 @@ def _cmd_links(args: argparse.Namespace) -> int:
     print(color("Source                    Relation        Target", BOLD))
     print(color("─" * 70, DIM))
 
-    for link in links:
-        print(format_link_row(link))
+    now = datetime.now(timezone.utc)
+    print("\n".join([format_link_row(link, now) for link in links]))
 
     print()
     print(color(f"{len(links)} link(s)", DIM))
@@ -608,6 +652,10 @@ def _cmd_links(args: argparse.Namespace) -> int:
 
 
 def _cmd_graph(args: argparse.Namespace) -> int:
+    from .display import format_graph
+    from .link import parse_artifact_id
+    from .store import WorkbenchStore
+
     store = WorkbenchStore()
 
     artifact_id, artifact_type = parse_artifact_id(args.artifact)
@@ -627,6 +675,11 @@ def _cmd_graph(args: argparse.Namespace) -> int:
 
 
 def _cmd_timeline(args: argparse.Namespace) -> int:
+    from datetime import datetime, timezone
+
+    from .display import BOLD, DIM, color, format_timeline_row
+    from .store import WorkbenchStore
+
     store = WorkbenchStore()
 
     types = None
@@ -645,8 +698,8 @@ def _cmd_timeline(args: argparse.Namespace) -> int:
     print(color("Type  ID            When          Summary", BOLD))
     print(color("─" * 80, DIM))
 
-    for item in timeline:
-        print(format_timeline_row(item))
+    now = datetime.now(timezone.utc)
+    print("\n".join([format_timeline_row(item, now) for item in timeline]))
 
     print()
     print(color(f"{len(timeline)} artifact(s)", DIM))
@@ -654,6 +707,16 @@ def _cmd_timeline(args: argparse.Namespace) -> int:
 
 
 def _cmd_export(args: argparse.Namespace) -> int:
+    from .export import (
+        export_artifact_json,
+        export_artifact_markdown,
+        export_json_to,
+        export_markdown,
+        export_vhs,
+    )
+    from .link import parse_artifact_id
+    from .store import WorkbenchStore
+
     store = WorkbenchStore()
 
     fmt = args.format or "markdown"
@@ -678,7 +741,10 @@ def _cmd_export(args: argparse.Namespace) -> int:
         artifact_type = args.type
 
         if fmt == "json":
-            output = export_json(store, artifact_type, include_links=not args.no_links)
+            # Stream the full export instead of building it as one string
+            export_json_to(sys.stdout, store, artifact_type, include_links=not args.no_links)
+            print()
+            return 0
         elif fmt == "markdown":
             output = export_markdown(store, artifact_type, include_links=not args.no_links)
         elif fmt == "vhs":
@@ -689,3 +755,51 @@ def _cmd_export(args: argparse.Namespace) -> int:
 
     print(output)
     return 0
+
+
+_DISPATCH: dict[str, Callable[[argparse.Namespace], int]] = {
+    "capture": _cmd_capture,
+    "show": _cmd_show,
+    "capsules": _cmd_capsules,
+    "replay": _cmd_replay,
+    "decide": _cmd_decide,
+    "decisions": _cmd_decisions,
+    "show-decision": _cmd_show_decision,
+    "supersede": _cmd_supersede,
+    "hypothesis": _cmd_hypothesis,
+    "hypotheses": _cmd_hypotheses,
+    "show-hypothesis": _cmd_show_hypothesis,
+    "confirm": _cmd_confirm,
+    "falsify": _cmd_falsify,
+    "link": _cmd_link,
+    "connect": _cmd_connect,
+    "disconnect": _cmd_disconnect,
+    "links": _cmd_links,
+    "graph": _cmd_graph,
+    "timeline": _cmd_timeline,
+    "export": _cmd_export,
+}
+
+
+_COMMANDS: dict[str, tuple[str, Callable[[argparse.ArgumentParser], None]]] = {
+    "capture": ("Capture a command execution", _capture_args),
+    "show": ("Show capsule details", _show_args),
+    "capsules": ("List capsules", _capsules_args),
+    "replay": ("Re-run a captured command", _replay_args),
+    "decide": ("Record a decision", _decide_args),
+    "decisions": ("List decisions", _decisions_args),
+    "show-decision": ("Show decision details", _show_decision_args),
+    "supersede": ("Supersede a decision", _supersede_args),
+    "hypothesis": ("Create a hypothesis", _hypothesis_args),
+    "hypotheses": ("List hypotheses", _hypotheses_args),
+    "show-hypothesis": ("Show hypothesis details", _show_hypothesis_args),
+    "confirm": ("Confirm a hypothesis", _confirm_args),
+    "falsify": ("Falsify a hypothesis", _falsify_args),
+    "link": ("Link evidence to a hypothesis", _link_args),
+    "connect": ("Create a link between artifacts", _connect_args),
+    "disconnect": ("Remove a link", _disconnect_args),
+    "links": ("List links", _links_args),
+    "graph": ("Show graph around an artifact", _graph_args),
+    "timeline": ("Show artifact timeline", _timeline_args),
+    "export": ("Export artifacts", _export_args),
+}
@@ -7,18 +7,19 @@ artifacts (low churn) that answer "why did we choose X?".
 
 from __future__ import annotations
 
-import secrets
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
+from ._ids import short_random_hex
+
 
 def generate_decision_id() -> str:
     """Generate a short random decision ID.
 
     Returns:
-        ID in format 'dec-xxxxxx' (6 hex chars).
+        ID in format 'dec-xxxxxx' (6 hex chars, 24 random bits).
     """
-    return f"dec-{secrets.token_hex(3)}"
+    return f"dec-{short_random_hex()}"
 
 
 @dataclass
@@ -96,4 +97,5 @@ def parse_refs(refs_str: str | None) -> list[str]:
     """
     if not refs_str:
         return []
-    return [r.strip() for r in refs_str.split(",") if r.strip()]
+    # Strip each piece once; a regex split measured slower than this
+    return [r for r in map(str.strip, refs_str.split(",")) if r]
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import os
+import sys
+from datetime import datetime, timezone
+from functools import lru_cache
 
 # ANSI color codes
 RESET = "\033[0m"
@@ -15,11 +18,11 @@ BLUE = "\033[34m"
 CYAN = "\033[36m"
 
 
-def supports_color() -> bool:
-    """Check if terminal supports color."""
-    import os
-    import sys
+_color_override: bool | None = None
+
 
+@lru_cache(maxsize=1)
+def _detect_color() -> bool:
     if not sys.stdout.isatty():
         return False
     if os.environ.get("NO_COLOR"):
@@ -29,6 +32,19 @@ def supports_color() -> bool:
     return True
 
 
+def supports_color() -> bool:
+    """Check if terminal supports color (probed once per process)."""
+    if _color_override is not None:
+        return _color_override
+    return _detect_color()
+
+
+def enable_color(enabled: bool | None) -> None:
+    """Force color on or off; None restores terminal detection."""
+    global _color_override
+    _color_override = enabled
+
+
 def color(text: str, code: str) -> str:
     """Apply color if supported."""
     if supports_color():
@@ -36,8 +52,9 @@ def color(text: str, code: str) -> str:
     return text
 
 
+@lru_cache(maxsize=1024)
 def format_duration(ms: int) -> str:
-    """Format duration in human-readable form."""
+    """Format duration in human-readable form (memoized; durations repeat)."""
     if ms < 1000:
         return f"{ms}ms"
     elif ms < 60000:
@@ -48,20 +65,47 @@ def format_duration(ms: int) -> str:
         return f"{minutes}m{seconds}s"
 
 
-def format_timestamp(ts: datetime | str) -> str:
-    """Format timestamp for display."""
-    if isinstance(ts, str):
-        ts = datetime.fromisoformat(ts)
+@lru_cache(maxsize=4096)
+def _parse_iso(ts: str) -> datetime:
+    """Parse a stored ISO timestamp (as UTC if naive); cached since ids repeat."""
+    parsed = datetime.fromisoformat(ts)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
 
-    # Show relative time if recent
-    from datetime import timezone
 
-    now = datetime.now(timezone.utc)
+def format_timestamp(ts: datetime | str, now: datetime | None = None) -> str:
+    """Format timestamp for display.
+
+    Pass ``now`` when formatting many rows so the clock is read once.
+    """
+    if isinstance(ts, str):
+        return _format_ts_iso(ts, now)
     if ts.tzinfo is None:
         ts = ts.replace(tzinfo=timezone.utc)
+    return _format_ts_dt(ts, now)
+
+
+def _format_ts_iso(ts: str | datetime, now: datetime | None) -> str:
+    """format_timestamp() for the ISO strings the store returns.
 
-    delta = now - ts
-    seconds = delta.total_seconds()
+    Row formatters call this directly so store rows skip the type dispatch;
+    a datetime (a row built in memory) still works via the slow path.
+    """
+    try:
+        parsed = _parse_iso(ts)
+    except TypeError:
+        return format_timestamp(ts, now)
+    return _format_ts_dt(parsed, now)
+
+
+def _format_ts_dt(ts: datetime, now: datetime | None) -> str:
+    """format_timestamp() for an aware datetime."""
+    # Show relative time if recent
+    if now is None:
+        now = datetime.now(timezone.utc)
+
+    seconds = (now - ts).total_seconds()
 
     if seconds < 60:
         return "just now"
@@ -90,12 +134,27 @@ def truncate(text: str, max_len: int = 60) -> str:
     return text[: max_len - 3] + "..."
 
 
-def format_capsule_row(capsule: dict) -> str:
+def _utf8_len(text: str) -> int:
+    """UTF-8 byte length, without encoding the (common) pure-ASCII case."""
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+def _head_lines(text: str, n: int) -> list[str]:
+    """First n lines of text, without copying or splitting the rest."""
+    end = -1
+    for _ in range(n):
+        end = text.find("\n", end + 1)
+        if end < 0:
+            return text.split("\n")
+    return text[:end].split("\n")
+
+
+def format_capsule_row(capsule: dict, now: datetime | None = None) -> str:
     """Format a capsule for list display (single row)."""
     cap_id = color(f"capsule:{capsule['id']}", CYAN)
     exit_code = format_exit_code(capsule["exit_code"])
     duration = color(format_duration(capsule["duration_ms"]), DIM)
-    timestamp = color(format_timestamp(capsule["started_at"]), DIM)
+    timestamp = color(_format_ts_iso(capsule["started_at"], now), DIM)
     command = truncate(capsule["command"], 50)
 
     return f"{cap_id}  {exit_code}  {duration:>8}  {timestamp:>12}  {command}"
@@ -122,8 +181,8 @@ def format_capsule_detail(
     # Output sizes
     stdout = capsule.get("stdout", "")
     stderr = capsule.get("stderr", "")
-    stdout_size = len(stdout.encode("utf-8")) if stdout else 0
-    stderr_size = len(stderr.encode("utf-8")) if stderr else 0
+    stdout_size = capsule.get("stdout_bytes") or _utf8_len(stdout)
+    stderr_size = capsule.get("stderr_bytes") or _utf8_len(stderr)
 
     lines.append("")
     lines.append(f"  {color('stdout:', BOLD)} {stdout_size} bytes")
@@ -147,20 +206,20 @@ def format_capsule_detail(
         if stdout:
             lines.append("")
             lines.append(color("─── stdout (preview) ───", DIM))
-            preview_lines = stdout.split("\n")[:5]
-            for line in preview_lines:
+            for line in _head_lines(stdout, 5):
                 lines.append(truncate(line, 80))
-            if len(stdout.split("\n")) > 5:
-                lines.append(color(f"  ... ({len(stdout.split(chr(10)))} lines total)", DIM))
+            total = stdout.count("\n") + 1
+            if total > 5:
+                lines.append(color(f"  ... ({total} lines total)", DIM))
 
         if stderr:
             lines.append("")
             lines.append(color("─── stderr (preview) ───", DIM))
-            preview_lines = stderr.split("\n")[:3]
-            for line in preview_lines:
+            for line in _head_lines(stderr, 3):
                 lines.append(truncate(line, 80))
-            if len(stderr.split("\n")) > 3:
-                lines.append(color(f"  ... ({len(stderr.split(chr(10)))} lines total)", DIM))
+            total = stderr.count("\n") + 1
+            if total > 3:
+                lines.append(color(f"  ... ({total} lines total)", DIM))
 
     return "\n".join(lines)
 
@@ -192,10 +251,10 @@ def format_capture_result(capsule_id: str, exit_code: int, duration_ms: int) ->
 MAGENTA = "\033[35m"
 
 
-def format_decision_row(decision: dict) -> str:
+def format_decision_row(decision: dict, now: datetime | None = None) -> str:
     """Format a decision for list display (single row)."""
     dec_id = color(decision["id"], MAGENTA)
-    timestamp = color(format_timestamp(decision["created_at"]), DIM)
+    timestamp = color(_format_ts_iso(decision["created_at"], now), DIM)
     statement = truncate(decision["statement"], 55)
 
     # Show superseded status
@@ -210,10 +269,12 @@ def format_decision_row(decision: dict) -> str:
 def format_decision_detail(decision: dict) -> str:
     """Format a decision for detailed display."""
     lines = []
+    superseded_by = decision.get("superseded_by")
+    reason = decision.get("reason")
 
     # Header with status
     status = ""
-    if decision.get("superseded_by"):
+    if superseded_by:
         status = color(" [superseded]", YELLOW)
     lines.append(color(f"Decision: {decision['id']}", BOLD + MAGENTA) + status)
     lines.append("")
@@ -222,8 +283,8 @@ def format_decision_detail(decision: dict) -> str:
     lines.append(f"  {color('Statement:', BOLD)} {decision['statement']}")
 
     # Reason
-    if decision.get("reason"):
-        lines.append(f"  {color('Reason:', BOLD)} {decision['reason']}")
+    if reason:
+        lines.append(f"  {color('Reason:', BOLD)} {reason}")
 
     # Refs
     refs = decision.get("refs", [])
@@ -234,11 +295,9 @@ def format_decision_detail(decision: dict) -> str:
     lines.append(f"  {color('Created:', BOLD)} {format_timestamp(decision['created_at'])}")
 
     # Superseded info
-    if decision.get("superseded_by"):
+    if superseded_by:
         lines.append("")
-        lines.append(
-            color(f"  Superseded by: {decision['superseded_by']}", YELLOW)
-        )
+        lines.append(color(f"  Superseded by: {superseded_by}", YELLOW))
 
     return "\n".join(lines)
 
@@ -272,11 +331,11 @@ def format_hypothesis_status(status: str) -> str:
     return status
 
 
-def format_hypothesis_row(hypothesis: dict) -> str:
+def format_hypothesis_row(hypothesis: dict, now: datetime | None = None) -> str:
     """Format a hypothesis for list display (single row)."""
     hyp_id = color(hypothesis["id"], ORANGE)
     status = format_hypothesis_status(hypothesis["status"])
-    timestamp = color(format_timestamp(hypothesis["created_at"]), DIM)
+    timestamp = color(_format_ts_iso(hypothesis["created_at"], now), DIM)
     statement = truncate(hypothesis["statement"], 50)
 
     return f"{hyp_id}  {status:>12}  {timestamp:>12}  {statement}"
@@ -296,25 +355,23 @@ def format_hypothesis_detail(hypothesis: dict) -> str:
     lines.append(f"  {color('Statement:', BOLD)} {hypothesis['statement']}")
 
     # Test method
-    if hypothesis.get("test"):
-        lines.append(f"  {color('Test:', BOLD)} {hypothesis['test']}")
+    if test := hypothesis.get("test"):
+        lines.append(f"  {color('Test:', BOLD)} {test}")
 
     # Disconfirmer
-    if hypothesis.get("disconfirmer"):
-        lines.append(f"  {color('Disconfirmer:', BOLD)} {hypothesis['disconfirmer']}")
+    if disconfirmer := hypothesis.get("disconfirmer"):
+        lines.append(f"  {color('Disconfirmer:', BOLD)} {disconfirmer}")
 
     # Timestamps
     lines.append(f"  {color('Created:', BOLD)} {format_timestamp(hypothesis['created_at'])}")
 
-    if hypothesis.get("resolved_at"):
-        lines.append(
-            f"  {color('Resolved:', BOLD)} {format_timestamp(hypothesis['resolved_at'])}"
-        )
+    if resolved_at := hypothesis.get("resolved_at"):
+        lines.append(f"  {color('Resolved:', BOLD)} {format_timestamp(resolved_at)}")
 
     # Resolution note
-    if hypothesis.get("resolution_note"):
+    if note := hypothesis.get("resolution_note"):
         lines.append("")
-        lines.append(f"  {color('Note:', BOLD)} {hypothesis['resolution_note']}")
+        lines.append(f"  {color('Note:', BOLD)} {note}")
 
     # Evidence
     evidence = hypothesis.get("evidence", [])
@@ -322,7 +379,8 @@ def format_hypothesis_detail(hypothesis: dict) -> str:
         lines.append("")
         lines.append(f"  {color('Evidence:', BOLD)}")
         for e in evidence:
-            rel = color(e["relation"], GREEN if e["relation"] == "supports" else RED)
+            relation = e["relation"]
+            rel = color(relation, GREEN if relation == "supports" else RED)
             lines.append(f"    - {e['artifact_type']}:{e['artifact_id']} ({rel})")
 
     return "\n".join(lines)
@@ -357,23 +415,33 @@ def format_evidence_added(hypothesis_id: str, artifact_id: str, relation: str) -
 WHITE = "\033[37m"
 
 
-def format_link_row(link: dict) -> str:
+# Row colors by relation / artifact type (built once, not per row)
+_RELATION_COLORS = {
+    "evidence": GREEN,
+    "falsifies": RED,
+    "implements": BLUE,
+    "refs": CYAN,
+    "supersedes": YELLOW,
+    "related": WHITE,
+}
+_NODE_TYPE_COLORS = {
+    "capsule": CYAN,
+    "decision": MAGENTA,
+    "hypothesis": ORANGE,
+    "symbol": WHITE,
+    "patch": GREEN,
+    "task": BLUE,
+}
+
+
+def format_link_row(link: dict, now: datetime | None = None) -> str:
     """Format a link for list display (single row)."""
     src = f"{link['src_type']}:{link['src_id'][:8]}"
     dst = f"{link['dst_type']}:{link['dst_id'][:8]}"
     relation = link["relation"]
-    timestamp = color(format_timestamp(link["created_at"]), DIM)
-
-    # Color-code relation
-    rel_colors = {
-        "evidence": GREEN,
-        "falsifies": RED,
-        "implements": BLUE,
-        "refs": CYAN,
-        "supersedes": YELLOW,
-        "related": WHITE,
-    }
-    rel_color = rel_colors.get(relation, WHITE)
+    timestamp = color(_format_ts_iso(link["created_at"], now), DIM)
+
+    rel_color = _RELATION_COLORS.get(relation, WHITE)
 
     return (
         f"{color(src, CYAN)} --{color(relation, rel_color)}--> "
@@ -394,43 +462,48 @@ def format_link_deleted(src: str, dst: str, relation: str) -> str:
 # Timeline formatting (Phase 4)
 
 
-def format_timeline_row(item: dict) -> str:
+def _capsule_status(data: dict) -> str:
+    exit_code = data.get("exit_code", 0)
+    return color(f" [exit {exit_code}]", RED) if exit_code != 0 else ""
+
+
+def _decision_status(data: dict) -> str:
+    return color(" [superseded]", DIM) if data.get("superseded_by") else ""
+
+
+def _hypothesis_status(data: dict) -> str:
+    hyp_status = data.get("status", "active")
+    if hyp_status == "confirmed":
+        return color(" [confirmed]", GREEN)
+    elif hyp_status == "falsified":
+        return color(" [falsified]", RED)
+    return ""
+
+
+def _no_status(data: dict) -> str:
+    return ""
+
+
+# type -> (color, indicator, status formatter); one lookup per row
+_TIMELINE_TYPES = {
+    "capsule": (CYAN, "CAP", _capsule_status),
+    "decision": (MAGENTA, "DEC", _decision_status),
+    "hypothesis": (ORANGE, "HYP", _hypothesis_status),
+}
+_TIMELINE_DEFAULT = (WHITE, "???", _no_status)
+
+
+def format_timeline_row(item: dict, now: datetime | None = None) -> str:
     """Format a timeline item for list display."""
-    artifact_type = item["type"]
     artifact_id = item["id"]
     summary = truncate(item["summary"], 50)
-    timestamp = color(format_timestamp(item["created_at"]), DIM)
-
-    # Color by type
-    type_colors = {
-        "capsule": CYAN,
-        "decision": MAGENTA,
-        "hypothesis": ORANGE,
-    }
-    type_color = type_colors.get(artifact_type, WHITE)
-
-    # Type indicator
-    type_indicator = {
-        "capsule": "CAP",
-        "decision": "DEC",
-        "hypothesis": "HYP",
-    }.get(artifact_type, "???")
-
-    # For hypotheses/decisions, show status
-    status = ""
-    if artifact_type == "hypothesis":
-        hyp_status = item["data"].get("status", "active")
-        if hyp_status == "confirmed":
-            status = color(" [confirmed]", GREEN)
-        elif hyp_status == "falsified":
-            status = color(" [falsified]", RED)
-    elif artifact_type == "decision":
-        if item["data"].get("superseded_by"):
-            status = color(" [superseded]", DIM)
-    elif artifact_type == "capsule":
-        exit_code = item["data"].get("exit_code", 0)
-        if exit_code != 0:
-            status = color(f" [exit {exit_code}]", RED)
+    timestamp = color(_format_ts_iso(item["created_at"], now), DIM)
+
+    type_color, type_indicator, status_fn = _TIMELINE_TYPES.get(
+        item["type"], _TIMELINE_DEFAULT
+    )
+    # For hypotheses/decisions/capsules, show status
+    status = status_fn(item["data"])
 
     id_display = artifact_id[:12] if len(artifact_id) > 12 else artifact_id
 
@@ -445,15 +518,7 @@ def format_graph_node(node: dict) -> str:
     node_type = node["type"]
     node_id = node["id"]
 
-    type_colors = {
-        "capsule": CYAN,
-        "decision": MAGENTA,
-        "hypothesis": ORANGE,
-        "symbol": WHITE,
-        "patch": GREEN,
-        "task": BLUE,
-    }
-    type_color = type_colors.get(node_type, WHITE)
+    type_color = _NODE_TYPE_COLORS.get(node_type, WHITE)
 
     return f"{color(f'{node_type}:{node_id}', type_color)}"
 
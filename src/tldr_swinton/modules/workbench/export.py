@@ -7,13 +7,29 @@ and JSON (machine-readable) formats.
 from __future__ import annotations
 
 import hashlib
+import io
 import json
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TextIO
+
+from .. import _json
 
 if TYPE_CHECKING:
     from .store import WorkbenchStore
 
+_EXIT_OK_EMOJI = "\u2705"  # ✅
+_EXIT_FAIL_EMOJI = "\u274c"  # ❌
+_HYP_STATUS_EMOJI = {
+    "active": "\u2753",  # ❓
+    "confirmed": _EXIT_OK_EMOJI,
+    "falsified": _EXIT_FAIL_EMOJI,
+}
+
+
+def _dumps(obj, pretty: bool) -> str:
+    """Serialize an export document (same text with or without orjson)."""
+    return _json.dumps(obj, indent=pretty, default=str).decode()
+
 
 def export_vhs(store: "WorkbenchStore", artifact_type: str | None = None) -> str:
     """Export artifacts as a VHS reference.
@@ -33,7 +49,7 @@ def export_vhs(store: "WorkbenchStore", artifact_type: str | None = None) -> str
 
     # Create content hash
     content = json.dumps(timeline, sort_keys=True, default=str)
-    hash_hex = hashlib.sha256(content.encode()).hexdigest()[:16]
+    hash_hex = hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
 
     return f"vhs://{hash_hex}"
 
@@ -62,72 +78,60 @@ def export_markdown(
     lines.append(f"*Exported: {datetime.now().strftime('%Y-%m-%d %H:%M')}*")
     lines.append("")
 
-    # Group by type
-    capsules = [t for t in timeline if t["type"] == "capsule"]
-    decisions = [t for t in timeline if t["type"] == "decision"]
-    hypotheses = [t for t in timeline if t["type"] == "hypothesis"]
+    # Group each type's data dicts in a single pass over the timeline
+    groups: dict[str, list[dict]] = {"capsule": [], "decision": [], "hypothesis": []}
+    for t in timeline:
+        groups[t["type"]].append(t["data"])
+    capsules = groups["capsule"]
+    decisions = groups["decision"]
+    hypotheses = groups["hypothesis"]
 
     if decisions:
         lines.append("## Decisions")
         lines.append("")
-        for item in decisions:
-            dec = item["data"]
+        # One string per artifact: far fewer appends on large exports
+        for dec in decisions:
             status = " *(superseded)*" if dec.get("superseded_by") else ""
-            lines.append(f"### `{dec['id']}`{status}")
-            lines.append("")
-            lines.append(f"**{dec['statement']}**")
+            block = f"### `{dec['id']}`{status}\n\n**{dec['statement']}**"
             if dec.get("reason"):
-                lines.append("")
-                lines.append(f"*Reason:* {dec['reason']}")
+                block += f"\n\n*Reason:* {dec['reason']}"
             if dec.get("refs"):
-                lines.append("")
-                lines.append(f"*Affects:* `{', '.join(dec['refs'])}`")
-            lines.append("")
+                block += f"\n\n*Affects:* `{', '.join(dec['refs'])}`"
+            lines.append(block + "\n")
 
     if hypotheses:
         lines.append("## Hypotheses")
         lines.append("")
-        for item in hypotheses:
-            hyp = item["data"]
-            status_emoji = {
-                "active": "\u2753",  # ❓
-                "confirmed": "\u2705",  # ✅
-                "falsified": "\u274c",  # ❌
-            }.get(hyp["status"], "")
-            lines.append(f"### `{hyp['id']}` {status_emoji}")
-            lines.append("")
-            lines.append(f"**{hyp['statement']}**")
-            lines.append("")
-            lines.append(f"*Status:* {hyp['status']}")
+        for hyp in hypotheses:
+            status_emoji = _HYP_STATUS_EMOJI.get(hyp["status"], "")
+            block = (
+                f"### `{hyp['id']}` {status_emoji}\n\n"
+                f"**{hyp['statement']}**\n\n"
+                f"*Status:* {hyp['status']}"
+            )
             if hyp.get("test"):
-                lines.append(f"*Test:* {hyp['test']}")
+                block += f"\n*Test:* {hyp['test']}"
             if hyp.get("disconfirmer"):
-                lines.append(f"*Disconfirmer:* {hyp['disconfirmer']}")
+                block += f"\n*Disconfirmer:* {hyp['disconfirmer']}"
             if hyp.get("resolution_note"):
-                lines.append(f"*Note:* {hyp['resolution_note']}")
+                block += f"\n*Note:* {hyp['resolution_note']}"
             if hyp.get("evidence"):
-                lines.append("")
-                lines.append("*Evidence:*")
-                for ev in hyp["evidence"]:
-                    lines.append(
-                        f"  - `{ev['artifact_type']}:{ev['artifact_id']}` ({ev['relation']})"
-                    )
-            lines.append("")
+                block += "\n\n*Evidence:*" + "".join(
+                    f"\n  - `{ev['artifact_type']}:{ev['artifact_id']}` ({ev['relation']})"
+                    for ev in hyp["evidence"]
+                )
+            lines.append(block + "\n")
 
     if capsules:
         lines.append("## Capsules")
         lines.append("")
-        for item in capsules:
-            cap = item["data"]
-            exit_emoji = "\u2705" if cap["exit_code"] == 0 else "\u274c"
-            lines.append(f"### `capsule:{cap['id'][:12]}` {exit_emoji}")
-            lines.append("")
-            lines.append("```bash")
-            lines.append(f"{cap['command']}")
-            lines.append("```")
-            lines.append("")
-            lines.append(f"*Exit:* {cap['exit_code']} | *Duration:* {cap['duration_ms']}ms")
-            lines.append("")
+        for cap in capsules:
+            exit_emoji = _EXIT_OK_EMOJI if cap["exit_code"] == 0 else _EXIT_FAIL_EMOJI
+            lines.append(
+                f"### `capsule:{cap['id'][:12]}` {exit_emoji}\n\n"
+                f"```bash\n{cap['command']}\n```\n\n"
+                f"*Exit:* {cap['exit_code']} | *Duration:* {cap['duration_ms']}ms\n"
+            )
 
     # Links section
     if include_links:
@@ -163,6 +167,19 @@ def export_json(
     Returns:
         JSON formatted string.
     """
+    buf = io.StringIO()
+    export_json_to(buf, store, artifact_type, include_links=include_links, pretty=pretty)
+    return buf.getvalue()
+
+
+def export_json_to(
+    fp: TextIO,
+    store: "WorkbenchStore",
+    artifact_type: str | None = None,
+    include_links: bool = True,
+    pretty: bool = True,
+) -> None:
+    """Write the export_json() document to a text stream."""
     types = [artifact_type] if artifact_type else None
     timeline = store.export_timeline(artifact_types=types)
 
@@ -174,9 +191,7 @@ def export_json(
     if include_links:
         result["links"] = store.get_all_links(limit=100)
 
-    if pretty:
-        return json.dumps(result, indent=2, default=str)
-    return json.dumps(result, default=str)
+    fp.write(_dumps(result, pretty))
 
 
 def export_artifact_markdown(
@@ -309,6 +324,4 @@ def export_artifact_json(
     if exported is None:
         return None
 
-    if pretty:
-        return json.dumps(exported, indent=2, default=str)
-    return json.dumps(exported, default=str)
+    return _dumps(exported, pretty)
@@ -7,11 +7,16 @@ ruled out.
 
 from __future__ import annotations
 
-import secrets
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 
+from ._ids import short_random_hex
+
+# Bound once: record creation is the hot path in bulk ingest
+_NOW = datetime.now
+_UTC = timezone.utc
+
 
 class HypothesisStatus(str, Enum):
     """Hypothesis lifecycle status."""
@@ -21,16 +26,19 @@ class HypothesisStatus(str, Enum):
     FALSIFIED = "falsified"
 
 
+_STATUS_BY_VALUE = {s.value: s for s in HypothesisStatus}
+
+
 def generate_hypothesis_id() -> str:
     """Generate a short random hypothesis ID.
 
     Returns:
-        ID in format 'hyp-xxxxxx' (6 hex chars).
+        ID in format 'hyp-xxxxxx' (6 hex chars, 24 random bits).
     """
-    return f"hyp-{secrets.token_hex(3)}"
+    return f"hyp-{short_random_hex()}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Hypothesis:
     """A testable claim about system behavior."""
 
@@ -49,6 +57,8 @@ class Hypothesis:
         statement: str,
         test: str | None = None,
         disconfirmer: str | None = None,
+        *,
+        now: datetime | None = None,
     ) -> Hypothesis:
         """Create a new active hypothesis.
 
@@ -56,6 +66,7 @@ class Hypothesis:
             statement: The hypothesis statement (the claim).
             test: Optional description of how to test it.
             disconfirmer: Optional description of what would prove it wrong.
+            now: Creation time; pass one value when creating a batch.
 
         Returns:
             New Hypothesis instance with active status.
@@ -66,7 +77,7 @@ class Hypothesis:
             status=HypothesisStatus.ACTIVE,
             test=test,
             disconfirmer=disconfirmer,
-            created_at=datetime.now(timezone.utc),
+            created_at=now or _NOW(_UTC),
             resolved_at=None,
             resolution_note=None,
         )
@@ -82,10 +93,14 @@ class Hypothesis:
         if isinstance(resolved_at, str):
             resolved_at = datetime.fromisoformat(resolved_at)
 
+        # Dict hit for stored values; the Enum call still rejects bad ones
+        status = data["status"]
+        status = _STATUS_BY_VALUE.get(status) or HypothesisStatus(status)
+
         return cls(
             id=data["id"],
             statement=data["statement"],
-            status=HypothesisStatus(data["status"]),
+            status=status,
             test=data.get("test"),
             disconfirmer=data.get("disconfirmer"),
             created_at=created_at,
@@ -93,15 +108,20 @@ class Hypothesis:
             resolution_note=data.get("resolution_note"),
         )
 
+    def __hash__(self) -> int:
+        # Mutable (confirm/falsify), so hash the stable id rather than freezing
+        return hash(self.id)
+
     @property
     def is_active(self) -> bool:
         """Check if hypothesis is still active."""
-        return self.status == HypothesisStatus.ACTIVE
+        return self.status is HypothesisStatus.ACTIVE
 
     @property
     def is_resolved(self) -> bool:
         """Check if hypothesis has been resolved."""
-        return self.status in (HypothesisStatus.CONFIRMED, HypothesisStatus.FALSIFIED)
+        # Three-state lifecycle: anything but active is resolved
+        return self.status is not HypothesisStatus.ACTIVE
 
     def confirm(self, note: str | None = None) -> None:
         """Mark hypothesis as confirmed.
@@ -110,7 +130,7 @@ class Hypothesis:
             note: Optional resolution note.
         """
         self.status = HypothesisStatus.CONFIRMED
-        self.resolved_at = datetime.now(timezone.utc)
+        self.resolved_at = _NOW(_UTC)
         self.resolution_note = note
 
     def falsify(self, note: str | None = None) -> None:
@@ -120,7 +140,7 @@ class Hypothesis:
             note: Optional resolution note.
         """
         self.status = HypothesisStatus.FALSIFIED
-        self.resolved_at = datetime.now(timezone.utc)
+        self.resolved_at = _NOW(_UTC)
         self.resolution_note = note
 
     def format_short(self) -> str:
@@ -129,7 +149,7 @@ class Hypothesis:
         return f"{self.id}: {self.statement}{status_str}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Evidence:
     """A link between a hypothesis and supporting/falsifying evidence."""
 
@@ -146,14 +166,16 @@ class Evidence:
         artifact_id: str,
         artifact_type: str,
         relation: str,
+        *,
+        now: datetime | None = None,
     ) -> Evidence:
-        """Create a new evidence link."""
+        """Create a new evidence link (``now`` lets a batch share one clock read)."""
         return cls(
             hypothesis_id=hypothesis_id,
             artifact_id=artifact_id,
             artifact_type=artifact_type,
             relation=relation,
-            created_at=datetime.now(timezone.utc),
+            created_at=now or _NOW(_UTC),
         )
 
     @classmethod
@@ -172,6 +194,9 @@ class Evidence:
         )
 
 
+_ID_PREFIX_TYPES = {"dec-": "decision", "hyp-": "hypothesis"}
+
+
 def parse_artifact_ref(ref: str) -> tuple[str, str]:
     """Parse an artifact reference into (type, id).
 
@@ -183,10 +208,5 @@ def parse_artifact_ref(ref: str) -> tuple[str, str]:
     """
     if ref.startswith("capsule:"):
         return ("capsule", ref[8:])
-    elif ref.startswith("dec-"):
-        return ("decision", ref)
-    elif ref.startswith("hyp-"):
-        return ("hypothesis", ref)
-    else:
-        # Assume capsule ID without prefix
-        return ("capsule", ref)
+    # Assume capsule ID without prefix
+    return (_ID_PREFIX_TYPES.get(ref[:4], "capsule"), ref)
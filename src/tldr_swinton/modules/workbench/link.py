@@ -6,9 +6,14 @@ and external artifacts (patches, tasks).
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from operator import itemgetter
+
+# Bound once: record creation is the hot path in bulk ingest
+_NOW = datetime.now
+_UTC = timezone.utc
 
 
 class ArtifactType(str, Enum):
@@ -33,16 +38,42 @@ class LinkRelation(str, Enum):
     RELATED = "related"  # General association
 
 
-@dataclass
+# Plain dict lookups; Enum.__call__ is ~10x slower on the hot (valid) path
+_ARTIFACT_BY_VALUE = {t.value: t for t in ArtifactType}
+_RELATION_BY_VALUE = {r.value: r for r in LinkRelation}
+
+
+def _artifact_type(value: str) -> ArtifactType:
+    # Fall back to the Enum call so invalid values still raise ValueError
+    return _ARTIFACT_BY_VALUE.get(value) or ArtifactType(value)
+
+
+def _relation(value: str) -> LinkRelation:
+    return _RELATION_BY_VALUE.get(value) or LinkRelation(value)
+
+
+@dataclass(slots=True)
 class Link:
-    """A typed relationship between two artifacts."""
+    """A typed relationship between two artifacts.
+
+    Links compare equal (and hash alike) when their endpoints and relation
+    match; created_at is ignored, so the same link read back from the store
+    later equals the one that was created.
+    """
 
     src_id: str
     src_type: ArtifactType
     dst_id: str
     dst_type: ArtifactType
     relation: LinkRelation
-    created_at: datetime
+    # Not part of identity: the store keys links by endpoints + relation
+    created_at: datetime = field(compare=False)
+
+    def __hash__(self) -> int:
+        # Lets Links go straight into visited/dedup sets. Hashed by the store's
+        # primary key instead of frozen=True, which made construction ~2.5x
+        # slower; nothing mutates a Link after creation.
+        return hash((self.src_id, self.dst_id, self.relation))
 
     @classmethod
     def create(
@@ -52,6 +83,8 @@ class Link:
         dst_id: str,
         dst_type: ArtifactType | str,
         relation: LinkRelation | str,
+        *,
+        now: datetime | None = None,
     ) -> Link:
         """Create a new link.
 
@@ -61,16 +94,19 @@ class Link:
             dst_id: Destination artifact ID.
             dst_type: Destination artifact type.
             relation: Relationship type.
+            now: Creation time; pass one value when creating a batch.
 
         Returns:
             New Link instance.
         """
-        if isinstance(src_type, str):
-            src_type = ArtifactType(src_type)
-        if isinstance(dst_type, str):
-            dst_type = ArtifactType(dst_type)
-        if isinstance(relation, str):
-            relation = LinkRelation(relation)
+        # Members are str too, so test the exact type: enum members hash by
+        # name and would miss the value tables, taking the slow Enum call
+        if type(src_type) is not ArtifactType:
+            src_type = _artifact_type(src_type)
+        if type(dst_type) is not ArtifactType:
+            dst_type = _artifact_type(dst_type)
+        if type(relation) is not LinkRelation:
+            relation = _relation(relation)
 
         return cls(
             src_id=src_id,
@@ -78,7 +114,7 @@ class Link:
             dst_id=dst_id,
             dst_type=dst_type,
             relation=relation,
-            created_at=datetime.now(timezone.utc),
+            created_at=now or _NOW(_UTC),
         )
 
     @classmethod
@@ -90,32 +126,85 @@ class Link:
 
         return cls(
             src_id=data["src_id"],
-            src_type=ArtifactType(data["src_type"]),
+            src_type=_artifact_type(data["src_type"]),
             dst_id=data["dst_id"],
-            dst_type=ArtifactType(data["dst_type"]),
-            relation=LinkRelation(data["relation"]),
+            dst_type=_artifact_type(data["dst_type"]),
+            relation=_relation(data["relation"]),
             created_at=created_at,
         )
 
+    @classmethod
+    def from_dicts(cls, rows: list[dict]) -> list[Link]:
+        """Create Links from many database dicts (e.g. a store link query)."""
+        fields = itemgetter("src_id", "src_type", "dst_id", "dst_type", "relation", "created_at")
+        artifact_type, relation, parse_ts = _artifact_type, _relation, datetime.fromisoformat
+        return [
+            cls(
+                src_id,
+                artifact_type(src_type),
+                dst_id,
+                artifact_type(dst_type),
+                relation(rel),
+                parse_ts(created_at) if isinstance(created_at, str) else created_at,
+            )
+            for src_id, src_type, dst_id, dst_type, rel, created_at in map(fields, rows)
+        ]
+
     def to_dict(self) -> dict:
         """Convert to dict for storage."""
+        # _value_ is the plain member attribute; .value goes through a
+        # property (~6x slower). The enums themselves can't be used: on
+        # str-mixin enums str()/f-strings give 'ArtifactType.CAPSULE'.
         return {
             "src_id": self.src_id,
-            "src_type": self.src_type.value,
+            "src_type": self.src_type._value_,
             "dst_id": self.dst_id,
-            "dst_type": self.dst_type.value,
-            "relation": self.relation.value,
+            "dst_type": self.dst_type._value_,
+            "relation": self.relation._value_,
             "created_at": self.created_at.isoformat(),
         }
 
+    def fwd_key(self) -> tuple[str, LinkRelation]:
+        """Adjacency key for outgoing-edge indexes: (src_id, relation)."""
+        return (self.src_id, self.relation)
+
+    def rev_key(self) -> tuple[str, LinkRelation]:
+        """Adjacency key for incoming-edge indexes: (dst_id, relation)."""
+        return (self.dst_id, self.relation)
+
+    def as_row(self) -> tuple[str, str, str, str, str, str]:
+        """Column tuple for the links table, in INSERT order.
+
+        Preferred for bulk writes (see WorkbenchStore.create_links): rows
+        bind straight into executemany without building a dict per link.
+        """
+        return (
+            self.src_id,
+            self.src_type._value_,
+            self.dst_id,
+            self.dst_type._value_,
+            self.relation._value_,
+            self.created_at.isoformat(),
+        )
+
     def format_short(self) -> str:
         """Format for brief display."""
         return (
-            f"{self.src_type.value}:{self.src_id} --{self.relation.value}--> "
-            f"{self.dst_type.value}:{self.dst_id}"
+            f"{self.src_type._value_}:{self.src_id} --{self.relation._value_}--> "
+            f"{self.dst_type._value_}:{self.dst_id}"
         )
 
 
+# Bare-ID prefixes that already name their type ('type:id' refs use
+# _ARTIFACT_BY_VALUE)
+_ID_PREFIXES = {
+    "dec-": ArtifactType.DECISION,
+    "hyp-": ArtifactType.HYPOTHESIS,
+    "bd-": ArtifactType.TASK,
+}
+_ID_PREFIX_BY_TYPE = {t: prefix for prefix, t in _ID_PREFIXES.items()}
+
+
 def parse_artifact_id(ref: str) -> tuple[str, ArtifactType]:
     """Parse an artifact reference into (id, type).
 
@@ -125,30 +214,19 @@ def parse_artifact_id(ref: str) -> tuple[str, ArtifactType]:
     Returns:
         Tuple of (artifact_id, artifact_type).
     """
-    if ref.startswith("capsule:"):
-        return (ref[8:], ArtifactType.CAPSULE)
-    elif ref.startswith("decision:"):
-        return (ref[9:], ArtifactType.DECISION)
-    elif ref.startswith("hypothesis:"):
-        return (ref[11:], ArtifactType.HYPOTHESIS)
-    elif ref.startswith("symbol:"):
-        return (ref[7:], ArtifactType.SYMBOL)
-    elif ref.startswith("patch:"):
-        return (ref[6:], ArtifactType.PATCH)
-    elif ref.startswith("task:"):
-        return (ref[5:], ArtifactType.TASK)
-    elif ref.startswith("dec-"):
-        return (ref, ArtifactType.DECISION)
-    elif ref.startswith("hyp-"):
-        return (ref, ArtifactType.HYPOTHESIS)
-    elif ref.startswith("bd-"):
-        return (ref, ArtifactType.TASK)
-    elif ":" in ref and "/" in ref.split(":")[0]:
+    head, sep, rest = ref.partition(":")
+    if sep:
+        artifact_type = _ARTIFACT_BY_VALUE.get(head)
+        if artifact_type is not None:
+            return (rest, artifact_type)
+    artifact_type = _ID_PREFIXES.get(ref[:4]) or _ID_PREFIXES.get(ref[:3])
+    if artifact_type is not None:
+        return (ref, artifact_type)
+    if sep and "/" in head:
         # Looks like a symbol (file:symbol format)
         return (ref, ArtifactType.SYMBOL)
-    else:
-        # Default to capsule
-        return (ref, ArtifactType.CAPSULE)
+    # Default to capsule
+    return (ref, ArtifactType.CAPSULE)
 
 
 def format_artifact_ref(artifact_id: str, artifact_type: ArtifactType) -> str:
@@ -162,11 +240,8 @@ def format_artifact_ref(artifact_id: str, artifact_type: ArtifactType) -> str:
         Formatted reference like 'capsule:abc123'.
     """
     # For IDs that already include the type prefix, return as-is
-    if artifact_type == ArtifactType.DECISION and artifact_id.startswith("dec-"):
-        return artifact_id
-    if artifact_type == ArtifactType.HYPOTHESIS and artifact_id.startswith("hyp-"):
-        return artifact_id
-    if artifact_type == ArtifactType.TASK and artifact_id.startswith("bd-"):
+    id_prefix = _ID_PREFIX_BY_TYPE.get(artifact_type)
+    if id_prefix is not None and artifact_id.startswith(id_prefix):
         return artifact_id
 
     return f"{artifact_type.value}:{artifact_id}"
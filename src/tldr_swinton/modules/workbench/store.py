@@ -10,10 +10,11 @@ import sqlite3
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterator
+from typing import TYPE_CHECKING, Iterable, Iterator
 
 if TYPE_CHECKING:
     from .capsule import Capsule
+    from .link import Link
 
 # Default threshold for inline vs blob storage (4KB)
 BLOB_THRESHOLD = 4096
@@ -41,6 +42,7 @@ class WorkbenchStore:
         self.workbench_dir = get_workbench_dir(project_root)
         self.db_path = self.workbench_dir / "state.db"
         self.blob_dir = self.workbench_dir / "blobs"
+        self._txn_conn: sqlite3.Connection | None = None
         self._ensure_initialized()
 
     def _ensure_initialized(self) -> None:
@@ -252,9 +254,41 @@ class WorkbenchStore:
             (str(SCHEMA_VERSION),),
         )
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group several writes into one connection and one COMMIT.
+
+        Store calls made inside the block share the connection; everything
+        commits together on exit or rolls back together on error. Nested
+        blocks join the outermost transaction.
+        """
+        if self._txn_conn is not None:
+            yield
+            return
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        # Open the transaction up front: sqlite3 only begins one implicitly
+        # before DML, and a SAVEPOINT issued first would otherwise become the
+        # outermost transaction and commit on RELEASE
+        conn.execute("BEGIN")
+        self._txn_conn = conn
+        try:
+            yield
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._txn_conn = None
+            conn.close()
+
     @contextmanager
     def _connect(self) -> Iterator[sqlite3.Connection]:
         """Get a database connection with proper settings."""
+        if self._txn_conn is not None:
+            # Inside transaction(): the outer block owns commit/rollback
+            yield self._txn_conn
+            return
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         try:
@@ -389,17 +423,15 @@ class WorkbenchStore:
 
             result = dict(row)
 
-            # Resolve stdout
-            if result["stdout_ref"]:
-                result["stdout"] = self.load_blob(result["stdout_ref"]).decode("utf-8")
-            else:
-                result["stdout"] = result["stdout_inline"] or ""
-
-            # Resolve stderr
-            if result["stderr_ref"]:
-                result["stderr"] = self.load_blob(result["stderr_ref"]).decode("utf-8")
-            else:
-                result["stderr"] = result["stderr_inline"] or ""
+            # Resolve stdout/stderr; blob sizes come free with the raw bytes
+            for stream in ("stdout", "stderr"):
+                ref = result[f"{stream}_ref"]
+                if ref:
+                    raw = self.load_blob(ref)
+                    result[stream] = raw.decode("utf-8")
+                    result[f"{stream}_bytes"] = len(raw)
+                else:
+                    result[stream] = result[f"{stream}_inline"] or ""
 
             return result
 
@@ -455,6 +487,28 @@ class WorkbenchStore:
             )
             return cursor.fetchone() is not None
 
+    def find_capsule(self, command: str, cwd: str, env_fingerprint: str) -> dict | None:
+        """Get the most recent capsule of a command run in the same context.
+
+        Args:
+            command: Exact command string.
+            cwd: Working directory it ran in.
+            env_fingerprint: Environment fingerprint it ran under.
+
+        Returns:
+            Capsule data as dict, or None if no such run was captured.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT id FROM capsules
+                WHERE command = ? AND cwd = ? AND env_fingerprint = ?
+                ORDER BY created_at DESC LIMIT 1
+                """,
+                (command, cwd, env_fingerprint),
+            ).fetchone()
+        return self.get_capsule(row["id"]) if row else None
+
     # Decision storage (Phase 2)
 
     def store_decision(self, decision: "Decision") -> str:  # noqa: F821
@@ -927,6 +981,34 @@ class WorkbenchStore:
                     f"Link already exists: {src_type}:{src_id} --{relation}--> {dst_type}:{dst_id}"
                 )
 
+    def create_links(self, links: Iterable[Link]) -> None:
+        """Create many links with one executemany() and one COMMIT.
+
+        Args:
+            links: Link records to insert.
+
+        Raises:
+            ValueError: If any link already exists (none are inserted, also
+                inside transaction(): the batch runs under a savepoint).
+        """
+        with self._connect() as conn:
+            conn.execute("SAVEPOINT create_links")
+            try:
+                conn.executemany(
+                    """
+                    INSERT INTO links (src_id, src_type, dst_id, dst_type, relation, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (link.as_row() for link in links),
+                )
+            except sqlite3.IntegrityError:
+                # Undo the rows inserted before the duplicate without
+                # touching earlier writes of an enclosing transaction()
+                conn.execute("ROLLBACK TO create_links")
+                conn.execute("RELEASE create_links")
+                raise ValueError("One or more links already exist; none were created")
+            conn.execute("RELEASE create_links")
+
     def delete_link(
         self,
         src_id: str,
@@ -1087,7 +1169,9 @@ class WorkbenchStore:
                 edges.append(link)
                 traverse(link["src_id"], link["src_type"], current_depth + 1)
 
-        traverse(artifact_id, artifact_type, 0)
+        # Two link queries per node: share one connection across the walk
+        with self.transaction():
+            traverse(artifact_id, artifact_type, 0)
 
         # Deduplicate edges
         seen_edges: set[tuple[str, str, str]] = set()
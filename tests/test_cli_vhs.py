@@ -32,3 +32,44 @@ def test_cli_vhs_put_uses_repo_local_store(tmp_path):
     )
     assert result.returncode == 0
     assert (project_root / ".tldrs" / "tldrs_state.db").exists()
+
+
+def test_cli_vhs_ls_jsonl(tmp_path, monkeypatch, capfdbinary):
+    import argparse
+    import io
+    import json
+
+    from tldr_swinton.modules.vhs import cli as vhs_cli
+    from tldr_swinton.modules.vhs.store import Store
+
+    monkeypatch.setenv("TLDRS_VHS_HOME", str(tmp_path / "vhs"))
+    refs = [Store().put(io.BytesIO(f"payload {i}".encode())) for i in range(3)]
+
+    rc = vhs_cli.handle(argparse.Namespace(vhs_command="ls", limit=10, jsonl=True))
+
+    assert rc == 0
+    lines = capfdbinary.readouterr().out.splitlines()
+    items = [json.loads(line) for line in lines]
+    assert {f"vhs://{item['hash']}" for item in items} == set(refs)
+    assert {"size", "stored_size", "compression", "created_at"} <= set(items[0])
+
+
+def test_cli_vhs_ls_jsonl_same_bytes_without_orjson(tmp_path, monkeypatch, capfdbinary):
+    import argparse
+    import io
+
+    from tldr_swinton.modules import _json
+    from tldr_swinton.modules.vhs import cli as vhs_cli
+    from tldr_swinton.modules.vhs.store import Store
+
+    monkeypatch.setenv("TLDRS_VHS_HOME", str(tmp_path / "vhs"))
+    for i in range(3):
+        Store().put(io.BytesIO(f"payload {i}".encode()))
+    args = argparse.Namespace(vhs_command="ls", limit=10, jsonl=True)
+
+    assert vhs_cli.handle(args) == 0
+    with_default = capfdbinary.readouterr().out
+    monkeypatch.setattr(_json, "_orjson", None)
+    assert vhs_cli.handle(args) == 0
+
+    assert capfdbinary.readouterr().out == with_default
@@ -0,0 +1,143 @@
+import argparse
+import os
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from tldr_swinton.modules.workbench import capsule as capsule_mod
+from tldr_swinton.modules.workbench import cli as wb_cli
+from tldr_swinton.modules.workbench.capsule import Capsule, compute_env_fingerprint
+from tldr_swinton.modules.workbench.store import WorkbenchStore
+
+_OTHER_ENV = "000000000000"
+
+
+def _store_capsule(store, capsule_id, command, cwd, env_fingerprint):
+    store.store_capsule(
+        Capsule(
+            id=capsule_id,
+            command=command,
+            cwd=str(cwd),
+            env_fingerprint=env_fingerprint,
+            exit_code=0,
+            stdout="cached output\n",
+            stderr="",
+            started_at=datetime.now(timezone.utc),
+            duration_ms=1,
+        )
+    )
+
+
+def _replay(*wb_args):
+    return wb_cli.handle(argparse.Namespace(wb_command="replay", wb_args=list(wb_args)))
+
+
+@pytest.fixture
+def replays(tmp_path, monkeypatch):
+    """Run replays in a fresh store and record the capsules actually re-run."""
+    monkeypatch.chdir(tmp_path)
+    calls = []
+
+    def fake_replay(capsule, dry_run=False):
+        calls.append(capsule.id)
+        return Capsule(
+            id=f"new{len(calls):09d}",
+            command=capsule.command,
+            cwd=capsule.cwd,
+            env_fingerprint=compute_env_fingerprint(),
+            exit_code=0,
+            stdout="fresh output\n",
+            stderr="",
+            started_at=datetime.now(timezone.utc),
+            duration_ms=1,
+        )
+
+    monkeypatch.setattr(capsule_mod, "replay_command", fake_replay)
+    return calls
+
+
+def test_replay_cached_reuses_matching_capsule(tmp_path, replays, capsys):
+    store = WorkbenchStore()
+    _store_capsule(store, "aaaaaaaaaaaa", "make lint", tmp_path, compute_env_fingerprint())
+
+    rc = _replay("aaaaaaaaaaaa", "--cached")
+
+    assert rc == 0
+    assert replays == []
+    out = capsys.readouterr().out
+    assert "Reusing capsule:aaaaaaaaaaaa" in out
+    assert "cached output" in out
+    assert len(store.list_capsules()) == 1
+
+
+def test_replay_cached_misses_on_env_change(tmp_path, replays, capsys):
+    store = WorkbenchStore()
+    _store_capsule(store, "aaaaaaaaaaaa", "make lint", tmp_path, _OTHER_ENV)
+
+    rc = _replay("aaaaaaaaaaaa", "--cached")
+
+    assert rc == 0
+    assert replays == ["aaaaaaaaaaaa"]
+    out = capsys.readouterr().out
+    assert "Reusing capsule" not in out
+    assert "fresh output" in out
+    assert len(store.list_capsules()) == 2
+
+
+def test_replay_cached_misses_on_cwd_change(tmp_path, replays, capsys):
+    store = WorkbenchStore()
+    _store_capsule(store, "aaaaaaaaaaaa", "make lint", tmp_path / "a", _OTHER_ENV)
+    # Same command and env, but run from another directory
+    _store_capsule(store, "bbbbbbbbbbbb", "make lint", tmp_path / "b", compute_env_fingerprint())
+
+    rc = _replay("aaaaaaaaaaaa", "--cached")
+
+    assert rc == 0
+    assert replays == ["aaaaaaaaaaaa"]
+    assert "Reusing capsule" not in capsys.readouterr().out
+
+
+def test_replay_cached_refuses_dangerous_command_without_force(tmp_path, replays, capsys):
+    store = WorkbenchStore()
+    _store_capsule(store, "aaaaaaaaaaaa", "rm -rf build", tmp_path, _OTHER_ENV)
+
+    rc = _replay("aaaaaaaaaaaa", "--cached")
+
+    assert rc == 1
+    assert replays == []
+    assert "--force" in capsys.readouterr().out
+    assert len(store.list_capsules()) == 1
+
+
+def test_replay_cached_force_runs_dangerous_command(tmp_path, replays, capsys):
+    store = WorkbenchStore()
+    _store_capsule(store, "aaaaaaaaaaaa", "rm -rf build", tmp_path, _OTHER_ENV)
+
+    rc = _replay("aaaaaaaaaaaa", "--cached", "--force")
+
+    assert rc == 0
+    assert replays == ["aaaaaaaaaaaa"]
+    assert "fresh output" in capsys.readouterr().out
+    assert len(store.list_capsules()) == 2
+
+
+def test_bare_wb_prints_help(tmp_path):
+    repo_root = Path(__file__).resolve().parents[1]
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(repo_root / "src")
+
+    result = subprocess.run(
+        [sys.executable, "-m", "tldr_swinton.cli", "wb"],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        env=env,
+    )
+
+    assert result.returncode == 1
+    assert "commands:" in result.stdout
+    assert "replay" in result.stdout
+    assert "ARGS" not in result.stdout + result.stderr
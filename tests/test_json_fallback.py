@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from tldr_swinton.modules import _json
+
+orjson = pytest.importorskip("orjson")
+
+_DOC = {
+    "id": "dec-abc123",
+    "statement": "naïve → café",
+    "count": 3,
+    "ratio": 0.5,
+    "ok": True,
+    "missing": None,
+    "empty": {"list": [], "dict": {}},
+    "nested": [{"a": 1}, [1, 2]],
+    "created_at": datetime(2026, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc),
+    "naive": datetime(2026, 1, 2, 3, 4, 5),
+}
+
+
+@pytest.mark.parametrize("indent", [False, True])
+@pytest.mark.parametrize("newline", [False, True])
+def test_stdlib_fallback_matches_orjson(monkeypatch, indent, newline):
+    expected = _json.dumps(_DOC, indent=indent, newline=newline)
+    monkeypatch.setattr(_json, "_orjson", None)
+
+    assert _json.dumps(_DOC, indent=indent, newline=newline) == expected
+
+
+def test_default_only_sees_unsupported_types(monkeypatch):
+    doc = {"when": datetime(2026, 1, 2, tzinfo=timezone.utc), "path": object()}
+    expected = _json.dumps(doc, default=lambda obj: "obj")
+    monkeypatch.setattr(_json, "_orjson", None)
+
+    assert _json.dumps(doc, default=lambda obj: "obj") == expected
+    assert b'"when":"2026-01-02T00:00:00+00:00"' in expected
@@ -207,6 +207,340 @@ class TestFAISSIncrementalUpdate:
         assert stats2.updated_units == 1  # fn_b changed
         assert stats2.unchanged_units == 2  # fn_a, fn_c unchanged
 
+    def test_incremental_reuses_stored_vectors(self, tmp_path, monkeypatch):
+        from tldr_swinton.modules.semantic import faiss_backend as fb_mod
+
+        monkeypatch.setattr(fb_mod, "_get_embedder", lambda *a, **kw: _FakeEmbedder())
+
+        u1 = _make_unit("fn_a", file="a.py", line=1, file_hash="hash_a1")
+        u2 = _make_unit("fn_b", file="b.py", line=1, file_hash="hash_b1")
+        backend = fb_mod.FAISSBackend(str(tmp_path))
+        backend.build([u1, u2], ["function a", "function b"])
+        backend.save()
+        label = int(fb_mod._unit_labels([u1.id])[0])
+        original = backend._faiss_index.reconstruct(label)
+
+        # fn_a keeps its hash; its vector must be carried over verbatim even
+        # though the text passed in differs.
+        u2_changed = _make_unit("fn_b", file="b.py", line=1, file_hash="hash_b2")
+        backend2 = fb_mod.FAISSBackend(str(tmp_path))
+        backend2.build([u2_changed, u1], ["function b modified", "ignored text"])
+
+        reused = backend2._faiss_index.reconstruct(label)
+        np.testing.assert_array_equal(original, reused)
+
+    def test_file_edit_keeps_units_with_unchanged_text(self, tmp_path, monkeypatch):
+        from tldr_swinton.modules.semantic import faiss_backend as fb_mod
+
+        monkeypatch.setattr(fb_mod, "_get_embedder", lambda *a, **kw: _FakeEmbedder())
+
+        u1 = _make_unit("fn_a", file="a.py", line=1, file_hash="hash_1")
+        u2 = _make_unit("fn_b", file="a.py", line=9, file_hash="hash_1")
+        backend = fb_mod.FAISSBackend(str(tmp_path))
+        backend.build([u1, u2], ["function a", "function b"])
+        backend.save()
+
+        # Editing fn_b changes the whole file's hash; fn_a is not re-embedded
+        u1 = _make_unit("fn_a", file="a.py", line=1, file_hash="hash_2")
+        u2 = _make_unit("fn_b", file="a.py", line=9, file_hash="hash_2")
+        backend2 = fb_mod.FAISSBackend(str(tmp_path))
+        stats = backend2.build([u1, u2], ["function a", "function b v2"])
+
+        assert (stats.unchanged_units, stats.updated_units) == (1, 1)
+        assert backend2.get_unit(u1.id).file_hash == "hash_2"
+
+    def test_incremental_removes_deleted_units(self, tmp_path, monkeypatch):
+        from tldr_swinton.modules.semantic import faiss_backend as fb_mod
+
+        monkeypatch.setattr(fb_mod, "_get_embedder", lambda *a, **kw: _FakeEmbedder())
+
+        u1 = _make_unit("fn_a", file="a.py", line=1, file_hash="hash_a1")
+        u2 = _make_unit("fn_b", file="b.py", line=1, file_hash="hash_b1")
+        backend = fb_mod.FAISSBackend(str(tmp_path))
+        backend.build([u1, u2], ["function a", "function b"])
+        backend.save()
+
+        # b.py deleted: nothing to embed, but its vector must be dropped
+        backend2 = fb_mod.FAISSBackend(str(tmp_path))
+        stats = backend2.build([u1], ["function a"])
+
+        assert stats.unchanged_units == 1
+        assert backend2._faiss_index.ntotal == 1
+        results = backend2.search("function b", k=5)
+        assert [r.unit.name for r in results] == ["fn_a"]
+
+    def test_legacy_positional_index_is_migrated(self, tmp_path, monkeypatch):
+        from tldr_swinton.modules.semantic import faiss_backend as fb_mod
+
+        monkeypatch.setattr(fb_mod, "_get_embedder", lambda *a, **kw: _FakeEmbedder())
+
+        from tldr_swinton.modules.semantic.backend import get_file_hash, legacy_file_hash
+
+        # Hand-write a v1.0 index: bare IndexFlatIP, row i == units[i], with
+        # SHA-256 file hashes and no text hashes
+        (tmp_path / "a.py").write_text("def fn_a():\n    pass\n")
+        (tmp_path / "b.py").write_text("def fn_b():\n    pass\n")
+        u1 = _make_unit("fn_a", file="a.py", line=1, file_hash=legacy_file_hash(tmp_path / "a.py"))
+        u2 = _make_unit("fn_b", file="b.py", line=1, file_hash=legacy_file_hash(tmp_path / "b.py"))
+        embedder = _FakeEmbedder()
+        legacy = faiss.IndexFlatIP(EMBED_DIM)
+        legacy.add(np.vstack([embedder.embed("function a"), embedder.embed("function b")]))
+        index_dir = tmp_path / ".tldrs" / "index"
+        index_dir.mkdir(parents=True)
+        faiss.write_index(legacy, str(index_dir / "vectors.faiss"))
+        (index_dir / "units.json").write_text(json.dumps([u1.to_dict(), u2.to_dict()]))
+        (index_dir / META_FILENAME).write_text(json.dumps({"backend": "faiss", "version": "1.0"}))
+
+        old = fb_mod.FAISSBackend(str(tmp_path))
+        assert old.load() is True
+        assert old.search("function b", k=1)[0].unit.name == "fn_b"
+
+        # Re-indexed with current file hashes: unchanged files still match
+        u1 = _make_unit("fn_a", file="a.py", line=1, file_hash=get_file_hash(tmp_path / "a.py"))
+        u2 = _make_unit("fn_b", file="b.py", line=1, file_hash=get_file_hash(tmp_path / "b.py"))
+        u3 = _make_unit("fn_c", file="c.py", line=1, file_hash="hash_c1")
+        backend = fb_mod.FAISSBackend(str(tmp_path))
+        stats = backend.build([u1, u2, u3], ["function a", "function b", "function c"])
+
+        assert stats.unchanged_units == 2
+        assert stats.new_units == 1
+        assert backend._metadata.version == fb_mod._INDEX_VERSION
+        assert backend.search("function b", k=1)[0].unit.name == "fn_b"
+
+        backend.save()
+        assert backend._units_path.exists()
+        assert not (index_dir / "units.json").exists()
+
+    def test_file_hashes_from_another_scheme_are_not_trusted(self, tmp_path, monkeypatch):
+        from tldr_swinton.modules.semantic import faiss_backend as fb_mod
+        from tldr_swinton.modules.semantic.backend import FILE_HASH_SCHEME
+
+        monkeypatch.setattr(fb_mod, "_get_embedder", lambda *a, **kw: _FakeEmbedder())
+
+        u1 = _make_unit("fn_a", file="a.py", line=1, file_hash="hash_a1")
+        backend = fb_mod.FAISSBackend(str(tmp_path))
+        backend.build([u1], ["function a"])
+        backend.save()
+        meta_path = backend.index_dir / META_FILENAME
+        meta = json.loads(meta_path.read_text())
+        assert meta["file_hash_scheme"] == FILE_HASH_SCHEME
+
+        # Same stored hash, but recorded under some other scheme: the edited
+        # text must be re-embedded, and the index is restamped
+        meta["file_hash_scheme"] = "other"
+        meta_path.write_text(json.dumps(meta))
+        backend2 = fb_mod.FAISSBackend(str(tmp_path))
+        stats = backend2.build([u1], ["function a, edited"])
+
+        assert stats.updated_units == 1
+        assert backend2._metadata.file_hash_scheme == FILE_HASH_SCHEME
+
+
+@needs_faiss
+class TestFAISSSave:
+    """save() writes files atomically and round-trips through load()."""
+
+    def test_save_leaves_no_temp_files(self, tmp_path, monkeypatch):
+        from tldr_swinton.modules.semantic import faiss_backend as fb_mod
+
+        monkeypatch.setattr(fb_mod, "_get_embedder", lambda *a, **kw: _FakeEmbedder())
+
+        backend = fb_mod.FAISSBackend(str(tmp_path))
+        backend.build([_make_unit("fn_a"), _make_unit("fn_b", line=5)], ["a", "b"])
+        backend.save()
+        backend.save()  # overwrite existing files
+
+        leftovers = [p.name for p in backend.index_dir.iterdir() if ".tmp." in p.name]
+        assert leftovers == []
+
+        lines = backend._units_path.read_text().splitlines()
+        assert [json.loads(line)["name"] for line in lines] == ["fn_a", "fn_b"]
+
+        reloaded = fb_mod.FAISSBackend(str(tmp_path))
+        assert reloaded.load() is True
+        assert [u.name for u in reloaded.get_all_units()] == ["fn_a", "fn_b"]
+        assert reloaded._faiss_index.ntotal == 2
+
+
+@needs_faiss
+class TestFAISSIndexType:
+    """index_type selects the FAISS structure and survives incremental updates."""
+
+    def test_resolve_auto_by_corpus_size(self):
+        from tldr_swinton.modules.semantic import faiss_backend as fb_mod
+
+        assert fb_mod._resolve_index_type("auto", 10) == "flat"
+        assert fb_mod._resolve_index_type("auto", fb_mod._IVF_MIN_UNITS) == "ivfpq"
+        assert fb_mod._resolve_index_type("flat", 10**7) == "flat"
+        # Forcing ivfpq on a corpus too small to train PQ falls back to flat
+        assert fb_mod._resolve_index_type("ivfpq", fb_mod._PQ_MIN_TRAIN - 1) == "flat"
+        assert fb_mod._resolve_index_type("ivfpq", fb_mod._PQ_MIN_TRAIN) == "ivfpq"
+        with pytest.raises(ValueError):
+            fb_mod._resolve_index_type("hnsw", 10)
+
+    def test_new_index_specs(self):
+        from tldr_swinton.modules.semantic import faiss_backend as fb_mod
+
+        flat = fb_mod._new_index(768, 100, "flat")
+        assert isinstance(flat, faiss.IndexIDMap2) and flat.is_trained
+
+        ivf = fb_mod._new_index(768, 40_000, "ivfpq")
+        inner = faiss.extract_index_ivf(ivf)
+        assert inner.nlist == 800
+        assert faiss.downcast_index(inner).pq.M == 32
+        assert not ivf.is_trained
+
+        # PQ sub-quantizer count must divide odd dimensions
+        assert faiss.downcast_index(fb_mod._new_index(48, 20_000, "ivfpq")).pq.M == 16
+        # nlist is capped so every IVF centroid gets enough training points
+        assert faiss.extract_index_ivf(fb_mod._new_index(48, 20_000, "ivfpq")).nlist == 512
+
+    def test_ivfpq_trains_at_minimum_corpus_size(self):
+        from tldr_swinton.modules.semantic import faiss_backend as fb_mod
+
+        # The real IVF…,PQ{m}x8 spec, untouched; 2 dims keep PQ training
+        # (one 256-centroid k-means per sub-quantizer) to a few seconds
+        n = fb_mod._PQ_MIN_TRAIN
+        matrix = np.random.RandomState(0).rand(n, 2).astype(np.float32)
+        index = fb_mod._new_index(2, n, "ivfpq")
+        index.train(matrix)
+        index.add_with_ids(matrix, np.arange(n, dtype=np.int64))
+
+        assert index.is_trained and index.ntotal == n
+
+    def test_forced_ivfpq_small_corpus_builds_flat(self, tmp_path, monkeypatch):
+        from tldr_swinton.modules.semantic import faiss_backend as fb_mod
+
+        monkeypatch.setattr(fb_mod, "_get_embedder", lambda *a, **kw: _FakeEmbedder())
+        units = [_make_unit(f"fn_{i}", file=f"m{i}.py", line=1) for i in range(50)]
+        texts = [f"function number {i}" for i in range(50)]
+        backend = fb_mod.FAISSBackend(str(tmp_path), index_type="ivfpq")
+        backend.build(units, texts)
+        backend.save()
+
+        assert backend._metadata.index_type == "flat"
+        assert not backend._sentinel_path.exists()
+        assert backend.search("function number 7", k=1)[0].unit.name == "fn_7"
+
+    def test_ivf_build_incremental_and_switch(self, tmp_path, monkeypatch):
+        from tldr_swinton.modules.semantic import faiss_backend as fb_mod
+
+        monkeypatch.setattr(fb_mod, "_get_embedder", lambda *a, **kw: _FakeEmbedder())
+        # PQ training is slow on tiny CI boxes; exercise the trained-IVF path
+        # with flat lists instead.
+        monkeypatch.setattr(fb_mod, "_PQ_MIN_TRAIN", 0)
+        real_new_index = fb_mod._new_index
+        monkeypatch.setattr(
+            fb_mod, "_new_index",
+            lambda d, n, t, *q: real_new_index(d, n, t, *q) if t == "flat"
+            else faiss.index_factory(d, "IVF8,Flat", faiss.METRIC_INNER_PRODUCT),
+        )
+
+        units = [_make_unit(f"fn_{i}", file=f"m{i}.py", line=1) for i in range(400)]
+        texts = [f"function number {i}" for i in range(400)]
+        backend = fb_mod.FAISSBackend(str(tmp_path), index_type="ivfpq")
+        backend.build(units, texts)
+        backend.save()
+
+        assert backend._metadata.index_type == "ivfpq"
+        assert faiss.extract_index_ivf(backend._faiss_index).nprobe == fb_mod.DEFAULT_NPROBE
+        assert len(backend.search("function number 7", k=5)) == 5
+
+        # Incremental: one changed unit is re-added, the rest are kept
+        units[0] = _make_unit("fn_0", file="m0.py", line=1, file_hash="changed")
+        texts[0] = "function number 0, edited"
+        backend2 = fb_mod.FAISSBackend(str(tmp_path), index_type="ivfpq")
+        stats = backend2.build(units, texts)
+        assert (stats.updated_units, stats.unchanged_units) == (1, 399)
+        assert backend2._faiss_index.ntotal == 400
+
+        # Asking for a different structure rebuilds from scratch
+        backend3 = fb_mod.FAISSBackend(str(tmp_path), index_type="flat")
+        stats = backend3.build(units, texts)
+        assert stats.new_units == 400
+        assert backend3._metadata.index_type == "flat"
+
+    def test_flat_quantization_persisted_and_migrated(self, tmp_path, monkeypatch):
+        from tldr_swinton.modules.semantic import faiss_backend as fb_mod
+
+        monkeypatch.setattr(fb_mod, "_get_embedder", lambda *a, **kw: _FakeEmbedder())
+        units = [_make_unit(f"fn_{i}", file=f"m{i}.py", line=1) for i in range(50)]
+        texts = [f"function number {i}" for i in range(50)]
+
+        backend = fb_mod.FAISSBackend(str(tmp_path), quantization="none")
+        backend.build(units, texts)
+        backend.save()
+        assert backend._metadata.quantization == "none"
+
+        # Switching fp32 -> fp16 re-encodes stored vectors, no re-embedding
+        backend = fb_mod.FAISSBackend(str(tmp_path))
+        stats = backend.build(units, texts)
+        backend.save()
+        assert stats.unchanged_units == 50 and stats.new_units == 0
+        loaded = fb_mod.FAISSBackend(str(tmp_path))
+        assert loaded.load()
+        assert loaded.info().extra["quantization"] == "fp16"
+        assert loaded.search("function number 7", k=1)[0].unit.name == "fn_7"
+
+        sq8 = fb_mod.FAISSBackend(str(tmp_path), quantization="sq8")
+        sq8.build(units, texts)
+        sq8.save()
+        assert sq8._faiss_index.is_trained
+        assert sq8.search("function number 7", k=1)[0].unit.name == "fn_7"
+
+        # Leaving lossy sq8 codes re-embeds from scratch
+        stats = fb_mod.FAISSBackend(str(tmp_path), quantization="none").build(units, texts)
+        assert stats.new_units == 50
+
+
+@needs_faiss
+class TestFAISSEmbedCache:
+    """Embeddings are cached on disk by (model, text)."""
+
+    def test_rebuild_reuses_cached_embeddings(self, tmp_path, monkeypatch):
+        from tldr_swinton.modules.semantic import faiss_backend as fb_mod
+
+        embedded: list[str] = []
+
+        class _CountingEmbedder(_FakeEmbedder):
+            def embed_batch(self, texts, **kwargs):
+                embedded.extend(texts)
+                return super().embed_batch(texts)
+
+        monkeypatch.setattr(fb_mod, "_get_embedder", lambda *a, **kw: _CountingEmbedder())
+
+        units = [_make_unit("fn_a"), _make_unit("fn_b", line=5)]
+        backend = fb_mod.FAISSBackend(str(tmp_path))
+        backend.build(units, ["text a", "text b"])
+        assert embedded == ["text a", "text b"]
+
+        embedded.clear()
+        backend = fb_mod.FAISSBackend(str(tmp_path))
+        stats = backend.build(units, ["text a", "text b changed"], rebuild=True)
+
+        assert stats.new_units == 2
+        assert embedded == ["text b changed"]
+        assert backend.search("text a", k=1)[0].unit.name == "fn_a"
+
+    def test_duplicate_texts_embedded_once(self, tmp_path, monkeypatch):
+        from tldr_swinton.modules.semantic import faiss_backend as fb_mod
+
+        embedded: list[str] = []
+
+        class _CountingEmbedder(_FakeEmbedder):
+            def embed_batch(self, texts, **kwargs):
+                embedded.extend(texts)
+                return super().embed_batch(texts)
+
+        monkeypatch.setattr(fb_mod, "_get_embedder", lambda *a, **kw: _CountingEmbedder())
+
+        units = [_make_unit(f"fn_{i}", line=i) for i in range(4)]
+        backend = fb_mod.FAISSBackend(str(tmp_path))
+        backend.build(units, ["stub", "stub", "other", "stub"])
+
+        assert embedded == ["stub", "other"]
+        assert backend._faiss_index.ntotal == 4
+
 
 # ---------------------------------------------------------------------------
 # 3. ColBERTBackend load error paths
@@ -235,6 +569,42 @@ class TestColBERTLoadErrors:
         assert backend.load() is False
 
 
+class TestColBERTFileHashScheme:
+    """A file-hash scheme change rebuilds PLAID once instead of re-adding."""
+
+    def _build(self, tmp_path, monkeypatch, meta_extra):
+        import sys
+        import types
+
+        from tldr_swinton.modules.semantic.colbert_backend import ColBERTBackend
+
+        monkeypatch.setitem(sys.modules, "pylate", types.SimpleNamespace(indexes=None))
+        units = [_make_unit(f"fn_{i}", file=f"m{i}.py", line=1) for i in range(3)]
+        backend = ColBERTBackend(str(tmp_path))
+        backend.index_dir.mkdir(parents=True)
+        backend._meta_path.write_text(json.dumps({
+            "units": [u.to_dict() for u in units],
+            "hashes": {u.id: u.file_hash for u in units},
+            **meta_extra,
+        }))
+        backend._model = MagicMock()
+        backend._model.encode.side_effect = lambda texts, **kw: list(texts)
+        calls = []
+        monkeypatch.setattr(backend, "_build_fresh_index", lambda *a: calls.append("fresh"))
+        monkeypatch.setattr(backend, "_incremental_add", lambda *a: calls.append("incremental"))
+
+        backend.build(units, [f"function {i}" for i in range(3)])
+        return calls
+
+    def test_scheme_change_triggers_full_rebuild(self, tmp_path, monkeypatch):
+        assert self._build(tmp_path, monkeypatch, {}) == ["fresh"]
+
+    def test_same_scheme_unchanged_is_noop(self, tmp_path, monkeypatch):
+        from tldr_swinton.modules.semantic.backend import FILE_HASH_SCHEME
+
+        assert self._build(tmp_path, monkeypatch, {"file_hash_scheme": FILE_HASH_SCHEME}) == []
+
+
 # ---------------------------------------------------------------------------
 # 4. Backend selection via get_backend()
 # ---------------------------------------------------------------------------
@@ -505,3 +875,137 @@ class TestMakeUnitId:
     def test_length(self):
         uid = make_unit_id("file.py", "fn", 1)
         assert len(uid) == 16  # sha256[:16]
+
+
+class TestGetFileHash:
+    """get_file_hash fingerprints file content."""
+
+    def test_content_fingerprint(self, tmp_path):
+        import hashlib
+
+        from tldr_swinton.modules.semantic.backend import get_file_hash
+
+        path = tmp_path / "a.py"
+        path.write_bytes(b"x" * (3 << 20))
+        expected = hashlib.blake2b(b"x" * (3 << 20)).hexdigest()[:16]
+        assert get_file_hash(path) == expected
+        path.write_bytes(b"y")
+        assert get_file_hash(path) != expected
+
+    def test_missing_file(self, tmp_path):
+        from tldr_swinton.modules.semantic.backend import get_file_hash
+
+        assert get_file_hash(tmp_path / "missing.py") == ""
+
+
+@needs_faiss
+class TestOllamaEmbedBatch:
+    """Ollama embeddings go out in /api/embed batches over a bounded pool."""
+
+    def test_embed_batch_chunks_concurrently_and_ordered(self, monkeypatch):
+        import threading
+        import time
+
+        from tldr_swinton.modules.semantic import faiss_backend as fb_mod
+
+        active, peak = 0, 0
+        sizes = []
+        lock = threading.Lock()
+
+        def fake_post(self, path, payload, timeout=30):
+            nonlocal active, peak
+            assert path == "/api/embed"
+            with lock:
+                active += 1
+                peak = max(peak, active)
+                sizes.append(len(payload["input"]))
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return {"embeddings": [[float(t)] * 4 for t in payload["input"]]}
+
+        monkeypatch.setattr(fb_mod._OllamaEmbedder, "_post_json", fake_post)
+        monkeypatch.setattr(fb_mod, "OLLAMA_EMBED_CONCURRENCY", 3)
+        monkeypatch.setattr(fb_mod, "OLLAMA_EMBED_BATCH_SIZE", 5)
+
+        vecs = fb_mod._OllamaEmbedder().embed_batch([str(i) for i in range(23)])
+
+        assert [int(v[0]) for v in vecs] == list(range(23))
+        assert sorted(sizes) == [3, 5, 5, 5, 5]
+        assert 1 < peak <= 3
+
+    def test_falls_back_to_per_text_endpoint(self, monkeypatch):
+        from tldr_swinton.modules.semantic import faiss_backend as fb_mod
+        from tldr_swinton.modules.semantic._http import HTTPStatusError
+
+        paths = []
+
+        def fake_post(self, path, payload, timeout=30):
+            paths.append(path)
+            if path == "/api/embed":
+                raise HTTPStatusError(404, "HTTP 404 from /api/embed")
+            return {"embedding": [float(payload["prompt"])] * 4}
+
+        monkeypatch.setattr(fb_mod._OllamaEmbedder, "_post_json", fake_post)
+        embedder = fb_mod._OllamaEmbedder()
+
+        vecs = embedder.embed_batch(["1", "2"], max_workers=1)
+        vecs += embedder.embed_batch(["3"], max_workers=1)
+
+        assert [int(v[0]) for v in vecs] == [1, 2, 3]
+        assert paths == ["/api/embed"] + ["/api/embeddings"] * 3
+
+
+class TestGetEmbedderCache:
+    """Only positively selected embedders are reused across calls."""
+
+    def _patch(self, monkeypatch, ollama_up):
+        from tldr_swinton.modules.semantic import faiss_backend as fb_mod
+
+        monkeypatch.setattr(fb_mod, "_EMBEDDER_CACHE", {})
+        monkeypatch.setattr(fb_mod._OllamaEmbedder, "is_available", lambda self: ollama_up[0])
+        monkeypatch.setattr(fb_mod._SentenceTransformerEmbedder, "is_available", lambda self: True)
+        return fb_mod
+
+    def test_auto_reprobes_ollama_after_fallback(self, monkeypatch):
+        ollama_up = [False]
+        fb_mod = self._patch(monkeypatch, ollama_up)
+
+        first = fb_mod._get_embedder("auto")
+        assert isinstance(first, fb_mod._SentenceTransformerEmbedder)
+        # The fallback instance is reused (model stays loaded) while Ollama is down
+        assert fb_mod._get_embedder("auto") is first
+
+        ollama_up[0] = True
+        assert isinstance(fb_mod._get_embedder("auto"), fb_mod._OllamaEmbedder)
+
+    def test_auto_caches_selected_ollama(self, monkeypatch):
+        ollama_up = [True]
+        fb_mod = self._patch(monkeypatch, ollama_up)
+
+        first = fb_mod._get_embedder("auto")
+        ollama_up[0] = False
+        assert fb_mod._get_embedder("auto") is first
+
+
+@needs_faiss
+class TestFAISSLazyLoad:
+    """load_meta() skips vectors.faiss until a semantic search needs it."""
+
+    def test_load_meta_defers_vectors(self, tmp_path, monkeypatch):
+        from tldr_swinton.modules.semantic import faiss_backend as fb_mod
+
+        monkeypatch.setattr(fb_mod, "_get_embedder", lambda *a, **kw: _FakeEmbedder())
+        units = [_make_unit("alpha", line=1), _make_unit("beta", line=20)]
+        backend = fb_mod.FAISSBackend(str(tmp_path))
+        backend.build(units, ["alpha text", "beta text"])
+        backend.save()
+
+        lazy = fb_mod.FAISSBackend(str(tmp_path))
+        assert lazy.load_meta()
+        assert lazy._faiss_index is None
+        assert [u.name for u in lazy.get_units_by_name("beta")] == ["beta"]
+
+        results = lazy.search("alpha text", k=1)
+        assert lazy._faiss_index is not None
+        assert results[0].unit.name == "alpha"
@@ -0,0 +1,443 @@
+"""Tests for semantic index orchestration (extraction, text prep, search)."""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from tldr_swinton.modules.semantic import index as index_mod
+from tldr_swinton.modules.semantic.backend import CodeUnit, make_unit_id
+
+
+def _write_project(root: Path, n_files: int = 3) -> None:
+    for i in range(n_files):
+        (root / f"mod_{i}.py").write_text(
+            f'def func_{i}(x):\n    """Doc {i}."""\n    return x\n\n'
+            f"class Klass{i}:\n    def method(self):\n        return {i}\n"
+        )
+
+
+def _key(units):
+    return sorted((u.file, u.name, u.line, u.unit_type, u.file_hash) for u in units)
+
+
+def test_extract_code_units_serial(tmp_path):
+    _write_project(tmp_path)
+
+    units = index_mod._extract_code_units(str(tmp_path), "python")
+
+    names = {u.name for u in units}
+    assert {"func_0", "Klass0", "Klass0.method"} <= names
+    assert {u.file for u in units} == {"mod_0.py", "mod_1.py", "mod_2.py"}
+
+
+def test_extract_code_units_parallel_matches_serial(tmp_path, monkeypatch):
+    _write_project(tmp_path, n_files=6)
+
+    monkeypatch.setenv("TLDRS_INDEX_WORKERS", "1")
+    serial = index_mod._extract_code_units(str(tmp_path), "python")
+    monkeypatch.setenv("TLDRS_INDEX_WORKERS", "2")
+    parallel = index_mod._extract_code_units(str(tmp_path), "python")
+
+    assert _key(parallel) == _key(serial)
+
+
+@pytest.mark.parametrize("files,workers,expected", [
+    (40, 8, 1),
+    (1000, 8, 16),
+    (200, 4, 12),
+])
+def test_extract_chunksize_keeps_workers_busy(files, workers, expected):
+    assert index_mod._extract_chunksize(files, workers) == expected
+
+
+def test_extract_skips_files_without_definitions(tmp_path, monkeypatch):
+    from tldr_swinton.modules.core import api
+
+    _write_project(tmp_path, n_files=1)
+    (tmp_path / "__init__.py").write_text("")
+    (tmp_path / "consts.py").write_text("A = 1\nB = [2, 3]\n")
+    (tmp_path / "tiny.py").write_text("def f(): pass\n")
+
+    parsed = []
+    real_extract = api.extract_file
+    monkeypatch.setattr(api, "extract_file", lambda p: parsed.append(Path(p).name) or real_extract(p))
+    monkeypatch.setenv("TLDRS_INDEX_WORKERS", "1")
+
+    units = index_mod._extract_code_units(str(tmp_path), "python")
+
+    assert sorted(parsed) == ["mod_0.py", "tiny.py"]
+    assert "f" in {u.name for u in units}
+
+
+def test_extract_reuses_cached_file_hashes(tmp_path, monkeypatch):
+    import os
+
+    _write_project(tmp_path)
+    for path in tmp_path.glob("*.py"):
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    monkeypatch.setenv("TLDRS_INDEX_WORKERS", "1")
+
+    first = index_mod._extract_code_units(str(tmp_path), "python")
+    assert (tmp_path / ".tldrs" / "hash_cache.json").exists()
+
+    hashed = []
+    real_hash = index_mod.get_file_hash
+    monkeypatch.setattr(index_mod, "get_file_hash", lambda p: hashed.append(p.name) or real_hash(p))
+    assert _key(index_mod._extract_code_units(str(tmp_path), "python")) == _key(first)
+    assert hashed == []
+
+    changed = tmp_path / "mod_1.py"
+    changed.write_text(changed.read_text() + "\n\ndef extra():\n    pass\n")
+    os.utime(changed, ns=(2_000_000_000, 2_000_000_000))
+    units = index_mod._extract_code_units(str(tmp_path), "python")
+    assert hashed == ["mod_1.py"]
+    assert {u.file_hash for u in units if u.file == "mod_1.py"} == {real_hash(changed)}
+
+
+def test_extract_skips_unchanged_files_without_definitions(tmp_path, monkeypatch):
+    import os
+
+    _write_project(tmp_path, n_files=1)
+    (tmp_path / "consts.py").write_text("A = 1\n")
+    for path in tmp_path.glob("*.py"):
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    monkeypatch.setenv("TLDRS_INDEX_WORKERS", "1")
+    index_mod._extract_code_units(str(tmp_path), "python")
+
+    checked = []
+    real_may_define = index_mod._may_define_units
+    monkeypatch.setattr(
+        index_mod, "_may_define_units", lambda p: checked.append(p.name) or real_may_define(p)
+    )
+    units = index_mod._extract_code_units(str(tmp_path), "python")
+
+    assert checked == ["mod_0.py"]
+    assert {u.file for u in units} == {"mod_0.py"}
+
+
+@pytest.mark.parametrize("name,content,expected", [
+    ("a.ts", "export const f = (x: number) => x;\n", True),
+    ("a.ts", "export const A = 1;\n", False),
+    ("a.go", "package m\ntype S struct{}\n", True),
+    ("a.rs", "impl S {}\n", True),
+    ("a.rs", "const A: u8 = 1;\n", False),
+    ("a.txt", "anything", True),
+])
+def test_may_define_units(tmp_path, name, content, expected):
+    path = tmp_path / name
+    path.write_text(content)
+    assert index_mod._may_define_units(path) is expected
+
+
+def test_iter_code_units_is_lazy(tmp_path):
+    _write_project(tmp_path, n_files=2)
+
+    stream = index_mod._iter_code_units(str(tmp_path), "python")
+
+    assert not isinstance(stream, list)
+    first = next(stream)
+    assert first.file in {"mod_0.py", "mod_1.py"}
+    assert len(list(stream)) == 5
+
+
+class _HashEmbedder:
+    """Deterministic bag-of-words embedder for end-to-end index tests."""
+
+    model = model_name = "fake-model"
+    dim = 32
+
+    def is_available(self) -> bool:
+        return True
+
+    def embed(self, text: str):
+        import numpy as np
+
+        vec = np.zeros(self.dim, dtype=np.float32)
+        for token in text.replace("\n", " ").split():
+            vec[sum(token.encode()) % self.dim] += 1.0
+        return vec
+
+    def embed_batch(self, texts, **kwargs):
+        return [self.embed(t) for t in texts]
+
+
+@pytest.fixture
+def faiss_project(tmp_path, monkeypatch):
+    pytest.importorskip("faiss")
+    from tldr_swinton.modules.semantic import faiss_backend as fb_mod
+
+    monkeypatch.setattr(fb_mod, "_get_embedder", lambda *a, **kw: _HashEmbedder())
+    monkeypatch.setenv("TLDRS_INDEX_WORKERS", "1")
+    _write_project(tmp_path)
+    return tmp_path
+
+
+def test_build_and_search_index_end_to_end(faiss_project):
+    stats = index_mod.build_index(str(faiss_project), backend="faiss", show_progress=False)
+
+    assert (stats.total_files, stats.total_units, stats.new_units) == (3, 9, 9)
+
+    results = index_mod.search_index(str(faiss_project), "func_1", k=3)
+    assert results[0]["name"] == "func_1"
+    assert results[0]["score"] == 1.0  # identifier fast-path
+    assert len(results) == 3
+
+    again = index_mod.build_index(str(faiss_project), backend="faiss", show_progress=False)
+    assert again.unchanged_units == 9
+
+
+def test_search_index_reuses_loaded_backend_until_reindex(faiss_project):
+    index_mod.build_index(str(faiss_project), backend="faiss", show_progress=False)
+    project = faiss_project.resolve()
+
+    first = index_mod._load_search_backend(project, None)
+    assert index_mod._load_search_backend(project, None) is first
+
+    (faiss_project / "mod_9.py").write_text("def func_9():\n    return 9\n")
+    index_mod.build_index(str(faiss_project), backend="faiss", show_progress=False)
+    reloaded = index_mod._load_search_backend(project, None)
+    assert reloaded is not first
+    assert index_mod.search_index(str(faiss_project), "func_9", k=1)[0]["name"] == "func_9"
+
+
+def test_search_index_memoizes_results_per_loaded_index(faiss_project, monkeypatch):
+    index_mod.build_index(str(faiss_project), backend="faiss", show_progress=False)
+    backend = index_mod._load_search_backend(faiss_project.resolve(), None)
+    calls = []
+    real_search = backend.search
+    monkeypatch.setattr(backend, "search", lambda q, k: calls.append(q) or real_search(q, k))
+
+    first = index_mod.search_index(str(faiss_project), "does things", k=3)
+    first[0]["name"] = "mutated"
+    again = index_mod.search_index(str(faiss_project), "does things", k=3)
+    assert calls == ["does things"]
+    assert again[0]["name"] != "mutated"
+
+    index_mod.search_index(str(faiss_project), "does things", k=2)
+    assert calls == ["does things", "does things"]
+
+
+def test_identifier_search_uses_cached_name_index():
+    class _ListBackend:
+        _units = [
+            _unit("func_0"), _unit("Klass0"), _unit("Klass0.method", line=6),
+            _unit("Klass1.method", file="mod_1.py", line=6),
+        ]
+
+    backend = _ListBackend()
+    assert [u.name for u in index_mod._identifier_search(backend, "func_0")] == ["func_0"]
+    assert [u.file for u in index_mod._identifier_search(backend, "Other.method")] == [
+        "mod_0.py", "mod_1.py",
+    ]
+    assert index_mod._identifier_search(backend, "missing") == []
+    first_index = backend._name_idx
+
+    index_mod._identifier_search(backend, "func_0")
+    assert backend._name_idx is first_index
+
+    # A replaced units container (reload/rebuild) invalidates the index
+    backend._units = {u.id: u for u in backend._units[:1]}
+    assert [u.name for u in index_mod._identifier_search(backend, "func_0")] == ["func_0"]
+    assert index_mod._identifier_search(backend, "Klass0") == []
+
+
+def test_clean_doc_collapses_whitespace_and_truncates():
+    assert index_mod._clean_doc("  Does\n\tthings   here. ") == "Does things here."
+    assert index_mod._clean_doc(None) == ""
+    assert index_mod._clean_doc("") == ""
+    long = index_mod._clean_doc("x" * (index_mod._MAX_DOC_CHARS + 10))
+    assert long == "x" * index_mod._MAX_DOC_CHARS + "…"
+
+
+@pytest.mark.parametrize("path,expected", [
+    ("a.py", "a.py"),
+    ("src/a.py", "src/a.py"),
+    ("pkg/sub/a.py", "pkg/sub/a.py"),
+    ("src/pkg/sub/mod/a.py", "sub/mod/a.py"),
+    ("src\\pkg\\sub\\a.py", "pkg/sub/a.py"),
+])
+def test_short_path(path, expected):
+    assert index_mod._short_path(path) == expected
+
+
+def test_build_embed_text_layout():
+    unit = _unit("func_0", file="src/pkg/sub/mod/a.py")
+    assert index_mod._build_embed_text(unit) == (
+        "Language: python\nKind: function\nName: func_0\n"
+        "Signature: def func_0(x)\nFile: sub/mod/a.py"
+    )
+    unit.summary = "  Adds\n one. "
+    assert index_mod._build_embed_text(unit) == (
+        "Language: python\nKind: function\nName: func_0\n"
+        "Signature: def func_0(x)\nDoc: Adds one.\nFile: sub/mod/a.py"
+    )
+
+
+class _FakeOllama(BaseHTTPRequestHandler):
+    """Minimal /api/tags + /api/generate + /api/embed server that records requests."""
+
+    protocol_version = "HTTP/1.1"
+    requests: list[dict] = []
+    peers: set = set()
+
+    def _reply(self, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        type(self).peers.add(self.client_address)
+        self._reply({"models": [{"name": index_mod.OLLAMA_SUMMARY_MODEL}]})
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        type(self).peers.add(self.client_address)
+        type(self).requests.append(body)
+        if self.path == "/api/embed":
+            self._reply({"embeddings": [[float(len(t))] * 4 for t in body["input"]]})
+            return
+        if "prompt" not in body:  # model warm-up (load only)
+            self._reply({"response": "", "done": True})
+            return
+        name = body["prompt"].split("def ", 1)[-1].split("(", 1)[0]
+        self._reply({"response": f"Does {name} things. Extra sentence."})
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_ollama(monkeypatch):
+    _FakeOllama.requests = []
+    _FakeOllama.peers = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeOllama)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(index_mod, "OLLAMA_HOST", f"http://127.0.0.1:{server.server_port}")
+    yield _FakeOllama
+    server.shutdown()
+    server.server_close()
+
+
+def _unit(name: str, file: str = "mod_0.py", line: int = 1) -> CodeUnit:
+    return CodeUnit(
+        id=make_unit_id(file, name, line), name=name, file=file, line=line,
+        unit_type="function", signature=f"def {name}(x)", language="python",
+    )
+
+
+def test_generate_summaries_ollama(tmp_path, fake_ollama):
+    _write_project(tmp_path, n_files=2)
+    units = [_unit("func_0"), _unit("func_1", file="mod_1.py"), _unit("gone", file="missing.py")]
+
+    summaries = index_mod._generate_summaries_ollama(units, str(tmp_path), show_progress=False)
+
+    assert summaries == {
+        units[0].id: "Does func_0 things.",
+        units[1].id: "Does func_1 things.",
+    }
+    warmup, *generate = fake_ollama.requests
+    assert "prompt" not in warmup and warmup["keep_alive"] == index_mod._SUMMARY_KEEP_ALIVE
+    assert len(generate) == 2
+    assert all(r["keep_alive"] == index_mod._SUMMARY_KEEP_ALIVE for r in generate)
+
+
+def test_generate_summaries_reuses_short_docstrings(tmp_path, fake_ollama):
+    _write_project(tmp_path, n_files=2)
+    documented = _unit("func_0")
+    documented.summary = "  Return the frobnicated input value.  "
+    terse = _unit("func_1", file="mod_1.py")
+    terse.summary = "Frob."
+
+    summaries = index_mod._generate_summaries_ollama([documented, terse], str(tmp_path), show_progress=False)
+
+    assert summaries == {
+        documented.id: "Return the frobnicated input value.",
+        terse.id: "Does func_1 things.",
+    }
+    assert len([r for r in fake_ollama.requests if "prompt" in r]) == 1
+
+
+def test_generate_summaries_skips_ollama_when_all_documented(tmp_path, fake_ollama):
+    unit = _unit("func_0")
+    unit.summary = "Return the frobnicated input value."
+
+    summaries = index_mod._generate_summaries_ollama([unit], str(tmp_path), show_progress=False)
+
+    assert summaries == {unit.id: "Return the frobnicated input value."}
+    assert fake_ollama.requests == []
+
+
+def test_generate_summaries_reads_each_file_once(tmp_path, fake_ollama, monkeypatch):
+    _write_project(tmp_path, n_files=1)
+    units = [_unit("func_0"), _unit("Klass0", line=5), _unit("Klass0.method", line=6)]
+    reads = []
+    real_read_text = Path.read_text
+    monkeypatch.setattr(
+        Path, "read_text", lambda self, *a, **kw: reads.append(self.name) or real_read_text(self, *a, **kw)
+    )
+
+    summaries = index_mod._generate_summaries_ollama(units, str(tmp_path), show_progress=False)
+
+    assert len(summaries) == 3
+    assert reads == ["mod_0.py"]
+
+
+def test_build_index_with_summaries_builds_texts_once(faiss_project, fake_ollama, monkeypatch):
+    built = []
+    real_build_text = index_mod._build_embed_text
+    monkeypatch.setattr(
+        index_mod, "_build_embed_text", lambda u: built.append(u.name) or real_build_text(u)
+    )
+
+    stats = index_mod.build_index(
+        str(faiss_project), backend="faiss", generate_summaries=True, show_progress=False,
+    )
+
+    assert stats.total_units == 9
+    assert len(built) == 9
+
+
+def test_summary_concurrency_env_override(monkeypatch):
+    monkeypatch.delenv("OLLAMA_SUMMARY_CONCURRENCY", raising=False)
+    assert index_mod._summary_concurrency() == index_mod._SUMMARY_CONCURRENCY
+    monkeypatch.setenv("OLLAMA_SUMMARY_CONCURRENCY", "16")
+    assert index_mod._summary_concurrency() == 16
+    monkeypatch.setenv("OLLAMA_SUMMARY_CONCURRENCY", "lots")
+    assert index_mod._summary_concurrency() == index_mod._SUMMARY_CONCURRENCY
+
+
+def test_keep_alive_client_reuses_connection(fake_ollama):
+    from tldr_swinton.modules.semantic._http import KeepAliveClient
+
+    client = KeepAliveClient(index_mod.OLLAMA_HOST)
+    try:
+        client.request_json("GET", "/api/tags")
+        for name in ("a", "b"):
+            data = client.request_json("POST", "/api/generate", json.dumps({"prompt": f"def {name}("}).encode())
+            assert data["response"].startswith(f"Does {name}")
+    finally:
+        client.close()
+
+    assert len(fake_ollama.peers) == 1
+
+
+def test_ollama_embedder_reuses_connection(fake_ollama):
+    pytest.importorskip("numpy")
+    from tldr_swinton.modules.semantic.faiss_backend import _OllamaEmbedder
+
+    embedder = _OllamaEmbedder(model=index_mod.OLLAMA_SUMMARY_MODEL, host=index_mod.OLLAMA_HOST)
+    assert embedder.is_available()
+    vecs = embedder.embed_batch(["a", "bb"], max_workers=1)
+    vecs += embedder.embed_batch(["ccc"], max_workers=1)
+
+    assert [float(v[0]) for v in vecs] == [1.0, 2.0, 3.0]
+    assert len(fake_ollama.peers) == 1
@@ -7,3 +7,21 @@ def test_vhs_store_defaults_repo_local(tmp_path, monkeypatch):
     assert store.root == (tmp_path / ".tldrs").resolve()
     assert store.db_path == store.root / "tldrs_state.db"
     assert store.blob_root == store.root / "blobs"
+
+
+def test_vhs_store_compressed_put_round_trips(tmp_path):
+    import io
+
+    store = Store(tmp_path / "vhs")
+    payload = b"log line\n" * 10000
+    plain = store.put(io.BytesIO(payload))
+    store.delete(plain)
+    ref = store.put(io.BytesIO(payload), compress=True)
+    info = store.info(ref)
+
+    assert ref == plain
+    assert info.compression == "zlib"
+    assert info.stored_size < info.size == len(payload)
+    out = tmp_path / "out.bin"
+    store.get(ref, out)
+    assert out.read_bytes() == payload
@@ -0,0 +1,16 @@
+from tldr_swinton.modules.workbench.capsule import compute_env_fingerprint
+
+
+def test_env_fingerprint_is_pinned():
+    # replay --cached matches stored fingerprints across runs: changing the
+    # hash or the content layout silently invalidates every recorded capsule.
+    env = {"PATH": "/usr/bin:/bin", "HOME": "/home/dev", "LANG": "C.UTF-8"}
+
+    assert compute_env_fingerprint(env) == "ab500d0d62ec"
+
+
+def test_env_fingerprint_ignores_vars_outside_allowlist():
+    env = {"PATH": "/usr/bin:/bin", "HOME": "/home/dev", "LANG": "C.UTF-8"}
+
+    assert compute_env_fingerprint({**env, "SECRET_TOKEN": "x"}) == compute_env_fingerprint(env)
+    assert compute_env_fingerprint({**env, "PATH": "/opt/bin"}) != compute_env_fingerprint(env)
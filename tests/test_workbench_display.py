@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from tldr_swinton.modules.workbench import display
+
+_NOW = datetime(2026, 1, 2, 12, 0, tzinfo=timezone.utc)
+_FIVE_MIN_AGO = _NOW - timedelta(minutes=5)
+
+
+@pytest.fixture(autouse=True)
+def _no_color():
+    display.enable_color(False)
+    yield
+    display.enable_color(None)
+
+
+@pytest.mark.parametrize(
+    "ts",
+    [
+        _FIVE_MIN_AGO.isoformat(),  # as the store returns it
+        _FIVE_MIN_AGO.replace(tzinfo=None).isoformat(),  # naive string is UTC
+        _FIVE_MIN_AGO,
+        _FIVE_MIN_AGO.replace(tzinfo=None),  # naive datetime is UTC
+    ],
+)
+def test_format_timestamp_accepts_str_and_datetime(ts):
+    assert display.format_timestamp(ts, _NOW) == "5m ago"
+
+
+@pytest.mark.parametrize("ts", [_FIVE_MIN_AGO.isoformat(), _FIVE_MIN_AGO])
+def test_row_formatters_accept_str_and_datetime(ts):
+    rows = [
+        display.format_capsule_row(
+            {"id": "abc123", "exit_code": 0, "duration_ms": 5, "started_at": ts, "command": "make"},
+            _NOW,
+        ),
+        display.format_decision_row({"id": "dec-abc123", "created_at": ts, "statement": "x"}, _NOW),
+        display.format_hypothesis_row(
+            {"id": "hyp-abc123", "status": "open", "created_at": ts, "statement": "x"}, _NOW
+        ),
+        display.format_link_row(
+            {
+                "src_type": "capsule",
+                "src_id": "abc123",
+                "dst_type": "decision",
+                "dst_id": "dec-abc123",
+                "relation": "evidence",
+                "created_at": ts,
+            },
+            _NOW,
+        ),
+        display.format_timeline_row(
+            {"id": "abc123", "type": "note", "summary": "x", "created_at": ts, "data": {}}, _NOW
+        ),
+    ]
+
+    for row in rows:
+        assert "5m ago" in row
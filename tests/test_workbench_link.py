@@ -0,0 +1,56 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from tldr_swinton.modules.workbench.hypothesis import Hypothesis
+from tldr_swinton.modules.workbench.link import ArtifactType, Link, parse_artifact_id
+
+
+@pytest.mark.parametrize(
+    ("ref", "expected"),
+    [
+        ("capsule:abc123", ("abc123", ArtifactType.CAPSULE)),
+        ("decision:dec-abc123", ("dec-abc123", ArtifactType.DECISION)),
+        ("hypothesis:hyp-abc123", ("hyp-abc123", ArtifactType.HYPOTHESIS)),
+        ("symbol:api.py:validate", ("api.py:validate", ArtifactType.SYMBOL)),
+        ("patch:3096bee", ("3096bee", ArtifactType.PATCH)),
+        ("task:bd-42", ("bd-42", ArtifactType.TASK)),
+        ("capsule:", ("", ArtifactType.CAPSULE)),
+        ("dec-abc123", ("dec-abc123", ArtifactType.DECISION)),
+        ("hyp-abc123", ("hyp-abc123", ArtifactType.HYPOTHESIS)),
+        ("bd-42", ("bd-42", ArtifactType.TASK)),
+        ("dec-abc123:x", ("dec-abc123:x", ArtifactType.DECISION)),
+        ("src/x.py:fn", ("src/x.py:fn", ArtifactType.SYMBOL)),
+        ("x.py:fn", ("x.py:fn", ArtifactType.CAPSULE)),  # no '/' before ':'
+        ("unknown:abc", ("unknown:abc", ArtifactType.CAPSULE)),
+        ("abc123", ("abc123", ArtifactType.CAPSULE)),
+    ],
+)
+def test_parse_artifact_id(ref, expected):
+    assert parse_artifact_id(ref) == expected
+
+
+def test_links_differing_only_in_created_at_are_equal():
+    first = Link.create("abc123", "capsule", "dec-abc123", "decision", "evidence",
+                        now=datetime(2026, 1, 1, tzinfo=timezone.utc))
+    later = Link.create("abc123", "capsule", "dec-abc123", "decision", "evidence",
+                        now=datetime(2026, 6, 1, tzinfo=timezone.utc))
+    other = Link.create("abc123", "capsule", "dec-abc123", "decision", "refs",
+                        now=datetime(2026, 1, 1, tzinfo=timezone.utc))
+
+    assert first == later
+    assert hash(first) == hash(later)
+    assert first != other
+    assert {first, later, other} == {first, other}
+    # Equality survives the store round trip
+    assert Link.from_dict(first.to_dict()) == first
+    assert hash(Link.from_dict(first.to_dict())) == hash(first)
+
+
+def test_hypothesis_hash_is_stable_across_status_changes():
+    hypothesis = Hypothesis.create("cache misses dominate")
+    before = hash(hypothesis)
+    hypothesis.confirm()
+
+    assert hash(hypothesis) == before
+    assert hypothesis in {hypothesis}
@@ -0,0 +1,116 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from tldr_swinton.modules.workbench.link import Link
+from tldr_swinton.modules.workbench.store import WorkbenchStore
+
+
+def _link(store: WorkbenchStore, src: str) -> None:
+    store.create_link(src, "capsule", "dec-abc123", "decision", "evidence")
+
+
+def _link_srcs(store: WorkbenchStore) -> set[str]:
+    return {row["src_id"] for row in store.get_all_links()}
+
+
+def test_transaction_rolls_back_every_write_on_error(tmp_path):
+    store = WorkbenchStore(tmp_path)
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            _link(store, "a")
+            _link(store, "b")
+            raise RuntimeError("boom")
+
+    assert _link_srcs(store) == set()
+
+
+def test_nested_transaction_joins_outer_commit(tmp_path):
+    store = WorkbenchStore(tmp_path)
+    observer = WorkbenchStore(tmp_path)  # separate connection
+
+    with store.transaction():
+        _link(store, "outer")
+        with store.transaction():
+            _link(store, "inner")
+        # Leaving the inner block must not commit
+        assert _link_srcs(observer) == set()
+
+    assert _link_srcs(observer) == {"outer", "inner"}
+
+
+def test_outer_rollback_discards_completed_inner_block(tmp_path):
+    store = WorkbenchStore(tmp_path)
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            with store.transaction():
+                _link(store, "inner")
+            raise RuntimeError("boom")
+
+    assert _link_srcs(store) == set()
+
+
+def test_transaction_connection_reset_after_error(tmp_path):
+    store = WorkbenchStore(tmp_path)
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            _link(store, "a")
+            raise RuntimeError("boom")
+
+    assert store._txn_conn is None
+    # Later writes use their own connection and commit immediately
+    _link(store, "b")
+    assert _link_srcs(WorkbenchStore(tmp_path)) == {"b"}
+
+
+def _links(*srcs: str) -> list[Link]:
+    now = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    return [Link.create(src, "capsule", "dec-abc123", "decision", "evidence", now=now) for src in srcs]
+
+
+def test_create_links_round_trips_as_row(tmp_path):
+    store = WorkbenchStore(tmp_path)
+    links = _links("a", "b")
+
+    store.create_links(links)
+
+    rows = sorted(store.get_all_links(), key=lambda row: row["src_id"])
+    assert [Link.from_dict(row).as_row() for row in rows] == [link.as_row() for link in links]
+
+
+def test_create_links_duplicate_inserts_nothing(tmp_path):
+    store = WorkbenchStore(tmp_path)
+    _link(store, "b")
+
+    with pytest.raises(ValueError):
+        store.create_links(_links("a", "b", "c"))
+
+    assert _link_srcs(store) == {"b"}
+
+
+def test_create_links_duplicate_inside_transaction_inserts_nothing(tmp_path):
+    store = WorkbenchStore(tmp_path)
+    _link(store, "b")
+
+    with store.transaction():
+        _link(store, "before")
+        with pytest.raises(ValueError):
+            store.create_links(_links("a", "b", "c"))
+        _link(store, "after")
+
+    # The failed batch is undone; the transaction's other writes still commit
+    assert _link_srcs(WorkbenchStore(tmp_path)) == {"b", "before", "after"}
+
+
+def test_create_links_inside_transaction_rolls_back_with_it(tmp_path):
+    store = WorkbenchStore(tmp_path)
+
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            store.create_links(_links("a"))  # first write: the savepoint is nested
+            raise RuntimeError("boom")
+
+    assert _link_srcs(store) == set()